@@ -3,6 +3,7 @@
 """
 from pydantic_settings import BaseSettings
 from pathlib import Path
+from typing import Dict
 
 
 class Settings(BaseSettings):
@@ -14,10 +15,61 @@ class Settings(BaseSettings):
     # 캐시 설정
     cache_dir: Path = Path("./data/cache")
     cache_expiry_days: int = 30
+    # 데이터가 없다는 결과(공시 전 등)의 캐시 유효 기간 (시간)
+    negative_cache_hours: float = 6.0
+    
+    # 회사 검색(resolve) 결과 메모리 캐시 최대 항목 수
+    resolve_cache_size: int = 10000
+    
+    # corpCode 갱신 시 삭제가 현재 회사 수의 이 비율을 넘으면 잘린 다운로드로 보고 반영하지 않음
+    corp_refresh_max_delete_ratio: float = 0.05
     
     # Rate Limiting
     rate_limit_per_second: int = 5
     
+    # fs_div=AUTO: CFS 응답을 기다렸다가 OFS 를 추측 요청하기까지의 대기 시간 (초)
+    fs_auto_hedge_delay: float = 0.3
+    
+    # EBITDA 시계열(/ebitda/series) 요청 하나의 동시 보고서 조회 수
+    series_concurrency: int = 4
+    
+    # EBITDA 일괄 계산(/ebitda/batch) 동시 처리 항목 수
+    batch_concurrency: int = 8
+    
+    # 작업(Job) 큐: 작업자 수, 작업 하나의 상세 계산 동시 처리 수,
+    # 일시적 에러로 남은 항목을 다시 처리하기까지 대기 시간 (초)
+    job_workers: int = 2
+    job_concurrency: int = 4
+    job_retry_seconds: float = 60.0
+    
+    # 전체 상장사 EBITDA 내보내기: 동시 계산 회사 수, 한 번에 기록할 행 수 (CSV 조각 / Parquet 행 그룹)
+    export_concurrency: int = 8
+    export_chunk_rows: int = 500
+    
+    # HTTP 캐시 (Cache-Control max-age, 초): 진행 중인 기간 / 지난 사업연도 사업보고서
+    http_cache_max_age: int = 600
+    http_cache_max_age_settled: int = 86400
+    
+    # 계산 결과(직렬화된 응답) 메모리 캐시 최대 항목 수
+    response_cache_size: int = 5000
+    
+    # 수락 제어: OPENDART 호출 대기열의 예상 대기 시간이 이 값(초)을 넘으면 일반 요청을 429 로 거절
+    admission_max_wait: float = 3.0
+    
+    # 소비자(API 키) 공정 큐: X-API-Key → 소비자 이름 (등록되지 않은 키는 anonymous),
+    # 소비자별 가중치 (기본 1), 소비자별/기본 분당 OPENDART 호출 할당량 (0 이면 제한 없음)
+    api_keys: Dict[str, str] = {}
+    consumer_weights: Dict[str, float] = {}
+    consumer_quotas: Dict[str, int] = {}
+    consumer_quota_per_minute: int = 0
+    
+    # 요청 처리 제한 시간 (초): 기본값 / X-Request-Timeout 헤더로 지정할 수 있는 최대값
+    request_timeout: float = 10.0
+    request_timeout_max: float = 60.0
+    
+    # 대용량 다운로드 (corpCode.xml) 스트리밍 청크 크기 (바이트)
+    download_chunk_size: int = 64 * 1024
+    
     # 로깅
     log_level: str = "INFO"
     
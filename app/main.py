@@ -3,13 +3,13 @@ FastAPI 메인 애플리케이션
 """
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
-from app.routers import ebitda
+from app.routers import ebitda, companies, jobs, export
 from app.services.dart_client import dart_client
+from app.services.jobs import job_manager
 from app.utils.cache import cache_manager
+from app.utils.serialization import ORJSONUTF8Response
 from app.config import settings
-import json
 
 
 @asynccontextmanager
@@ -24,6 +24,10 @@ async def lifespan(app: FastAPI):
     await cache_manager.initialize()
     print("캐시 시스템 초기화 완료")
     
+    # 작업자 시작 (끝나지 않은 작업 재개)
+    await job_manager.start()
+    print("작업 큐 시작 완료")
+    
     # corp_code 매핑 사전 로드 (선택사항)
     # await corp_resolver.load_mapping()
     
@@ -31,6 +35,7 @@ async def lifespan(app: FastAPI):
     
     # 종료 시
     print("\n애플리케이션 종료 중...")
+    await job_manager.stop()
     await dart_client.close()
     print("DART API 클라이언트 종료 완료")
 
@@ -62,7 +67,9 @@ app = FastAPI(
         "name": "MIT License",
         "url": "https://opensource.org/licenses/MIT"
     },
-    lifespan=lifespan
+    lifespan=lifespan,
+    # 기본 응답 클래스 (orjson, 한글 그대로 UTF-8 출력)
+    default_response_class=ORJSONUTF8Response
 )
 
 # CORS 미들웨어 설정
@@ -74,22 +81,11 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# 한글 인코딩을 위한 JSONResponse 커스텀
-class UTF8JSONResponse(JSONResponse):
-    def render(self, content) -> bytes:
-        return json.dumps(
-            content,
-            ensure_ascii=False,
-            allow_nan=False,
-            indent=None,
-            separators=(",", ":"),
-        ).encode("utf-8")
-
-# 기본 응답 클래스 설정
-app.default_response_class = UTF8JSONResponse
-
 # 라우터 등록
 app.include_router(ebitda.router)
+app.include_router(companies.router)
+app.include_router(jobs.router)
+app.include_router(export.router)
 
 
 @app.get("/", tags=["Root"])
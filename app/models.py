@@ -2,7 +2,7 @@
 API 요청/응답 데이터 모델
 """
 from pydantic import BaseModel, Field
-from typing import Optional, List
+from typing import Any, Dict, Optional, List, NamedTuple
 from datetime import datetime
 
 
@@ -18,8 +18,12 @@ class PeriodInfo(BaseModel):
     year: int = Field(..., description="사업연도")
     report_code: str = Field(..., description="보고서 코드")
     report_name: str = Field(..., description="보고서명")
-    fs_div: str = Field(..., description="재무제표 구분 (CFS/OFS)")
+    fs_div: str = Field(..., description="재무제표 구분 (CFS/OFS, 실제 사용한 구분)")
     fs_name: str = Field(..., description="재무제표명")
+    requested_fs_div: Optional[str] = Field(
+        None,
+        description="요청한 재무제표 구분 (AUTO 요청 시 fs_div 가 자동 선택된 구분)"
+    )
 
 
 class ComponentAmount(BaseModel):
@@ -27,6 +31,13 @@ class ComponentAmount(BaseModel):
     label: str = Field(..., description="계정명")
     amount: float = Field(..., description="금액")
     currency: str = Field(default="KRW", description="통화")
+    matched_by: Optional[str] = Field(
+        None,
+        description=(
+            "계정 매칭 방식 (account_id: 표준 계정 ID, keyword: 계정명 키워드, "
+            "included_in_depreciation: 감가상각비 통합 계정에 포함되어 0으로 표시)"
+        )
+    )
 
 
 class EBITDAComponents(BaseModel):
@@ -43,6 +54,18 @@ class EBITDAResult(BaseModel):
     basis: str = Field(..., description="계산 기준 (당기금액/누적금액)")
 
 
+class PriorPeriodEBITDA(BaseModel):
+    """과거 기간 EBITDA (같은 보고서의 전기/전전기 금액으로 계산)"""
+    year: int = Field(..., description="사업연도")
+    label: str = Field(..., description="기간 구분 (전기/전전기)")
+    operating_income: float = Field(..., description="영업이익")
+    depreciation: float = Field(..., description="감가상각비")
+    amortization: float = Field(..., description="무형자산상각비")
+    total: float = Field(..., description="총 EBITDA")
+    currency: str = Field(default="KRW", description="통화")
+    basis: str = Field(..., description="계산 기준 (당기금액/누적금액)")
+
+
 class SourceInfo(BaseModel):
     """데이터 출처 정보"""
     rcept_no: Optional[str] = Field(None, description="접수번호")
@@ -56,15 +79,241 @@ class EBITDAResponse(BaseModel):
     period: PeriodInfo = Field(..., description="보고서 기간")
     components: EBITDAComponents = Field(..., description="EBITDA 구성요소")
     ebitda: EBITDAResult = Field(..., description="EBITDA 계산 결과")
+    prior_periods: List[PriorPeriodEBITDA] = Field(
+        default_factory=list,
+        description="전기/전전기 EBITDA (응답에 금액이 있는 기간만)"
+    )
     source: SourceInfo = Field(..., description="데이터 출처")
     warnings: List[str] = Field(default_factory=list, description="경고 메시지")
 
 
+class EBITDASeriesPoint(BaseModel):
+    """EBITDA 시계열 항목"""
+    year: int = Field(..., description="사업연도")
+    report_code: str = Field(..., description="보고서 코드")
+    report_name: str = Field(..., description="보고서명")
+    fs_div: Optional[str] = Field(None, description="재무제표 구분 (CFS/OFS)")
+    operating_income: float = Field(..., description="영업이익")
+    depreciation: float = Field(..., description="감가상각비")
+    amortization: float = Field(..., description="무형자산상각비")
+    total: float = Field(..., description="총 EBITDA")
+    currency: str = Field(default="KRW", description="통화")
+    basis: str = Field(..., description="계산 기준 (당기금액/누적금액)")
+    source_year: int = Field(..., description="금액을 가져온 보고서의 사업연도")
+    source_period: str = Field(..., description="해당 보고서에서의 기간 구분 (당기/전기/전전기)")
+    rcept_no: Optional[str] = Field(None, description="접수번호")
+    cached: bool = Field(default=False, description="캐시 사용 여부")
+
+
+class EBITDASeriesMissing(BaseModel):
+    """EBITDA 시계열 누락 항목"""
+    year: int = Field(..., description="사업연도")
+    report_code: str = Field(..., description="보고서 코드")
+    error: str = Field(..., description="에러 코드")
+    message: str = Field(..., description="에러 메시지")
+
+
+class EBITDASeriesResponse(BaseModel):
+    """EBITDA 시계열 API 응답"""
+    company: CompanyInfo = Field(..., description="회사 정보")
+    from_year: int = Field(..., description="시작 사업연도")
+    to_year: int = Field(..., description="종료 사업연도")
+    reports: List[str] = Field(..., description="보고서 코드 목록")
+    points: List[EBITDASeriesPoint] = Field(default_factory=list, description="연도/보고서 순 시계열")
+    missing: List[EBITDASeriesMissing] = Field(default_factory=list, description="조회하지 못한 항목")
+    upstream_fetches: int = Field(..., description="OPENDART 호출이 필요했던 보고서 수")
+    cached_fetches: int = Field(..., description="캐시로 처리한 보고서 수")
+
+
+class PeriodEBITDAAmounts(BaseModel):
+    """기간 EBITDA 금액 (누적 보고서 차감 결과)"""
+    operating_income: float = Field(..., description="영업이익")
+    depreciation: float = Field(..., description="감가상각비")
+    amortization: float = Field(..., description="무형자산상각비")
+    total: float = Field(..., description="총 EBITDA")
+
+
+class QuarterSource(BaseModel):
+    """분기 EBITDA 계산에 사용한 보고서"""
+    year: int = Field(..., description="사업연도")
+    report_code: str = Field(..., description="보고서 코드")
+    rcept_no: Optional[str] = Field(None, description="접수번호")
+
+
+class QuarterEBITDAResponse(BaseModel):
+    """분기/TTM EBITDA API 응답"""
+    company: CompanyInfo = Field(..., description="회사 정보")
+    year: int = Field(..., description="사업연도")
+    quarter: int = Field(..., description="분기 (1~4)")
+    fs_div: Optional[str] = Field(None, description="재무제표 구분 (CFS/OFS)")
+    currency: str = Field(default="KRW", description="통화")
+    quarter_ebitda: Optional[PeriodEBITDAAmounts] = Field(None, description="단일 분기 EBITDA")
+    ttm_ebitda: Optional[PeriodEBITDAAmounts] = Field(None, description="최근 4분기(TTM) EBITDA")
+    sources: List[QuarterSource] = Field(default_factory=list, description="사용한 보고서")
+    cached: bool = Field(default=False, description="계산 결과 캐시 사용 여부")
+    warnings: List[str] = Field(default_factory=list, description="경고 메시지")
+
+
+class CompanySuggestResponse(BaseModel):
+    """회사명 자동완성 응답"""
+    query: str = Field(..., description="검색어")
+    items: List[CompanyInfo] = Field(default_factory=list, description="후보 회사 목록")
+
+
+class CompanyResolveRequest(BaseModel):
+    """회사 일괄 변환 요청"""
+    queries: List[str] = Field(
+        ...,
+        min_length=1,
+        max_length=10000,
+        description="회사명 또는 종목코드 목록 (최대 10,000건)"
+    )
+
+
+class CompanyResolveError(BaseModel):
+    """회사 일괄 변환 항목 에러"""
+    error: str = Field(..., description="에러 코드")
+    message: str = Field(..., description="에러 메시지")
+    suggestions: List[CompanyInfo] = Field(default_factory=list, description="비슷한 회사 후보")
+
+
+class CompanyResolveItem(BaseModel):
+    """회사 일괄 변환 항목 결과"""
+    query: str = Field(..., description="입력 검색어")
+    company: Optional[CompanyInfo] = Field(None, description="변환된 회사 정보")
+    error: Optional[CompanyResolveError] = Field(None, description="에러 (찾지 못한 경우)")
+
+
+class CompanyResolveResponse(BaseModel):
+    """회사 일괄 변환 응답"""
+    total: int = Field(..., description="전체 건수")
+    resolved: int = Field(..., description="변환 성공 건수")
+    not_found: int = Field(..., description="찾지 못한 건수")
+    items: List[CompanyResolveItem] = Field(..., description="입력 순서와 동일한 결과 목록")
+
+
 class ErrorResponse(BaseModel):
     """에러 응답"""
     error: str = Field(..., description="에러 코드")
     message: str = Field(..., description="에러 메시지")
     detail: Optional[str] = Field(None, description="상세 설명")
+    suggestions: Optional[List[CompanyInfo]] = Field(
+        None, description="비슷한 회사 후보 (회사를 찾지 못한 경우)"
+    )
+
+
+class EBITDABatchItem(BaseModel):
+    """EBITDA 일괄 계산 요청 항목"""
+    company: str = Field(..., description="회사명 또는 종목코드")
+    year: int = Field(..., ge=2015, le=2030, description="사업연도")
+    report_code: str = Field(
+        ...,
+        pattern="^(11011|11012|11013|11014)$",
+        description="보고서 코드"
+    )
+    fs_div: str = Field(
+        default="CFS",
+        pattern="^(CFS|OFS|AUTO)$",
+        description="재무제표 구분 (CFS: 연결, OFS: 개별, AUTO: 연결 우선)"
+    )
+
+
+class EBITDABatchRequest(BaseModel):
+    """EBITDA 일괄 계산 요청"""
+    items: List[EBITDABatchItem] = Field(
+        ...,
+        min_length=1,
+        max_length=5000,
+        description="계산할 항목 목록 (최대 5,000건)"
+    )
+
+
+class EBITDABatchResult(BaseModel):
+    """EBITDA 일괄 계산 결과 (NDJSON 한 줄)"""
+    index: int = Field(..., description="요청 항목 순번 (0부터)")
+    company: str = Field(..., description="요청한 회사명 또는 종목코드")
+    year: int = Field(..., description="사업연도")
+    report_code: str = Field(..., description="보고서 코드")
+    fs_div: str = Field(..., description="요청한 재무제표 구분")
+    result: Optional[EBITDAResponse] = Field(None, description="계산 결과 (성공한 경우)")
+    error: Optional[ErrorResponse] = Field(None, description="에러 (실패한 경우)")
+
+
+class JobCreateRequest(BaseModel):
+    """스크리닝 작업 등록 요청"""
+    companies: Optional[List[str]] = Field(
+        None,
+        max_length=10000,
+        description="회사명 또는 종목코드 목록 (생략하면 전체 상장사)"
+    )
+    year: int = Field(..., ge=2015, le=2030, description="사업연도")
+    report_code: str = Field(
+        ...,
+        pattern="^(11011|11012|11013|11014)$",
+        description="보고서 코드"
+    )
+    fs_div: str = Field(
+        default="CFS",
+        pattern="^(CFS|OFS|AUTO)$",
+        description="재무제표 구분 (CFS: 연결, OFS: 개별, AUTO: 연결 우선)"
+    )
+    min_operating_income: Optional[float] = Field(
+        None,
+        description="상세 계산할 최소 영업이익 (생략하면 제한 없음)"
+    )
+    top_n: Optional[int] = Field(
+        None,
+        ge=1,
+        description="영업이익 상위 N개만 상세 계산 (생략하면 전부)"
+    )
+
+
+class JobProgress(BaseModel):
+    """작업 진행 현황 (항목 상태별 개수)"""
+    total: int = Field(..., description="전체 항목 수")
+    pending: int = Field(..., description="영업이익 조회 전")
+    screened: int = Field(..., description="영업이익 조회 완료 (상세 계산 대상 아님)")
+    selected: int = Field(..., description="상세 계산 대기")
+    done: int = Field(..., description="상세 계산 완료")
+    failed: int = Field(..., description="실패")
+
+
+class JobStatusResponse(BaseModel):
+    """작업 상태 응답"""
+    job_id: str = Field(..., description="작업 ID")
+    kind: str = Field(..., description="작업 종류")
+    status: str = Field(..., description="상태 (queued/running/completed/failed)")
+    stage: str = Field(..., description="진행 단계 (resolve/screen/select/detail/done)")
+    params: Dict[str, Any] = Field(..., description="작업 요청 파라미터")
+    progress: JobProgress = Field(..., description="진행 현황")
+    error: Optional[str] = Field(None, description="실패 사유")
+    created_at: datetime = Field(..., description="등록 시각")
+    updated_at: datetime = Field(..., description="마지막 갱신 시각")
+
+
+class JobResultItem(BaseModel):
+    """작업 결과 항목"""
+    index: int = Field(..., description="입력 순번 (0부터)")
+    query: Optional[str] = Field(None, description="입력 회사명 또는 종목코드")
+    corp_code: Optional[str] = Field(None, description="고유번호")
+    corp_name: Optional[str] = Field(None, description="회사명")
+    stock_code: Optional[str] = Field(None, description="종목코드")
+    rank: Optional[int] = Field(None, description="영업이익 순위")
+    operating_income: Optional[float] = Field(None, description="영업이익")
+    ebitda: Optional[float] = Field(None, description="EBITDA (상세 계산한 회사만)")
+    fs_div: Optional[str] = Field(None, description="사용한 재무제표 구분")
+    state: str = Field(..., description="항목 상태")
+    error: Optional[str] = Field(None, description="에러 코드")
+
+
+class JobResultsResponse(BaseModel):
+    """작업 결과 페이지 응답"""
+    job_id: str = Field(..., description="작업 ID")
+    status: str = Field(..., description="작업 상태")
+    page: int = Field(..., description="페이지 번호")
+    page_size: int = Field(..., description="페이지 크기")
+    total: int = Field(..., description="전체 항목 수")
+    items: List[JobResultItem] = Field(..., description="영업이익 순위 순 결과 (순위가 없는 항목은 마지막)")
 
 
 # 내부 데이터 모델
@@ -75,3 +324,35 @@ class FinancialAccount(BaseModel):
     thstrm_add_amount: Optional[str] = None
     sj_div: str
     currency: str = "KRW"
+
+
+class AccountRow(NamedTuple):
+    """
+    재무제표 계정 (계산 경로용 경량 레코드)
+    
+    pydantic 검증 없이 원본 행에서 바로 만든다. 계산에 쓰이는 계정만 생성한다.
+    """
+    account_nm: str
+    thstrm_amount: Optional[str]
+    thstrm_add_amount: Optional[str]
+    sj_div: str
+    currency: str = "KRW"
+    account_id: str = ""
+    frmtrm_amount: Optional[str] = None
+    frmtrm_add_amount: Optional[str] = None
+    bfefrm_amount: Optional[str] = None
+    
+    @classmethod
+    def from_row(cls, row: dict) -> "AccountRow":
+        """DART API 응답 행(dict)에서 생성"""
+        return cls(
+            row.get("account_nm", ""),
+            row.get("thstrm_amount"),
+            row.get("thstrm_add_amount"),
+            row.get("sj_div", ""),
+            row.get("currency") or "KRW",
+            row.get("account_id") or "",
+            row.get("frmtrm_amount"),
+            row.get("frmtrm_add_amount"),
+            row.get("bfefrm_amount")
+        )
@@ -0,0 +1,140 @@
+"""
+회사 검색 API 엔드포인트
+"""
+from fastapi import APIRouter, Query, HTTPException
+from app.models import (
+    CompanySuggestResponse, CompanyResolveRequest, CompanyResolveResponse, ErrorResponse
+)
+from app.services.corp_resolver import corp_resolver, SUGGESTION_LIMIT
+from app.services.dart_client import DartAPIError
+
+
+router = APIRouter(prefix="/api/v1/companies", tags=["Companies"])
+
+
+@router.get(
+    "/suggest",
+    response_model=CompanySuggestResponse,
+    responses={
+        500: {"model": ErrorResponse}
+    },
+    summary="회사명 자동완성",
+    description="""
+    입력 중인 회사명/초성/종목코드에 대한 자동완성 후보를 반환합니다.
+    
+    - 상장사(종목코드 보유)가 먼저, 이후 비상장사 순으로 정렬됩니다.
+    - 숫자 입력은 종목코드 접두 일치를 우선합니다.
+    - 조합 중인 음절(예: `삼성전ㅈ`)과 초성(예: `ㅅㅅㅈㅈ`)을 지원합니다.
+    """
+)
+async def suggest_companies(
+    q: str = Query(
+        ...,
+        min_length=1,
+        max_length=50,
+        description="검색어 (예: '삼성', 'ㅅㅅ', '0059')"
+    ),
+    limit: int = Query(
+        10,
+        ge=1,
+        le=50,
+        description="최대 반환 개수"
+    )
+):
+    """회사명 자동완성 API"""
+    
+    try:
+        items = await corp_resolver.suggest(q, limit)
+    
+    except DartAPIError as e:
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "error": e.code,
+                "message": e.message,
+                "detail": "회사 목록을 불러오지 못했습니다."
+            }
+        )
+    
+    return {
+        "query": q,
+        "items": [
+            {
+                "corp_code": item["corp_code"],
+                "corp_name": item["corp_name"],
+                "stock_code": item.get("stock_code")
+            }
+            for item in items
+        ]
+    }
+
+
+@router.post(
+    "/resolve",
+    response_model=CompanyResolveResponse,
+    responses={
+        500: {"model": ErrorResponse}
+    },
+    summary="회사 일괄 변환",
+    description="""
+    회사명/종목코드 목록을 한 번에 corp_code 로 변환합니다.
+    
+    - 결과는 입력 순서와 동일하며, 찾지 못한 항목은 `error` 에 사유와 비슷한 회사 후보가 담깁니다.
+    - 종목코드 또는 회사명 정확 일치(공백/법인 표기 무시)로 하나로 정해지는 경우만 변환합니다.
+    - 최대 10,000건까지 한 번에 요청할 수 있습니다.
+    """
+)
+async def resolve_companies(request: CompanyResolveRequest):
+    """회사 일괄 변환 API"""
+    
+    try:
+        matches = await corp_resolver.resolve_many(request.queries)
+    
+    except DartAPIError as e:
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "error": e.code,
+                "message": e.message,
+                "detail": "회사 목록을 불러오지 못했습니다."
+            }
+        )
+    
+    items = []
+    not_found = 0
+    
+    for query, match in zip(request.queries, matches):
+        if match:
+            items.append({
+                "query": query,
+                "company": {
+                    "corp_code": match["corp_code"],
+                    "corp_name": match["corp_name"],
+                    "stock_code": match.get("stock_code")
+                }
+            })
+        else:
+            not_found += 1
+            suggestions = await corp_resolver.search(query, SUGGESTION_LIMIT) if query.strip() else []
+            items.append({
+                "query": query,
+                "error": {
+                    "error": "NOT_FOUND",
+                    "message": f"'{query}'에 해당하는 회사를 찾을 수 없습니다.",
+                    "suggestions": [
+                        {
+                            "corp_code": item["corp_code"],
+                            "corp_name": item["corp_name"],
+                            "stock_code": item.get("stock_code")
+                        }
+                        for item in suggestions
+                    ]
+                }
+            })
+    
+    return {
+        "total": len(items),
+        "resolved": len(items) - not_found,
+        "not_found": not_found,
+        "items": items
+    }
@@ -1,25 +1,467 @@
 """
 EBITDA API 엔드포인트
 """
-from fastapi import APIRouter, Query, HTTPException
+from fastapi import APIRouter, Query, HTTPException, Header, Response, Request, Depends
+from fastapi.responses import StreamingResponse
 from datetime import datetime
-from app.models import EBITDAResponse, ErrorResponse, CompanyInfo, PeriodInfo, EBITDAComponents, ComponentAmount, EBITDAResult, SourceInfo
-from app.services.corp_resolver import corp_resolver
+from typing import Any, Dict, Optional, Sequence, Set
+from app.models import EBITDAResponse, ErrorResponse, CompanyInfo, EBITDASeriesResponse, QuarterEBITDAResponse, EBITDABatchItem, EBITDABatchRequest
+from app.services.corp_resolver import corp_resolver, CompanyNotFound
 from app.services.ebitda_calculator import ebitda_calculator
-from app.services.dart_client import DartAPIError
+from app.services.ebitda_batch import ebitda_batch_service
+from app.services.ebitda_series import ebitda_series_service
+from app.services.period_engine import ebitda_period_engine
+from app.services.dart_client import dart_client, DartAPIError
+from app.services.financial_service import financial_service
+from app.config import settings
+from app.utils.cache import ebitda_response_cache
+from app.utils.deadline import DeadlineExceeded, ClientDisconnected, start_deadline, run_until_disconnected
+from app.utils.rate_limiter import AdmissionRejected
+from app.utils.fair_queue import QuotaExceeded, request_consumer, ANONYMOUS_CONSUMER
+from app.utils.etag import make_etag, etag_matches, cache_control_for, variant_etag
+from app.utils.serialization import (
+    dumps, dumps_with_fragments, encode_constant, loads, pack, arrow_stream,
+    negotiate_media_type, MEDIA_JSON, MEDIA_NDJSON, MEDIA_MSGPACK, MEDIA_ARROW
+)
 
 
 router = APIRouter(prefix="/api/v1", tags=["EBITDA"])
 
+# 엔드포인트별 응답 형식 (첫 번째가 기본)
+RESPONSE_MEDIA_TYPES = (MEDIA_JSON, MEDIA_MSGPACK)
+BATCH_MEDIA_TYPES = (MEDIA_NDJSON, MEDIA_MSGPACK, MEDIA_ARROW)
+
+# 일괄 계산은 JSON 을 요청해도 NDJSON 으로 응답 (HTTP 클라이언트 기본 Accept 가 application/json 인 경우가 많음)
+BATCH_MEDIA_ALIASES = {MEDIA_JSON: MEDIA_NDJSON}
+
+
+async def _start_request_deadline(
+    x_request_timeout: Optional[float] = Header(
+        None,
+        gt=0,
+        description="요청 처리 제한 시간 (초, 없으면 서버 기본값)"
+    )
+):
+    """
+    요청 마감 설정
+    
+    이후 회사 변환, 재무정보 조회, rate limiter 대기, OPENDART HTTP 요청과 재시도가
+    모두 이 마감을 따르며, 마감 안에 끝낼 수 없으면 504 로 응답한다.
+    """
+    timeout = min(x_request_timeout or settings.request_timeout, settings.request_timeout_max)
+    start_deadline(timeout)
+
+
+async def _identify_consumer(
+    x_api_key: Optional[str] = Header(
+        None,
+        description="소비자 API 키 (OPENDART 호출 공정 배분/할당량 단위, 없으면 anonymous)"
+    )
+):
+    """
+    요청 소비자 설정
+    
+    캐시에 없어 OPENDART 를 호출해야 할 때 소비자별 공정 큐와 할당량이 적용된다.
+    등록되지 않은 키는 키를 바꿔가며 몫을 늘릴 수 없도록 모두 anonymous 로 묶는다.
+    """
+    request_consumer.set(settings.api_keys.get(x_api_key or "", ANONYMOUS_CONSUMER))
+
+
+def _deadline_exceeded(e: DeadlineExceeded) -> HTTPException:
+    """요청 마감 초과 응답 (504)"""
+    return HTTPException(
+        status_code=504,
+        detail={
+            "error": e.code,
+            "message": e.message,
+            "detail": "요청 처리 제한 시간 안에 OPENDART 조회를 마치지 못했습니다."
+        }
+    )
+
+
+def _admission_rejected(e: AdmissionRejected) -> HTTPException:
+    """과부하로 거절한 요청의 응답 (429, Retry-After)"""
+    return HTTPException(
+        status_code=429,
+        detail={
+            "error": e.code,
+            "message": e.message,
+            "detail": f"예상 대기 시간 {e.estimated_wait:.1f}초"
+        },
+        headers={"Retry-After": str(e.retry_after)}
+    )
+
+
+def _quota_exceeded(e: QuotaExceeded) -> HTTPException:
+    """소비자 할당량 초과 응답 (429, Retry-After)"""
+    return HTTPException(
+        status_code=429,
+        detail={
+            "error": e.code,
+            "message": e.message,
+            "detail": f"consumer={e.consumer}"
+        },
+        headers={"Retry-After": str(e.retry_after)}
+    )
+
+
+def _client_closed() -> Response:
+    """클라이언트 연결이 끊긴 요청의 응답 (받을 상대가 없으므로 본문 없음, 499)"""
+    return Response(status_code=499)
+
+
+def _response_cache_key(corp_code: str, year: int, report_code: str, fs_div: str) -> tuple:
+    """계산 결과 응답 캐시 키"""
+    return (corp_code, year, report_code, fs_div, ebitda_calculator.CALCULATION_VERSION)
+
+
+def _on_financial_refresh(
+    corp_code: str,
+    year: int,
+    report_code: str,
+    fs_div: str,
+    rcept_no: Optional[str]
+):
+    """재무정보를 새로 조회해 접수번호가 바뀌면 해당 응답 제거 (AUTO 요청 포함)"""
+    for requested_fs_div in (fs_div, financial_service.AUTO_FS_DIV):
+        ebitda_response_cache.invalidate(
+            _response_cache_key(corp_code, year, report_code, requested_fs_div),
+            rcept_no
+        )
+
+
+def _on_corp_change(corp_codes: Set[str]):
+    """회사명 변경/상장폐지된 회사의 응답 제거"""
+    ebitda_response_cache.invalidate_where(lambda key: key[0] in corp_codes)
+
+
+financial_service.add_refresh_listener(_on_financial_refresh)
+corp_resolver.add_change_listener(_on_corp_change)
+
+
+def _component_payload(component: Dict[str, Any], currency: str) -> Dict[str, Any]:
+    """ComponentAmount 형태 딕셔너리"""
+    return {
+        "label": component["label"],
+        "amount": component["amount"],
+        "currency": currency,
+        "matched_by": component.get("matched_by")
+    }
+
+
+def _ebitda_payload(
+    corp_info: Dict[str, str],
+    year: int,
+    report_code: str,
+    fs_div: str,
+    result: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    calculate_ebitda 결과를 EBITDAResponse 형태 딕셔너리로 변환 (warnings 제외)
+    
+    응답 모델을 만들고 다시 검증/변환하지 않고 같은 구조의 딕셔너리를 바로 직렬화한다.
+    """
+    currency = result["currency"]
+    basis = result["basis"]
+    components = result["components"]
+    
+    return {
+        "company": {
+            "corp_code": corp_info["corp_code"],
+            "corp_name": corp_info["corp_name"],
+            "stock_code": corp_info.get("stock_code")
+        },
+        "period": {
+            "year": year,
+            "report_code": report_code,
+            "report_name": result.get("report_name", ""),
+            "fs_div": result["fs_div"],
+            "fs_name": result["fs_name"],
+            "requested_fs_div": fs_div
+        },
+        "components": {
+            "operating_income": _component_payload(components["operating_income"], currency),
+            "depreciation": _component_payload(components["depreciation"], currency),
+            "amortization": _component_payload(components["amortization"], currency)
+        },
+        "ebitda": {
+            "total": result["ebitda_total"],
+            "currency": currency,
+            "basis": basis
+        },
+        "prior_periods": [
+            {
+                "year": period["year"],
+                "label": period["label"],
+                "operating_income": period["operating_income"],
+                "depreciation": period["depreciation"],
+                "amortization": period["amortization"],
+                "total": period["ebitda_total"],
+                "currency": currency,
+                "basis": basis
+            }
+            for period in result.get("prior_periods", [])
+        ],
+        "source": {
+            "rcept_no": result.get("rcept_no"),
+            # OPENDART 에서 조회한 시각 (캐시된 재무정보면 처음 조회한 시각)
+            "fetched_at": result["fetched_at"],
+            "cached": result.get("from_cache", False)
+        }
+    }
+
+
+def _encode_ebitda_response(
+    corp_info: Dict[str, str],
+    year: int,
+    report_code: str,
+    fs_div: str,
+    result: Dict[str, Any]
+) -> bytes:
+    """
+    calculate_ebitda 결과를 EBITDAResponse 형태 JSON 으로 직렬화
+    
+    경고 메시지 목록은 반복되므로 미리 인코딩한 조각을 재사용한다.
+    """
+    return dumps_with_fragments(
+        _ebitda_payload(corp_info, year, report_code, fs_div, result),
+        {"warnings": encode_constant(tuple(result.get("warnings", [])))}
+    )
+
+
+def _ebitda_etag(
+    corp_info: Dict[str, str],
+    year: int,
+    report_code: str,
+    fs_div: str,
+    result: Dict[str, Any]
+) -> str:
+    """
+    EBITDA 응답 ETag (응답을 만든 근거 데이터로 생성)
+    
+    같은 공시(rcept_no)를 같은 계산 로직으로 계산한 응답은 조회 시각이나
+    source.cached 가 달라도 같은 ETag 이므로, 캐시 적중 전후와 같은 공시를 다시 조회한 뒤에도
+    304 로 재검증된다. 본문 바이트가 항상 같지는 않으므로 약한(weak) ETag 이다.
+    """
+    return "W/" + make_etag(
+        corp_info["corp_code"],
+        corp_info["corp_name"],
+        corp_info.get("stock_code"),
+        year,
+        report_code,
+        fs_div,
+        result["fs_div"],
+        result.get("rcept_no") or result.get("fetched_at"),
+        ebitda_calculator.CALCULATION_VERSION
+    )
+
+
+def _negotiate(
+    accept: Optional[str],
+    offered: Sequence[str],
+    aliases: Optional[Dict[str, str]] = None
+) -> str:
+    """Accept 헤더로 응답 형식 선택 (받을 수 있는 형식이 없으면 406)"""
+    media_type = negotiate_media_type(accept, offered, aliases)
+    if media_type is None:
+        raise HTTPException(
+            status_code=406,
+            detail={
+                "error": "NOT_ACCEPTABLE",
+                "message": "지원하지 않는 응답 형식입니다.",
+                "detail": f"지원 형식: {', '.join(offered)}"
+            }
+        )
+    return media_type
+
+
+def _dart_error_detail(e: DartAPIError) -> Dict[str, Any]:
+    """DartAPIError 응답 본문 (회사를 찾지 못한 경우 비슷한 회사 후보 포함)"""
+    detail = {
+        "error": e.code,
+        "message": e.message,
+        "detail": "OPENDART API 에러가 발생했습니다."
+    }
+    if isinstance(e, CompanyNotFound):
+        detail["detail"] = "검색어와 정확히 일치하는 회사가 없습니다. suggestions 에서 회사를 골라 종목코드로 다시 요청해주세요."
+        detail["suggestions"] = e.suggestions
+    return detail
+
+
+def _batch_error(error: Exception) -> Dict[str, Any]:
+    """일괄 계산 항목 에러 (ErrorResponse 형태)"""
+    if isinstance(error, DartAPIError):
+        return _dart_error_detail(error)
+    if isinstance(error, (DeadlineExceeded, AdmissionRejected, QuotaExceeded)):
+        return {
+            "error": error.code,
+            "message": error.message,
+            "detail": "OPENDART 호출 대기열이 비면 다시 시도해주세요."
+        }
+    return {
+        "error": "INTERNAL_ERROR",
+        "message": str(error),
+        "detail": "서버 내부 에러가 발생했습니다."
+    }
+
+
+def _batch_line(
+    index: int,
+    item: EBITDABatchItem,
+    corp_info: Optional[Dict[str, str]],
+    result: Optional[Dict[str, Any]],
+    error: Optional[Exception]
+) -> Dict[str, Any]:
+    """일괄 계산 결과 한 줄 (EBITDABatchResult 형태)"""
+    line = {
+        "index": index,
+        "company": item.company,
+        "year": item.year,
+        "report_code": item.report_code,
+        "fs_div": item.fs_div,
+        "result": None,
+        "error": None
+    }
+    
+    if error is not None:
+        line["error"] = _batch_error(error)
+    else:
+        payload = _ebitda_payload(corp_info, item.year, item.report_code, item.fs_div, result)
+        payload["warnings"] = result.get("warnings", [])
+        line["result"] = payload
+    
+    return line
+
+
+def _encode_batch_line(
+    index: int,
+    item: EBITDABatchItem,
+    corp_info: Optional[Dict[str, str]],
+    result: Optional[Dict[str, Any]],
+    error: Optional[Exception]
+) -> bytes:
+    """일괄 계산 결과 한 줄 NDJSON 직렬화 (결과 본문은 단건 응답과 같은 인코딩)"""
+    line = {
+        "index": index,
+        "company": item.company,
+        "year": item.year,
+        "report_code": item.report_code,
+        "fs_div": item.fs_div,
+        "result": None,
+        "error": None
+    }
+    
+    if error is not None:
+        line["error"] = _batch_error(error)
+        return dumps(line) + b"\n"
+    
+    encoded_result = _encode_ebitda_response(
+        corp_info, item.year, item.report_code, item.fs_div, result
+    )
+    return dumps_with_fragments(line, {"result": encoded_result}) + b"\n"
+
+
+# Arrow 일괄 계산 결과 컬럼 (EBITDABatchResult 를 펼친 형태)
+BATCH_ARROW_COLUMNS = (
+    ("index", "int32"),
+    ("company", "string"),
+    ("year", "int32"),
+    ("report_code", "string"),
+    ("fs_div", "string"),
+    ("corp_code", "string"),
+    ("corp_name", "string"),
+    ("stock_code", "string"),
+    ("report_name", "string"),
+    ("used_fs_div", "string"),
+    ("operating_income", "double"),
+    ("depreciation", "double"),
+    ("amortization", "double"),
+    ("ebitda", "double"),
+    ("currency", "string"),
+    ("basis", "string"),
+    ("rcept_no", "string"),
+    ("cached", "bool"),
+    ("error", "string"),
+    ("error_message", "string")
+)
+
+
+def _batch_row(
+    index: int,
+    item: EBITDABatchItem,
+    corp_info: Optional[Dict[str, str]],
+    result: Optional[Dict[str, Any]],
+    error: Optional[Exception]
+) -> Dict[str, Any]:
+    """일괄 계산 결과 한 행 (BATCH_ARROW_COLUMNS, 실패 시 금액은 null)"""
+    row = {
+        "index": index,
+        "company": item.company,
+        "year": item.year,
+        "report_code": item.report_code,
+        "fs_div": item.fs_div
+    }
+    
+    if error is not None:
+        batch_error = _batch_error(error)
+        row["error"] = batch_error["error"]
+        row["error_message"] = batch_error["message"]
+        return row
+    
+    components = result["components"]
+    row.update({
+        "corp_code": corp_info["corp_code"],
+        "corp_name": corp_info["corp_name"],
+        "stock_code": corp_info.get("stock_code"),
+        "report_name": result.get("report_name", ""),
+        "used_fs_div": result["fs_div"],
+        "operating_income": components["operating_income"]["amount"],
+        "depreciation": components["depreciation"]["amount"],
+        "amortization": components["amortization"]["amount"],
+        "ebitda": result["ebitda_total"],
+        "currency": result["currency"],
+        "basis": result["basis"],
+        "rcept_no": result.get("rcept_no"),
+        "cached": result.get("from_cache", False)
+    })
+    return row
+
+
+def _ebitda_http_response(
+    body: bytes,
+    etag: str,
+    media_type: str,
+    cache_control: str,
+    if_none_match: Optional[str]
+) -> Response:
+    """
+    직렬화된 JSON 본문으로 EBITDA 응답 구성 (ETag 일치 시 304)
+    
+    캐시에는 JSON 본문만 두고, 다른 형식은 응답할 때 변환한다.
+    """
+    etag = variant_etag(etag, media_type)
+    headers = {"ETag": etag, "Cache-Control": cache_control, "Vary": "Accept"}
+    
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    
+    if media_type == MEDIA_MSGPACK:
+        body = pack(loads(body))
+    return Response(content=body, media_type=media_type, headers=headers)
+
 
 @router.get(
     "/ebitda",
     response_model=EBITDAResponse,
+    dependencies=[Depends(_identify_consumer), Depends(_start_request_deadline)],
     responses={
+        200: {"content": {MEDIA_MSGPACK: {}}},
         400: {"model": ErrorResponse},
         404: {"model": ErrorResponse},
+        406: {"model": ErrorResponse},
         429: {"model": ErrorResponse},
-        500: {"model": ErrorResponse}
+        500: {"model": ErrorResponse},
+        504: {"model": ErrorResponse}
     },
     summary="EBITDA 계산",
     description="""
@@ -39,9 +481,17 @@ router = APIRouter(prefix="/api/v1", tags=["EBITDA"])
     **재무제표 구분:**
     - `CFS`: 연결재무제표 (기본값)
     - `OFS`: 개별재무제표
+    - `AUTO`: 연결재무제표 우선, 없으면 개별재무제표 (사용한 구분은 `period.fs_div`)
+    
+    **응답 형식 (`Accept`):** `application/json` (기본), `application/msgpack`
+    
+    **제한 시간:** `X-Request-Timeout` 헤더(초) 또는 서버 기본값 안에 끝낼 수 없으면 `504`
+    
+    **과부하:** OPENDART 호출 대기열의 예상 대기 시간이 길면 바로 `429` 와 `Retry-After` 로 거절 (캐시 적중은 거절하지 않음)
     """
 )
 async def get_ebitda(
+    request: Request,
     company: str = Query(
         ...,
         description="회사명 또는 종목코드 (예: '삼성전자', '005930')",
@@ -60,69 +510,54 @@ async def get_ebitda(
     ),
     fs_div: str = Query(
         "CFS",
-        description="재무제표 구분 (CFS: 연결, OFS: 개별)",
-        pattern="^(CFS|OFS)$"
-    )
+        description="재무제표 구분 (CFS: 연결, OFS: 개별, AUTO: 연결 우선)",
+        pattern="^(CFS|OFS|AUTO)$"
+    ),
+    if_none_match: Optional[str] = Header(None),
+    accept: Optional[str] = Header(None)
 ):
     """EBITDA 계산 API"""
     
+    media_type = _negotiate(accept, RESPONSE_MEDIA_TYPES)
+    
     try:
         # 1. 회사명/종목코드 → corp_code 변환
-        corp_info = await corp_resolver.resolve(company)
+        corp_info = await run_until_disconnected(request, corp_resolver.resolve(company))
         
-        # 2. EBITDA 계산
-        result = await ebitda_calculator.calculate_ebitda(
+        cache_control = cache_control_for(year, report_code)
+        cache_key = _response_cache_key(corp_info["corp_code"], year, report_code, fs_div)
+        
+        # 2. 계산 결과 캐시 적중 시 계산/직렬화 없이 바로 응답 (ETag 일치 시 304)
+        cached = ebitda_response_cache.get(cache_key)
+        if cached is not None:
+            return _ebitda_http_response(
+                cached.body, cached.etag, media_type, cache_control, if_none_match
+            )
+        
+        # 3. EBITDA 계산 (클라이언트 연결이 끊기면 중단)
+        result = await run_until_disconnected(request, ebitda_calculator.calculate_ebitda(
             corp_code=corp_info["corp_code"],
             year=year,
             report_code=report_code,
             fs_div=fs_div
-        )
+        ))
         
-        # 3. 응답 구성
-        response = EBITDAResponse(
-            company=CompanyInfo(
-                corp_code=corp_info["corp_code"],
-                corp_name=corp_info["corp_name"],
-                stock_code=corp_info.get("stock_code")
-            ),
-            period=PeriodInfo(
-                year=year,
-                report_code=report_code,
-                report_name=result.get("report_name", ""),
-                fs_div=fs_div,
-                fs_name="연결재무제표" if fs_div == "CFS" else "개별재무제표"
-            ),
-            components=EBITDAComponents(
-                operating_income=ComponentAmount(
-                    label=result["components"]["operating_income"]["label"],
-                    amount=result["components"]["operating_income"]["amount"],
-                    currency=result["currency"]
-                ),
-                depreciation=ComponentAmount(
-                    label=result["components"]["depreciation"]["label"],
-                    amount=result["components"]["depreciation"]["amount"],
-                    currency=result["currency"]
-                ),
-                amortization=ComponentAmount(
-                    label=result["components"]["amortization"]["label"],
-                    amount=result["components"]["amortization"]["amount"],
-                    currency=result["currency"]
-                )
-            ),
-            ebitda=EBITDAResult(
-                total=result["ebitda_total"],
-                currency=result["currency"],
-                basis=result["basis"]
-            ),
-            source=SourceInfo(
-                rcept_no=result.get("rcept_no"),
-                fetched_at=datetime.now(),
-                cached=result.get("from_cache", False)
-            ),
-            warnings=result.get("warnings", [])
+        # 4. 응답 구성 및 직렬화 결과 저장 (ETag 는 캐시 적중 응답과 같음)
+        body = _encode_ebitda_response(corp_info, year, report_code, fs_div, result)
+        etag = _ebitda_etag(corp_info, year, report_code, fs_div, result)
+        
+        # 캐시 적중 응답은 항상 캐시된 재무정보로 만든 응답이므로 source.cached 를 true 로 저장
+        cached_body = body
+        if not result.get("from_cache"):
+            cached_body = _encode_ebitda_response(
+                corp_info, year, report_code, fs_div, {**result, "from_cache": True}
+            )
+        ebitda_response_cache.set(
+            cache_key, cached_body, etag,
+            result.get("rcept_no"), result["fetched_at"]
         )
         
-        return response
+        return _ebitda_http_response(body, etag, media_type, cache_control, if_none_match)
     
     except DartAPIError as e:
         # DART API 에러 처리
@@ -133,15 +568,202 @@ async def get_ebitda(
         
         raise HTTPException(
             status_code=status_code,
+            detail=_dart_error_detail(e)
+        )
+    
+    except DeadlineExceeded as e:
+        raise _deadline_exceeded(e)
+    
+    except AdmissionRejected as e:
+        raise _admission_rejected(e)
+    
+    except QuotaExceeded as e:
+        raise _quota_exceeded(e)
+    
+    except ClientDisconnected:
+        return _client_closed()
+    
+    except Exception as e:
+        # 기타 에러 처리
+        raise HTTPException(
+            status_code=500,
             detail={
-                "error": e.code,
-                "message": e.message,
-                "detail": "OPENDART API 에러가 발생했습니다."
+                "error": "INTERNAL_ERROR",
+                "message": str(e),
+                "detail": "서버 내부 에러가 발생했습니다."
             }
         )
+
+
+@router.post(
+    "/ebitda/batch",
+    response_class=StreamingResponse,
+    dependencies=[Depends(_identify_consumer)],
+    responses={
+        200: {
+            "content": {MEDIA_NDJSON: {}, MEDIA_MSGPACK: {}, MEDIA_ARROW: {}},
+            "description": "항목별 EBITDABatchResult 를 한 줄씩 (완료 순서)"
+        },
+        406: {"model": ErrorResponse},
+        422: {"description": "요청 형식 오류"}
+    },
+    summary="EBITDA 일괄 계산 (NDJSON 스트리밍)",
+    description="""
+    여러 (회사, 사업연도, 보고서, 재무제표 구분) 항목의 EBITDA를 한 번에 계산합니다.
+    
+    - 결과는 항목이 끝나는 대로 NDJSON 한 줄씩 전송되며, 입력 순서는 `index` 로 확인합니다.
+    - 느린 항목이 다른 항목의 결과를 막지 않습니다.
+    - 항목별 실패는 해당 줄의 `error` 에 담기고 나머지 항목은 계속 처리됩니다.
+    - 최대 5,000건까지 한 번에 요청할 수 있습니다.
+    
+    **응답 형식 (`Accept`):**
+    - `application/x-ndjson` (기본, `application/json` 요청 포함): 항목마다 JSON 한 줄
+    - `application/msgpack`: 항목마다 MessagePack 객체 하나 (이어 붙인 스트림)
+    - `application/vnd.apache.arrow.stream`: 결과를 펼친 표 (Arrow IPC 스트림, 256행마다 레코드 배치)
+    """
+)
+async def get_ebitda_batch(
+    request: EBITDABatchRequest,
+    accept: Optional[str] = Header(None)
+):
+    """EBITDA 일괄 계산 API"""
+    
+    media_type = _negotiate(accept, BATCH_MEDIA_TYPES, BATCH_MEDIA_ALIASES)
+    results = ebitda_batch_service.stream(request.items)
+    
+    async def ndjson_lines():
+        async for index, corp_info, result, error in results:
+            yield _encode_batch_line(index, request.items[index], corp_info, result, error)
+    
+    async def msgpack_objects():
+        async for index, corp_info, result, error in results:
+            yield pack(_batch_line(index, request.items[index], corp_info, result, error))
+    
+    async def arrow_rows():
+        async for index, corp_info, result, error in results:
+            yield _batch_row(index, request.items[index], corp_info, result, error)
+    
+    if media_type == MEDIA_ARROW:
+        body = arrow_stream(arrow_rows(), BATCH_ARROW_COLUMNS)
+    elif media_type == MEDIA_MSGPACK:
+        body = msgpack_objects()
+    else:
+        body = ndjson_lines()
+    
+    return StreamingResponse(body, media_type=media_type)
+
+
+@router.get(
+    "/ebitda/series",
+    response_model=EBITDASeriesResponse,
+    dependencies=[Depends(_identify_consumer), Depends(_start_request_deadline)],
+    responses={
+        200: {"content": {MEDIA_MSGPACK: {}}},
+        400: {"model": ErrorResponse},
+        404: {"model": ErrorResponse},
+        406: {"model": ErrorResponse},
+        429: {"model": ErrorResponse},
+        500: {"model": ErrorResponse},
+        504: {"model": ErrorResponse}
+    },
+    summary="EBITDA 시계열",
+    description="""
+    여러 사업연도/보고서의 EBITDA를 한 번에 조회합니다.
+    
+    - 회사는 한 번만 변환합니다.
+    - 보고서의 전기/전전기 금액을 재사용해 조회할 보고서 수를 최소화합니다
+      (사업보고서 1건이 최대 3개 연도를 덮습니다).
+    - 캐시에 없는 보고서만 동시에 조회합니다.
+    - 각 항목의 `source_year`/`source_period`는 금액을 가져온 보고서를 나타냅니다.
+    
+    **응답 형식 (`Accept`):** `application/json` (기본), `application/msgpack`
+    """
+)
+async def get_ebitda_series(
+    request: Request,
+    company: str = Query(
+        ...,
+        description="회사명 또는 종목코드 (예: '삼성전자', '005930')",
+        examples=["삼성전자", "005930"]
+    ),
+    from_year: int = Query(
+        ...,
+        alias="from",
+        description="시작 사업연도 (예: 2019)",
+        ge=2015,
+        le=2030
+    ),
+    to_year: int = Query(
+        ...,
+        alias="to",
+        description="종료 사업연도 (예: 2024)",
+        ge=2015,
+        le=2030
+    ),
+    reports: str = Query(
+        "11011",
+        description="보고서 코드 목록 (쉼표 구분, 예: '11011,11014')",
+        pattern="^(11011|11012|11013|11014)(,(11011|11012|11013|11014))*$"
+    ),
+    fs_div: str = Query(
+        "CFS",
+        description="재무제표 구분 (CFS: 연결, OFS: 개별, AUTO: 연결 우선)",
+        pattern="^(CFS|OFS|AUTO)$"
+    ),
+    accept: Optional[str] = Header(None)
+):
+    """EBITDA 시계열 API"""
+    
+    media_type = _negotiate(accept, RESPONSE_MEDIA_TYPES)
+    
+    if from_year > to_year:
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "error": "INVALID_RANGE",
+                "message": "시작 사업연도가 종료 사업연도보다 늦습니다.",
+                "detail": f"from={from_year}, to={to_year}"
+            }
+        )
+    
+    report_codes = list(dict.fromkeys(reports.split(",")))
+    
+    try:
+        # 회사 변환은 한 번만
+        corp_info = await run_until_disconnected(request, corp_resolver.resolve(company))
+        
+        series = await run_until_disconnected(request, ebitda_series_service.get_series(
+            corp_code=corp_info["corp_code"],
+            from_year=from_year,
+            to_year=to_year,
+            report_codes=report_codes,
+            fs_div=fs_div
+        ))
+    
+    except DartAPIError as e:
+        status_code = 404 if e.code in ["NOT_FOUND", "013"] else 500
+        
+        if e.code == "020":
+            status_code = 429
+        
+        raise HTTPException(
+            status_code=status_code,
+            detail=_dart_error_detail(e)
+        )
+    
+    except DeadlineExceeded as e:
+        raise _deadline_exceeded(e)
+    
+    except AdmissionRejected as e:
+        raise _admission_rejected(e)
+    
+    except QuotaExceeded as e:
+        raise _quota_exceeded(e)
+    
+    except ClientDisconnected:
+        return _client_closed()
     
     except Exception as e:
-        # 기타 에러 처리
         raise HTTPException(
             status_code=500,
             detail={
@@ -150,6 +772,135 @@ async def get_ebitda(
                 "detail": "서버 내부 에러가 발생했습니다."
             }
         )
+    
+    response = EBITDASeriesResponse(
+        company=CompanyInfo(
+            corp_code=corp_info["corp_code"],
+            corp_name=corp_info["corp_name"],
+            stock_code=corp_info.get("stock_code")
+        ),
+        from_year=from_year,
+        to_year=to_year,
+        reports=report_codes,
+        **series
+    )
+    
+    if media_type == MEDIA_MSGPACK:
+        return Response(
+            content=pack(response.model_dump(mode="json")),
+            media_type=MEDIA_MSGPACK,
+            headers={"Vary": "Accept"}
+        )
+    return response
+
+
+@router.get(
+    "/ebitda/quarter",
+    response_model=QuarterEBITDAResponse,
+    dependencies=[Depends(_identify_consumer), Depends(_start_request_deadline)],
+    responses={
+        400: {"model": ErrorResponse},
+        404: {"model": ErrorResponse},
+        429: {"model": ErrorResponse},
+        500: {"model": ErrorResponse},
+        504: {"model": ErrorResponse}
+    },
+    summary="분기/TTM EBITDA",
+    description="""
+    누적 보고서를 차감해 단일 분기 EBITDA와 최근 4분기(TTM) EBITDA를 계산합니다.
+    
+    - Q1 = 1분기, Q2 = 반기 - 1분기, Q3 = 3분기 - 반기, Q4 = 사업보고서 - 3분기
+    - TTM = 당해 누적 + 전년 사업보고서 - 전년 동기 누적
+    
+    필요한 보고서는 동시에 조회하며, 계산 결과는 캐시됩니다.
+    """
+)
+async def get_quarter_ebitda(
+    request: Request,
+    company: str = Query(
+        ...,
+        description="회사명 또는 종목코드 (예: '삼성전자', '005930')",
+        examples=["삼성전자", "005930"]
+    ),
+    year: int = Query(
+        ...,
+        description="사업연도 (예: 2024)",
+        ge=2015,
+        le=2030
+    ),
+    quarter: int = Query(
+        ...,
+        description="분기 (1~4)",
+        ge=1,
+        le=4
+    ),
+    fs_div: str = Query(
+        "CFS",
+        description="재무제표 구분 (CFS: 연결, OFS: 개별, AUTO: 연결 우선)",
+        pattern="^(CFS|OFS|AUTO)$"
+    )
+):
+    """분기/TTM EBITDA API"""
+    
+    try:
+        corp_info = await run_until_disconnected(request, corp_resolver.resolve(company))
+        
+        result = await run_until_disconnected(request, ebitda_period_engine.calculate_quarter(
+            corp_code=corp_info["corp_code"],
+            year=year,
+            quarter=quarter,
+            fs_div=fs_div
+        ))
+    
+    except DartAPIError as e:
+        status_code = 404 if e.code in ["NOT_FOUND", "013"] else 500
+        
+        if e.code == "020":
+            status_code = 429
+        
+        raise HTTPException(
+            status_code=status_code,
+            detail=_dart_error_detail(e)
+        )
+    
+    except DeadlineExceeded as e:
+        raise _deadline_exceeded(e)
+    
+    except AdmissionRejected as e:
+        raise _admission_rejected(e)
+    
+    except QuotaExceeded as e:
+        raise _quota_exceeded(e)
+    
+    except ClientDisconnected:
+        return _client_closed()
+    
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail={
+                "error": "INTERNAL_ERROR",
+                "message": str(e),
+                "detail": "서버 내부 에러가 발생했습니다."
+            }
+        )
+    
+    return QuarterEBITDAResponse(
+        company=CompanyInfo(
+            corp_code=corp_info["corp_code"],
+            corp_name=corp_info["corp_name"],
+            stock_code=corp_info.get("stock_code")
+        ),
+        year=result["year"],
+        quarter=result["quarter"],
+        fs_div=result.get("fs_div"),
+        currency=result["currency"],
+        quarter_ebitda=result["quarter_ebitda"],
+        ttm_ebitda=result["ttm_ebitda"],
+        sources=result["sources"],
+        cached=result.get("from_cache", False),
+        warnings=result["warnings"]
+    )
 
 
 @router.get("/health", summary="헬스 체크")
@@ -157,5 +908,13 @@ async def health_check():
     """API 서버 상태 확인"""
     return {
         "status": "ok",
-        "timestamp": datetime.now().isoformat()
+        "timestamp": datetime.now().isoformat(),
+        "resolve_cache": corp_resolver.resolve_cache_stats(),
+        "response_cache": ebitda_response_cache.stats(),
+        "upstream_queue": {
+            "estimated_wait": round(
+                dart_client.rate_limiter.estimated_wait(dart_client.scheduler.waiting()), 3
+            ),
+            **dart_client.scheduler.stats()
+        }
     }
@@ -0,0 +1,121 @@
+"""
+내보내기 API 엔드포인트
+"""
+from fastapi import APIRouter, Query, HTTPException
+from fastapi.responses import StreamingResponse
+from typing import Optional
+from app.config import settings
+from app.models import ErrorResponse
+from app.services.dart_client import DartAPIError
+from app.services.export import ebitda_export_service
+from app.utils.serialization import (
+    csv_stream, parquet_stream, is_available, MEDIA_CSV, MEDIA_PARQUET
+)
+
+
+router = APIRouter(prefix="/api/v1/export", tags=["Export"])
+
+# format 파라미터 → 응답 형식
+EXPORT_MEDIA_TYPES = {"csv": MEDIA_CSV, "parquet": MEDIA_PARQUET}
+
+
+@router.get(
+    "/ebitda",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "content": {MEDIA_CSV: {}, MEDIA_PARQUET: {}},
+            "description": "종목코드 순 EBITDA 표"
+        },
+        400: {"model": ErrorResponse},
+        500: {"model": ErrorResponse}
+    },
+    summary="전체 상장사 EBITDA 내보내기 (CSV/Parquet 스트리밍)",
+    description="""
+    종목코드가 있는 모든 회사의 EBITDA를 종목코드 순으로 내보냅니다.
+    
+    - 캐시된 재무정보는 바로 기록하고, 캐시에 없는 회사는 대량 작업 우선순위로 조회합니다
+      (일반 API 요청이 먼저 처리됩니다).
+    - 표 전체를 메모리에 두지 않고 행 묶음마다 전송합니다.
+    - 회사별 실패는 해당 행의 `error` 에 에러 코드로 기록됩니다 (예: `013` 데이터 없음).
+    
+    **이어받기:** 출력은 종목코드 순이므로 연결이 끊기면 마지막으로 받은 행의 `stock_code` 를
+    `cursor` 로 넘겨 다음 회사부터 받습니다. Parquet 은 파일 끝까지 받아야 읽을 수 있으므로
+    `limit` 으로 나눠 받고, 응답 헤더 `X-Next-Cursor` 를 다음 요청의 `cursor` 로 사용합니다.
+    """
+)
+async def export_ebitda(
+    year: int = Query(
+        ...,
+        description="사업연도 (예: 2024)",
+        ge=2015,
+        le=2030
+    ),
+    report_code: str = Query(
+        "11011",
+        description="보고서 코드",
+        pattern="^(11011|11012|11013|11014)$"
+    ),
+    fs_div: str = Query(
+        "CFS",
+        description="재무제표 구분 (CFS: 연결, OFS: 개별, AUTO: 연결 우선)",
+        pattern="^(CFS|OFS|AUTO)$"
+    ),
+    format: str = Query(
+        "csv",
+        description="출력 형식 (csv / parquet)",
+        pattern="^(csv|parquet)$"
+    ),
+    cursor: Optional[str] = Query(
+        None,
+        description="이 종목코드 다음 회사부터 (이전 응답의 마지막 stock_code 또는 X-Next-Cursor)",
+        pattern="^[0-9A-Z]{6}$"
+    ),
+    limit: Optional[int] = Query(
+        None,
+        description="최대 회사 수 (없으면 끝까지)",
+        ge=1,
+        le=10000
+    )
+):
+    """전체 상장사 EBITDA 내보내기 API"""
+    
+    media_type = EXPORT_MEDIA_TYPES[format]
+    if not is_available(media_type):
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "error": "UNSUPPORTED_FORMAT",
+                "message": f"{format} 형식을 사용할 수 없습니다.",
+                "detail": "서버에 pyarrow 가 설치되어 있지 않습니다."
+            }
+        )
+    
+    try:
+        companies, has_more = await ebitda_export_service.companies(cursor, limit)
+    
+    except DartAPIError as e:
+        raise HTTPException(
+            status_code=429 if e.code == "020" else 500,
+            detail={
+                "error": e.code,
+                "message": e.message,
+                "detail": "OPENDART API 에러가 발생했습니다."
+            }
+        )
+    
+    rows = ebitda_export_service.rows(companies, year, report_code, fs_div)
+    
+    if format == "parquet":
+        body = parquet_stream(rows, ebitda_export_service.COLUMNS, settings.export_chunk_rows)
+    else:
+        body = csv_stream(rows, ebitda_export_service.COLUMNS, settings.export_chunk_rows)
+    
+    headers = {
+        "Content-Disposition": f'attachment; filename="ebitda_{year}_{report_code}_{fs_div}.{format}"',
+        "X-Export-Total": str(len(companies))
+    }
+    if has_more:
+        headers["X-Next-Cursor"] = companies[-1]["stock_code"] if companies else cursor
+    
+    return StreamingResponse(body, media_type=media_type, headers=headers)
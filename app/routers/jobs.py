@@ -0,0 +1,100 @@
+"""
+비동기 작업(Job) API 엔드포인트
+"""
+from fastapi import APIRouter, Query, HTTPException
+from app.models import (
+    JobCreateRequest, JobStatusResponse, JobResultsResponse, JobResultItem, ErrorResponse
+)
+from app.services.jobs import job_manager
+from app.utils.job_store import job_store
+
+
+router = APIRouter(prefix="/api/v1/jobs", tags=["Jobs"])
+
+
+async def _get_status_or_404(job_id: str) -> dict:
+    """작업 상태 조회 (없으면 404)"""
+    job = await job_manager.get_status(job_id)
+    
+    if job is None:
+        raise HTTPException(
+            status_code=404,
+            detail={
+                "error": "JOB_NOT_FOUND",
+                "message": "작업을 찾을 수 없습니다.",
+                "detail": f"job_id={job_id}"
+            }
+        )
+    
+    return job
+
+
+@router.post(
+    "",
+    response_model=JobStatusResponse,
+    status_code=202,
+    summary="스크리닝 작업 등록",
+    description="""
+    시장 전체 규모의 EBITDA 스크리닝을 비동기 작업으로 등록합니다.
+    
+    - 주요계정 일괄 조회로 영업이익을 구한 뒤, 조건을 통과한 회사만 EBITDA를 상세 계산합니다.
+    - 작업은 서버 내부 작업자가 대량 작업 우선순위로 처리하므로 일반 API 요청을 지연시키지 않습니다.
+    - 진행 상황은 SQLite 에 기록되어 서버가 재시작되어도 끝난 항목을 다시 조회하지 않고 이어서 처리합니다.
+    - `companies` 를 생략하면 전체 상장사를 대상으로 합니다.
+    """
+)
+async def create_job(request: JobCreateRequest):
+    """스크리닝 작업 등록 API"""
+    
+    job_id = await job_manager.submit(request.model_dump())
+    return await _get_status_or_404(job_id)
+
+
+@router.get(
+    "/{job_id}",
+    response_model=JobStatusResponse,
+    responses={
+        404: {"model": ErrorResponse}
+    },
+    summary="작업 상태 조회"
+)
+async def get_job(job_id: str):
+    """작업 상태 조회 API"""
+    
+    return await _get_status_or_404(job_id)
+
+
+@router.get(
+    "/{job_id}/results",
+    response_model=JobResultsResponse,
+    responses={
+        404: {"model": ErrorResponse}
+    },
+    summary="작업 결과 페이지 조회",
+    description="""
+    작업 결과를 영업이익 순위 순으로 페이지 단위로 반환합니다.
+    
+    작업이 진행 중이어도 지금까지 기록된 결과를 조회할 수 있습니다.
+    """
+)
+async def get_job_results(
+    job_id: str,
+    page: int = Query(1, ge=1, description="페이지 번호 (1부터)"),
+    page_size: int = Query(100, ge=1, le=1000, description="페이지 크기")
+):
+    """작업 결과 페이지 조회 API"""
+    
+    job = await _get_status_or_404(job_id)
+    items = await job_store.get_results_page(job_id, page, page_size)
+    
+    return JobResultsResponse(
+        job_id=job_id,
+        status=job["status"],
+        page=page,
+        page_size=page_size,
+        total=job["progress"]["total"],
+        items=[
+            JobResultItem(index=item.pop("idx"), **item)
+            for item in items
+        ]
+    )
@@ -0,0 +1,143 @@
+"""
+재무제표 계정명 매칭 (키워드 사전 컴파일 / 단일 패스 검색)
+"""
+import re
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from app.models import AccountRow
+
+
+# 가운뎃점 변형 (ㆍ · ‧ • ∙ ⋅ ・ ･) 은 모두 "ㆍ" 로 통일
+MIDDLE_DOTS = "ㆍ·‧•∙⋅・･"
+
+# 괄호는 기호만 제거하고 내용은 남긴다 ("영업이익(손실)" -> "영업이익손실")
+BRACKETS = "()[]{}（）［］｛｝〔〕【】"
+
+_NORMALIZE_TABLE = str.maketrans(
+    {**{ch: "ㆍ" for ch in MIDDLE_DOTS}, **{ch: None for ch in BRACKETS}}
+)
+_WHITESPACE = re.compile(r"\s+")
+
+# 정규화한 계정명을 이어 붙일 때 쓰는 구분자 (정규화에 지워지지 않는 문자)
+SEPARATOR = "\x00"
+
+# 계정명 정규화 결과 캐시 (계정명 종류는 수천 개 수준)
+_normalized_cache: Dict[str, str] = {}
+MAX_NORMALIZED_CACHE = 8192
+
+_account_nm_of = itemgetter("account_nm")
+
+
+def normalize_account_name(name: str) -> str:
+    """계정명 정규화 (공백/괄호 제거, 가운뎃점 통일, 소문자)"""
+    if not name:
+        return ""
+    
+    normalized = _normalized_cache.get(name)
+    if normalized is None:
+        normalized = _WHITESPACE.sub("", name.translate(_NORMALIZE_TABLE)).lower()
+        if len(_normalized_cache) >= MAX_NORMALIZED_CACHE:
+            _normalized_cache.clear()
+        _normalized_cache[name] = normalized
+    return normalized
+
+
+def _normalize_all(names: List[str]) -> List[str]:
+    """계정명 일괄 정규화 (캐시 적중 시 C 레벨 조회만 수행)"""
+    normalized = list(map(_normalized_cache.get, names))
+    if None in normalized:
+        normalized = list(map(normalize_account_name, names))
+    return normalized
+
+
+class AccountMatcher:
+    """
+    구성요소별 키워드 매처
+    
+    키워드를 정규화한 조회 테이블(키워드 -> 구성요소)로 미리 컴파일해 두고,
+    계정 리스트를 한 번 훑어 정규화한 계정명을 이어 붙인 뒤
+    키워드별 부분 문자열 검색으로 모든 구성요소의 첫 매칭 계정을 한 번에 찾는다.
+    구성요소 우선순위는 등록 순서, 계정 우선순위는 리스트 순서를 따른다.
+    """
+    
+    def __init__(self, components: Sequence[Tuple[str, Sequence[str]]]):
+        """
+        Args:
+            components: (구성요소 이름, 키워드 리스트) 를 우선순위 순으로
+        """
+        self.components: List[str] = []
+        self._owners: Dict[str, List[str]] = {}
+        
+        for component, keywords in components:
+            self.components.append(component)
+            for keyword in map(normalize_account_name, keywords):
+                if not keyword:
+                    continue
+                owners = self._owners.setdefault(keyword, [])
+                if component not in owners:
+                    owners.append(component)
+    
+    def match_rows(
+        self,
+        accounts: List[Dict[str, Any]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        구성요소별 첫 매칭 계정 행 검색
+        
+        Args:
+            accounts: 계정 행 리스트
+        
+        Returns:
+            {구성요소 이름: 계정 행} (찾지 못한 구성요소는 제외)
+        """
+        try:
+            names = list(map(_account_nm_of, accounts))
+        except KeyError:
+            names = [acc.get("account_nm") or "" for acc in accounts]
+        
+        blob = SEPARATOR.join(_normalize_all(names))
+        
+        positions: Dict[str, int] = {}
+        
+        for keyword, components in self._owners.items():
+            pos = blob.find(keyword)
+            if pos < 0:
+                continue
+            
+            for component in components:
+                if positions.get(component, pos + 1) > pos:
+                    positions[component] = pos
+        
+        # 매칭 위치 앞의 구분자 수가 곧 계정 행 번호
+        return {
+            component: accounts[blob.count(SEPARATOR, 0, positions[component])]
+            for component in self.components
+            if component in positions
+        }
+    
+    def match(
+        self,
+        accounts: List[Dict[str, Any]]
+    ) -> Dict[str, AccountRow]:
+        """
+        구성요소별 첫 매칭 계정 검색
+        
+        Args:
+            accounts: 계정 행 리스트
+        
+        Returns:
+            {구성요소 이름: 계정} (찾지 못한 구성요소는 제외)
+        """
+        return {
+            component: AccountRow.from_row(row)
+            for component, row in self.match_rows(accounts).items()
+        }
+    
+    def first(self, accounts: List[Dict[str, Any]]) -> Optional[AccountRow]:
+        """우선순위가 가장 높은 구성요소의 매칭 계정"""
+        hits = self.match(accounts)
+        for component in self.components:
+            if component in hits:
+                return hits[component]
+        return None
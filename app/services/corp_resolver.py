@@ -1,14 +1,108 @@
 """
 corp_code 매핑 서비스 (corpCode.xml 처리)
 """
+import os
+import sys
+import shutil
 import zipfile
-import io
-from typing import Optional, Dict
+import asyncio
+from typing import Optional, Dict, List, Any, Callable, Set, Iterable
 from lxml import etree
 from pathlib import Path
 from datetime import datetime, timedelta
 from app.config import settings
 from app.services.dart_client import dart_client, DartAPIError
+from app.services.corp_search import CorpSearchEngine
+from app.utils.cache import corp_code_snapshot, LRUCache
+from app.utils.deadline import wait_detached
+
+
+# resolve 캐시 미적중 표시 (None 은 NOT_FOUND 결과로 캐싱)
+_MISS = object()
+
+# 회사를 찾지 못했을 때 함께 알려줄 후보 수
+SUGGESTION_LIMIT = 5
+
+
+class CompanyNotFound(DartAPIError):
+    """검색어로 회사를 하나로 정할 수 없음 (비슷한 회사 후보 포함)"""
+    
+    def __init__(self, query: str, suggestions: List[Dict[str, Any]]):
+        self.suggestions = [
+            {
+                "corp_code": item["corp_code"],
+                "corp_name": item["corp_name"],
+                "stock_code": item.get("stock_code")
+            }
+            for item in suggestions
+        ]
+        message = (
+            f"'{query}'에 해당하는 회사를 찾을 수 없습니다. "
+            "정확한 회사명 또는 6자리 종목코드를 입력해주세요."
+        )
+        if self.suggestions:
+            names = ", ".join(
+                f"{item['corp_name']}({item['stock_code'] or item['corp_code']})"
+                for item in self.suggestions
+            )
+            message += f" 비슷한 회사: {names}"
+        super().__init__("NOT_FOUND", message)
+
+
+class CorpRecord:
+    """
+    고유번호 레코드
+    
+    10만 건 규모로 유지되므로 dict 대신 __slots__ 객체로 저장하고,
+    반복되는 문자열(modify_date 등)은 intern 하여 공유한다.
+    """
+    
+    __slots__ = ("corp_code", "corp_name", "stock_code", "modify_date")
+    
+    def __init__(
+        self,
+        corp_code: str,
+        corp_name: str,
+        stock_code: Optional[str],
+        modify_date: str
+    ):
+        self.corp_code = corp_code
+        self.corp_name = corp_name
+        self.stock_code = stock_code
+        self.modify_date = modify_date
+    
+    @property
+    def is_listed(self) -> bool:
+        """상장사 여부 (종목코드 보유)"""
+        return self.stock_code is not None
+    
+    def same_as(self, other: "CorpRecord") -> bool:
+        """모든 필드 동일 여부"""
+        return (
+            self.modify_date == other.modify_date
+            and self.corp_name == other.corp_name
+            and self.stock_code == other.stock_code
+        )
+    
+    def as_row(self):
+        """스냅샷 저장용 튜플"""
+        return (self.corp_code, self.corp_name, self.stock_code, self.modify_date)
+    
+    def sort_key(self):
+        """동일 회사명 내 우선순위 (상장사 → 고유번호 순)"""
+        return (not self.is_listed, self.corp_code)
+    
+    def to_dict(self) -> Dict[str, Optional[str]]:
+        """API 응답용 딕셔너리 변환"""
+        return {
+            "corp_code": self.corp_code,
+            "corp_name": self.corp_name,
+            "stock_code": self.stock_code,
+            "modify_date": self.modify_date
+        }
+    
+    def __repr__(self) -> str:
+        return f"CorpRecord({self.corp_code}, {self.corp_name}, {self.stock_code})"
 
 
 class CorpResolver:
@@ -16,134 +110,93 @@ class CorpResolver:
     
     def __init__(self):
         self.cache_file = settings.cache_dir / "corp_code.xml"
-        self.mapping: Optional[Dict[str, Dict[str, str]]] = None
+        self.mapping: Optional[Dict[str, Dict[str, Any]]] = None
         self._cache_expiry_days = 30
+        self._search_engine: Optional[CorpSearchEngine] = None
+        self._load_lock = asyncio.Lock()
+        self._change_listeners: List[Callable[[Set[str]], None]] = []
+        self.last_delta: Optional[Dict[str, int]] = None
+        self._resolve_cache = LRUCache(settings.resolve_cache_size)
     
-    def _is_cache_valid(self) -> bool:
-        """캐시 파일 유효성 검사"""
-        if not self.cache_file.exists():
+    async def _is_cache_valid(self) -> bool:
+        """스냅샷 유효성 검사 (마지막 갱신 후 경과 기간)"""
+        refreshed_at = await corp_code_snapshot.get_refreshed_at()
+        if refreshed_at is None:
             return False
         
-        # 파일 수정 시간 확인
-        mtime = datetime.fromtimestamp(self.cache_file.stat().st_mtime)
-        age = datetime.now() - mtime
+        age = datetime.now() - refreshed_at
         
         return age < timedelta(days=self._cache_expiry_days)
     
+    def add_change_listener(self, listener: Callable[[Set[str]], None]):
+        """
+        회사 정보 변경 리스너 등록
+        
+        갱신 시 회사명 변경/상장폐지/삭제된 corp_code 집합으로 호출된다.
+        회사명·종목코드에 의존하는 캐시는 이 리스너로 무효화한다.
+        """
+        self._change_listeners.append(listener)
+    
+    def _extract_zip_member(self, zip_path: Path):
+        """ZIP 안의 corpCode.xml 을 청크 단위로 캐시 파일에 추출"""
+        with zipfile.ZipFile(zip_path, 'r') as zip_file:
+            names = zip_file.namelist()
+            
+            # CORPCODE.xml 또는 corpCode.xml 파일명 시도
+            xml_filename = next(
+                (name for name in names if name.lower() == "corpcode.xml"),
+                next((name for name in names if name.lower().endswith(".xml")), None)
+            )
+            
+            if not xml_filename:
+                raise DartAPIError(
+                    "INVALID_RESPONSE",
+                    f"ZIP 파일에 XML 파일이 없습니다. 포함된 파일: {', '.join(names)}"
+                )
+            
+            tmp_path = self.cache_file.with_suffix(".tmp")
+            with zip_file.open(xml_filename) as src, open(tmp_path, "wb") as dst:
+                shutil.copyfileobj(src, dst, settings.download_chunk_size)
+            os.replace(tmp_path, self.cache_file)
+            
+            print(f"[CorpResolver] ZIP에서 {xml_filename} 추출 완료")
+    
     async def _download_and_extract(self):
-        """corpCode.xml 다운로드 및 추출 (ZIP 또는 직접 XML 지원)"""
+        """
+        corpCode.xml 다운로드 및 추출 (ZIP 또는 직접 XML 지원)
+        
+        응답을 임시 파일로 스트리밍 저장한 뒤 ZIP 멤버를 디스크로 바로 추출하므로
+        전체 응답이 메모리에 올라가지 않는다.
+        """
         print("[CorpResolver] corpCode.xml 다운로드 중...")
         
-        import json
+        download_path = self.cache_file.with_suffix(".download")
         
         try:
-            # 데이터 다운로드
-            response_data = await dart_client.get_corp_code_xml()
-            
-            # 1. JSON 에러 응답 확인
-            if response_data.startswith(b'{'):
-                try:
-                    error_data = json.loads(response_data.decode('utf-8'))
-                    error_msg = error_data.get('message', '알 수 없는 에러')
-                    raise DartAPIError(
-                        error_data.get('status', 'UNKNOWN'),
-                        f"corpCode.xml 다운로드 실패: {error_msg}"
-                    )
-                except (json.JSONDecodeError, UnicodeDecodeError):
-                    pass  # JSON이 아닐 수 있음
-            
-            # 2. ZIP 파일인 경우 (ZIP 파일은 PK로 시작하고 zipfile로 확인)
-            xml_data = None
-            # ZIP 파일 여부를 안전하게 확인
-            is_zip = False
-            if response_data.startswith(b'PK'):
-                try:
-                    # zipfile.is_zipfile()로 실제 ZIP 파일인지 확인
-                    zip_buffer = io.BytesIO(response_data)
-                    is_zip = zipfile.is_zipfile(zip_buffer)
-                except Exception:
-                    is_zip = False
+            # 임시 파일로 스트리밍 다운로드
+            size = await dart_client.download_corp_code_xml(download_path)
+            print(f"[CorpResolver] 다운로드 완료 ({size:,} bytes)")
             
-            if is_zip:
-                try:
-                    # ZIP 압축 해제 시도
-                    zip_buffer = io.BytesIO(response_data)
-                    with zipfile.ZipFile(zip_buffer, 'r') as zip_file:
-                        # CORPCODE.xml 또는 corpCode.xml 파일명 시도
-                        xml_filename = None
-                        for name in ["CORPCODE.xml", "corpCode.xml", "CORPCODE.XML"]:
-                            if name in zip_file.namelist():
-                                xml_filename = name
-                                break
-                        
-                        if xml_filename:
-                            xml_data = zip_file.read(xml_filename)
-                            print(f"[CorpResolver] ZIP에서 {xml_filename} 추출 완료")
-                        else:
-                            # ZIP 내 파일 목록 출력
-                            available_files = ", ".join(zip_file.namelist())
-                            raise DartAPIError(
-                                "INVALID_RESPONSE",
-                                f"ZIP 파일에 XML 파일이 없습니다. 포함된 파일: {available_files}"
-                            )
-                except (zipfile.BadZipFile, zipfile.LargeZipFile, ValueError, OSError) as e:
-                    # ZIP 파싱 실패 - XML로 처리 시도
-                    print(f"[CorpResolver] ZIP 파싱 실패 (응답이 ZIP이 아닐 수 있음): {type(e).__name__} - {str(e)}")
-                    xml_data = None  # XML로 처리하도록 계속 진행
-                except Exception as e:
-                    # 모든 예외를 잡아서 XML로 처리 시도
-                    print(f"[CorpResolver] ZIP 처리 중 예외 발생 ({type(e).__name__}): {str(e)}")
-                    xml_data = None
-            
-            # 3. 직접 XML인 경우 (<?xml 또는 <로 시작)
-            if xml_data is None:
-                xml_start_markers = [b'<?xml', b'<result', b'<list', b'<corpCode', b'<corp_code', b'<']
-                response_stripped = response_data.strip()
-                is_xml = any(response_stripped.startswith(marker) for marker in xml_start_markers)
-                
-                # XML로 보이지만 확실하지 않은 경우, XML 파싱 시도
-                if not is_xml and len(response_data) > 0:
-                    # 첫 100바이트에 '<' 문자가 있으면 XML일 가능성
-                    try:
-                        first_bytes = response_data[:100]
-                        if b'<' in first_bytes:
-                            # lxml로 파싱 시도하여 XML인지 확인
-                            try:
-                                etree.fromstring(response_data)
-                                is_xml = True
-                                print("[CorpResolver] XML 파싱으로 형식 확인됨")
-                            except etree.XMLSyntaxError:
-                                pass  # XML이 아님
-                    except Exception:
-                        pass
-                
-                if is_xml:
-                    # 직접 XML 데이터로 저장
-                    xml_data = response_data
-                    print("[CorpResolver] 직접 XML 형식으로 저장")
-                else:
-                    # XML도 아닌 경우 에러
-                    # 응답의 처음 200바이트만 확인용으로 출력
-                    try:
-                        preview = response_data[:200].decode('utf-8', errors='replace')
-                    except:
-                        preview = str(response_data[:50])
-                    raise DartAPIError(
-                        "INVALID_RESPONSE",
-                        f"corpCode.xml 응답 형식을 확인할 수 없습니다. "
-                        f"응답 시작 부분: {preview[:100]}..."
-                    )
+            with open(download_path, "rb") as f:
+                head = f.read(256)
             
-            # XML 데이터 저장
-            if xml_data:
-                self.cache_file.write_bytes(xml_data)
-                print(f"[CorpResolver] corpCode.xml 저장 완료: {self.cache_file}")
+            if zipfile.is_zipfile(download_path):
+                # ZIP 압축 해제 (블로킹 I/O 는 스레드에서 실행)
+                await asyncio.to_thread(self._extract_zip_member, download_path)
+            elif head.lstrip().startswith(b'<'):
+                # 직접 XML 데이터로 저장
+                os.replace(download_path, self.cache_file)
+                print("[CorpResolver] 직접 XML 형식으로 저장")
             else:
+                preview = head[:100].decode('utf-8', errors='replace')
                 raise DartAPIError(
                     "INVALID_RESPONSE",
-                    "corpCode.xml 파일을 저장할 수 없습니다."
+                    f"corpCode.xml 응답 형식을 확인할 수 없습니다. "
+                    f"응답 시작 부분: {preview}..."
                 )
             
+            print(f"[CorpResolver] corpCode.xml 저장 완료: {self.cache_file}")
+            
         except DartAPIError:
             # DartAPIError는 그대로 전파
             raise
@@ -152,52 +205,205 @@ class CorpResolver:
                 "DOWNLOAD_ERROR",
                 f"corpCode.xml 다운로드 중 오류 발생: {str(e)}"
             )
+        finally:
+            download_path.unlink(missing_ok=True)
     
-    def _parse_xml(self) -> Dict[str, Dict[str, str]]:
+    def _parse_xml(self) -> Dict[str, CorpRecord]:
         """
-        XML 파싱 및 매핑 딕셔너리 생성
+        XML 파싱
         
         Returns:
-            {
-                "corp_name": {...},
-                "stock_code": {...}
-            }
+            {고유번호: CorpRecord}
         """
-        mapping = {
-            "corp_name": {},
-            "stock_code": {}
-        }
-        
-        # XML 파싱
-        tree = etree.parse(str(self.cache_file))
-        root = tree.getroot()
+        records = {}
         
-        for company in root.findall("list"):
-            corp_code = company.findtext("corp_code", "").strip()
-            corp_name = company.findtext("corp_name", "").strip()
-            stock_code = company.findtext("stock_code", "").strip()
-            modify_date = company.findtext("modify_date", "").strip()
+        # 전체 트리를 메모리에 올리지 않도록 <list> 단위로 스트리밍 파싱
+        for _, company in etree.iterparse(str(self.cache_file), tag="list"):
+            corp_code = (company.findtext("corp_code") or "").strip()
+            corp_name = (company.findtext("corp_name") or "").strip()
+            stock_code = (company.findtext("stock_code") or "").strip()
+            modify_date = (company.findtext("modify_date") or "").strip()
+            
+            # 처리한 요소 해제
+            company.clear()
+            while company.getprevious() is not None:
+                del company.getparent()[0]
             
             if not corp_code:
                 continue
             
-            corp_data = {
-                "corp_code": corp_code,
-                "corp_name": corp_name,
-                "stock_code": stock_code if stock_code else None,
-                "modify_date": modify_date
+            records[corp_code] = CorpRecord(
+                corp_code=corp_code,
+                corp_name=sys.intern(corp_name),
+                stock_code=stock_code if stock_code else None,
+                modify_date=sys.intern(modify_date)
+            )
+        
+        return records
+    
+    @staticmethod
+    def _empty_mapping() -> Dict[str, Dict[str, Any]]:
+        """
+        빈 매핑 딕셔너리
+        
+        Returns:
+            {
+                "corp_name": {소문자 회사명: (CorpRecord, ...)},  # 상장사 우선 정렬
+                "stock_code": {종목코드: CorpRecord},
+                "corp_code": {고유번호: CorpRecord}
             }
-            
-            # 회사명으로 매핑
-            if corp_name:
-                mapping["corp_name"][corp_name.lower()] = corp_data
-            
-            # 종목코드로 매핑 (상장사만)
-            if stock_code:
-                mapping["stock_code"][stock_code] = corp_data
+        """
+        return {
+            "corp_name": {},
+            "stock_code": {},
+            "corp_code": {}
+        }
+    
+    @staticmethod
+    def _name_key(record: CorpRecord) -> str:
+        """회사명 매핑 키 (한글 회사명은 소문자 변환 결과 대신 원본 문자열 공유)"""
+        name_key = record.corp_name.lower()
+        return record.corp_name if name_key == record.corp_name else name_key
+    
+    def _index_add(self, mapping: Dict[str, Dict[str, Any]], record: CorpRecord):
+        """매핑에 레코드 추가"""
+        mapping["corp_code"][record.corp_code] = record
+        
+        # 회사명으로 매핑 (동명 회사는 모두 보관)
+        if record.corp_name:
+            name_key = self._name_key(record)
+            records = mapping["corp_name"].get(name_key, ()) + (record,)
+            if len(records) > 1:
+                records = tuple(sorted(records, key=CorpRecord.sort_key))
+            mapping["corp_name"][name_key] = records
+        
+        # 종목코드로 매핑 (상장사만)
+        if record.stock_code:
+            mapping["stock_code"][record.stock_code] = record
+    
+    def _index_remove(self, mapping: Dict[str, Dict[str, Any]], record: CorpRecord):
+        """매핑에서 레코드 제거"""
+        mapping["corp_code"].pop(record.corp_code, None)
         
+        if record.corp_name:
+            name_key = self._name_key(record)
+            records = tuple(
+                r for r in mapping["corp_name"].get(name_key, ())
+                if r.corp_code != record.corp_code
+            )
+            if records:
+                mapping["corp_name"][name_key] = records
+            else:
+                mapping["corp_name"].pop(name_key, None)
+        
+        if record.stock_code and mapping["stock_code"].get(record.stock_code) is record:
+            del mapping["stock_code"][record.stock_code]
+    
+    def _build_mapping(self, records: Iterable[CorpRecord]) -> Dict[str, Dict[str, Any]]:
+        """레코드 목록으로 매핑 딕셔너리 생성"""
+        mapping = self._empty_mapping()
+        for record in records:
+            self._index_add(mapping, record)
         return mapping
     
+    async def _load_snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """SQLite 스냅샷에서 매핑 복원 (스냅샷이 없으면 빈 매핑)"""
+        rows = await corp_code_snapshot.load()
+        return self._build_mapping(
+            CorpRecord(
+                corp_code=corp_code,
+                corp_name=sys.intern(corp_name),
+                stock_code=stock_code,
+                modify_date=sys.intern(modify_date)
+            )
+            for corp_code, corp_name, stock_code, modify_date in rows
+        )
+    
+    async def refresh(self) -> Dict[str, int]:
+        """
+        corpCode.xml 재다운로드 후 변경분만 반영
+        
+        corp_code/modify_date 기준으로 현재 매핑과 비교하여
+        추가/수정/삭제된 레코드만 매핑과 스냅샷에 적용한다.
+        
+        Returns:
+            변경 건수 {"inserted", "updated", "deleted", "renamed", "delisted"}
+        
+        Raises:
+            DartAPIError: 다운로드 실패 또는 삭제가 비정상적으로 많은 경우 (매핑/스냅샷은 그대로)
+        """
+        if self.mapping is None:
+            self.mapping = await self._load_snapshot()
+        
+        await self._download_and_extract()
+        new_records = self._parse_xml()
+        current = self.mapping["corp_code"]
+        
+        inserts = [r for code, r in new_records.items() if code not in current]
+        updates = [
+            (current[code], r) for code, r in new_records.items()
+            if code in current and not current[code].same_as(r)
+        ]
+        deletes = [r for code, r in current.items() if code not in new_records]
+        
+        # 상장폐지 등으로 빠지는 회사는 소수이므로, 대량 삭제는 잘리거나 깨진 다운로드로 본다
+        # (매핑과 스냅샷은 그대로 두고, 호출한 쪽은 기존 스냅샷을 계속 사용)
+        max_deletes = int(len(current) * settings.corp_refresh_max_delete_ratio)
+        if current and len(deletes) > max_deletes:
+            raise DartAPIError(
+                "INVALID_RESPONSE",
+                f"corpCode.xml 회사 수가 비정상적으로 줄었습니다 "
+                f"(현재 {len(current):,}개, 새 목록 {len(new_records):,}개, 삭제 {len(deletes):,}건). "
+                f"변경분을 반영하지 않습니다."
+            )
+        
+        # 회사명/종목코드에 의존하는 캐시 무효화 대상
+        renamed = {new.corp_code for old, new in updates if old.corp_name != new.corp_name}
+        delisted = {
+            new.corp_code for old, new in updates
+            if old.stock_code and old.stock_code != new.stock_code
+        }
+        delisted.update(r.corp_code for r in deletes if r.stock_code)
+        affected = renamed | delisted | {r.corp_code for r in deletes}
+        
+        # 매핑 반영
+        for record in deletes:
+            self._index_remove(self.mapping, record)
+        for old, new in updates:
+            self._index_remove(self.mapping, old)
+            self._index_add(self.mapping, new)
+        for record in inserts:
+            self._index_add(self.mapping, record)
+        
+        # 스냅샷 반영
+        await corp_code_snapshot.apply_delta(
+            [r.as_row() for r in inserts] + [new.as_row() for _, new in updates],
+            [r.corp_code for r in deletes]
+        )
+        
+        delta = {
+            "inserted": len(inserts),
+            "updated": len(updates),
+            "deleted": len(deletes),
+            "renamed": len(renamed),
+            "delisted": len(delisted)
+        }
+        self.last_delta = delta
+        
+        if inserts or updates or deletes:
+            self._search_engine = None
+            self._resolve_cache.clear()
+        
+        if affected:
+            for listener in self._change_listeners:
+                listener(affected)
+        
+        print(f"[CorpResolver] 변경분 반영: 추가 {delta['inserted']}건, "
+              f"수정 {delta['updated']}건 (회사명 변경 {delta['renamed']}건, "
+              f"상장폐지 {delta['delisted']}건), 삭제 {delta['deleted']}건")
+        
+        return delta
+    
     async def load_mapping(self, force_reload: bool = False):
         """
         매핑 데이터 로드
@@ -208,17 +414,156 @@ class CorpResolver:
         if self.mapping and not force_reload:
             return
         
-        # 캐시 유효성 검사
-        if force_reload or not self._is_cache_valid():
-            await self._download_and_extract()
-        
-        # XML 파싱
-        self.mapping = self._parse_xml()
+        # 로드/갱신은 여러 요청이 공유하므로 한 요청의 마감 때문에 중단하지 않고,
+        # 호출한 요청만 자신의 마감까지 기다린다
+        await wait_detached(self._load_mapping(force_reload))
+    
+    async def _load_mapping(self, force_reload: bool):
+        """매핑 로드 (스냅샷 복원 및 만료 시 갱신)"""
+        async with self._load_lock:
+            # 대기 중 다른 요청이 이미 로드한 경우
+            if self.mapping and not force_reload:
+                return
+            
+            # 스냅샷 복원
+            if self.mapping is None:
+                self.mapping = await self._load_snapshot()
+                self._resolve_cache.clear()
+            
+            # 만료 시 변경분만 갱신
+            if force_reload or not await self._is_cache_valid():
+                try:
+                    await self.refresh()
+                except DartAPIError as e:
+                    if not self.mapping["corp_code"]:
+                        self.mapping = None
+                        raise
+                    print(f"[CorpResolver] 갱신 실패, 기존 스냅샷 사용: {e.message}")
         
         print(f"[CorpResolver] 매핑 완료: "
+              f"회사 {len(self.mapping['corp_code'])}개, "
               f"회사명 {len(self.mapping['corp_name'])}개, "
               f"종목코드 {len(self.mapping['stock_code'])}개")
     
+    def _get_search_engine(self) -> CorpSearchEngine:
+        """검색 인덱스 반환 (매핑 로드 후 최초 사용 시 생성)"""
+        if self._search_engine is None:
+            engine = CorpSearchEngine()
+            engine.build(self.mapping["corp_code"].values())
+            self._search_engine = engine
+            print(f"[CorpResolver] 검색 인덱스 생성 완료: {len(engine)}개")
+        return self._search_engine
+    
+    async def search(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        회사명 후보 검색 (초성, 부분 음절, 오타 허용)
+        
+        Args:
+            query: 검색어 (예: 'ㅅㅅㅈㅈ', '삼성전ㅈ', '삼송전자')
+            limit: 최대 반환 개수
+        
+        Returns:
+            우선순위 순 회사 정보 리스트 (match_type, distance 포함)
+        """
+        await self.load_mapping()
+        return self._get_search_engine().search(query, limit)
+    
+    async def suggest(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        자동완성 후보 검색 (접두 일치, 상장사/종목코드 우선)
+        
+        Args:
+            query: 입력 중인 회사명, 초성 또는 종목코드
+            limit: 최대 반환 개수
+        
+        Returns:
+            회사 정보 리스트
+        """
+        await self.load_mapping()
+        return self._get_search_engine().suggest(query, limit)
+    
+    async def get_by_corp_code(self, corp_code: str) -> Optional[CorpRecord]:
+        """고유번호로 회사 레코드 조회 (없으면 None)"""
+        await self.load_mapping()
+        return self.mapping["corp_code"].get(corp_code)
+    
+    async def listed_companies(self) -> List[Dict[str, Optional[str]]]:
+        """전체 상장사 목록 (종목코드 순)"""
+        await self.load_mapping()
+        return [
+            self.mapping["stock_code"][stock_code].to_dict()
+            for stock_code in sorted(self.mapping["stock_code"])
+        ]
+    
+    def resolve_cache_stats(self) -> Dict[str, Any]:
+        """resolve 캐시 적중률 집계"""
+        return self._resolve_cache.stats()
+    
+    @staticmethod
+    def _unambiguous(records: List[CorpRecord]) -> Optional[CorpRecord]:
+        """동명 회사 중 하나로 정해지는 경우의 레코드 (한 건뿐이거나 상장사가 하나뿐일 때)"""
+        if len(records) == 1:
+            return records[0]
+        listed = [record for record in records if record.is_listed]
+        return listed[0] if len(listed) == 1 else None
+    
+    def _lookup(self, key: str) -> Optional[CorpRecord]:
+        """
+        정규화된 검색어로 매핑 조회 (매핑이 로드된 상태에서 호출)
+        
+        종목코드 또는 회사명 정확 일치(공백/법인 표기 무시)로 하나로 정해질 때만 반환한다.
+        부분 일치나 오타 허용 후보는 다른 회사일 수 있으므로 자동으로 고르지 않는다.
+        
+        Args:
+            key: 앞뒤 공백 제거 + 소문자 변환된 검색어
+        
+        Returns:
+            회사 레코드 또는 None
+        """
+        # 종목코드로 검색 (숫자 6자리)
+        if key.isdigit() and len(key) == 6:
+            record = self.mapping["stock_code"].get(key)
+            if record:
+                return record
+        
+        # 회사명으로 검색 (대소문자 무시, 동명 회사는 상장사가 하나뿐일 때만)
+        records = self.mapping["corp_name"].get(key)
+        if records:
+            return self._unambiguous(records)
+        
+        # 공백/법인 표기를 무시한 정확 일치
+        return self._unambiguous(self._get_search_engine().exact_matches(key))
+    
+    def _resolve_cached(self, query: str) -> Optional[CorpRecord]:
+        """resolve 캐시를 거친 매핑 조회 (NOT_FOUND 결과도 캐싱)"""
+        key = query.strip().lower()
+        
+        record = self._resolve_cache.get(key, _MISS)
+        if record is _MISS:
+            record = self._lookup(key) if key else None
+            self._resolve_cache.set(key, record)
+        
+        return record
+    
+    async def resolve_many(self, queries: List[str]) -> List[Optional[Dict[str, str]]]:
+        """
+        여러 검색어를 한 번에 변환 (입력 순서 유지)
+        
+        Args:
+            queries: 회사명 또는 종목코드 리스트
+        
+        Returns:
+            검색어별 회사 정보 딕셔너리 (찾지 못하면 None)
+        """
+        # 매핑 로드
+        await self.load_mapping()
+        
+        results = []
+        for query in queries:
+            record = self._resolve_cached(query)
+            results.append(record.to_dict() if record else None)
+        return results
+    
     async def resolve(self, query: str) -> Dict[str, str]:
         """
         회사명 또는 종목코드로 corp_code 검색
@@ -235,29 +580,12 @@ class CorpResolver:
         # 매핑 로드
         await self.load_mapping()
         
-        # 종목코드로 검색 (숫자 6자리)
-        if query.isdigit() and len(query) == 6:
-            corp_data = self.mapping["stock_code"].get(query)
-            if corp_data:
-                return corp_data
-        
-        # 회사명으로 검색 (대소문자 무시)
-        corp_data = self.mapping["corp_name"].get(query.lower())
-        if corp_data:
-            return corp_data
-        
-        # 부분 일치 검색 (회사명)
-        query_lower = query.lower()
-        for name, data in self.mapping["corp_name"].items():
-            if query_lower in name or name in query_lower:
-                return data
-        
-        # 찾지 못함
-        raise DartAPIError(
-            "NOT_FOUND",
-            f"'{query}'에 해당하는 회사를 찾을 수 없습니다. "
-            "정확한 회사명 또는 6자리 종목코드를 입력해주세요."
-        )
+        record = self._resolve_cached(query)
+        if record:
+            return record.to_dict()
+        
+        # 찾지 못함 (후보는 알려주되 고르지는 않는다)
+        raise CompanyNotFound(query, self._get_search_engine().search(query, SUGGESTION_LIMIT))
 
 
 # 싱글톤 인스턴스
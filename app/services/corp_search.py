@@ -0,0 +1,463 @@
+"""
+한글 인식 회사명 검색 엔진 (자모 분해 / 초성 / 오타 허용 검색)
+"""
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import combinations
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+
+# 한글 음절 (가 ~ 힣) 분해용 테이블
+HANGUL_BASE = 0xAC00
+HANGUL_COUNT = 11172
+
+CHOSUNG = [
+    "ㄱ", "ㄲ", "ㄴ", "ㄷ", "ㄸ", "ㄹ", "ㅁ", "ㅂ", "ㅃ", "ㅅ",
+    "ㅆ", "ㅇ", "ㅈ", "ㅉ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ"
+]
+
+# 복합 모음/받침은 입력 순서대로 풀어서 저장 ("갈ㅂ" 입력 중 "갋" 이 "갈바" 와 일치하도록)
+JUNGSUNG = [
+    "ㅏ", "ㅐ", "ㅑ", "ㅒ", "ㅓ", "ㅔ", "ㅕ", "ㅖ", "ㅗ", "ㅗㅏ",
+    "ㅗㅐ", "ㅗㅣ", "ㅛ", "ㅜ", "ㅜㅓ", "ㅜㅔ", "ㅜㅣ", "ㅠ", "ㅡ", "ㅡㅣ",
+    "ㅣ"
+]
+
+JONGSUNG = [
+    "", "ㄱ", "ㄲ", "ㄱㅅ", "ㄴ", "ㄴㅈ", "ㄴㅎ", "ㄷ", "ㄹ", "ㄹㄱ",
+    "ㄹㅁ", "ㄹㅂ", "ㄹㅅ", "ㄹㅌ", "ㄹㅍ", "ㄹㅎ", "ㅁ", "ㅂ", "ㅂㅅ", "ㅅ",
+    "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ"
+]
+
+# 낱자(호환 자모)로 입력된 복합 자모 분해
+COMPAT_JAMO = {
+    "ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ",
+    "ㄼ": "ㄹㅂ", "ㄽ": "ㄹㅅ", "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ",
+    "ㅄ": "ㅂㅅ", "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ", "ㅝ": "ㅜㅓ",
+    "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ"
+}
+
+CHOSUNG_SET = frozenset(CHOSUNG)
+
+# 회사명 앞뒤의 법인 형태 표기 (정확 일치 비교 시 무시)
+LEGAL_MARKERS = ("주식회사", "(주)", "㈜")
+
+# 인덱스 문자열 구분자 (회사명에 등장하지 않는 문자)
+SEPARATOR = "\n"
+
+
+def normalize_name(name: str) -> str:
+    """검색용 회사명 정규화 (소문자, 공백 제거)"""
+    return "".join(name.lower().split())
+
+
+def strip_legal_suffix(name: str) -> str:
+    """정규화된 회사명에서 법인 형태 표기 제거 (예: "(주)삼성전자" → "삼성전자")"""
+    for marker in LEGAL_MARKERS:
+        if name.startswith(marker) and len(name) > len(marker):
+            name = name[len(marker):]
+        if name.endswith(marker) and len(name) > len(marker):
+            name = name[:-len(marker)]
+    return name
+
+
+def decompose(text: str) -> str:
+    """
+    문자열을 한글 자모 단위로 분해
+    
+    예: "삼성" → "ㅅㅏㅁㅅㅓㅇ"
+    """
+    result = []
+    for ch in text:
+        code = ord(ch) - HANGUL_BASE
+        if 0 <= code < HANGUL_COUNT:
+            result.append(CHOSUNG[code // 588])
+            result.append(JUNGSUNG[(code % 588) // 28])
+            result.append(JONGSUNG[code % 28])
+        else:
+            result.append(COMPAT_JAMO.get(ch, ch))
+    return "".join(result)
+
+
+def extract_chosung(text: str) -> str:
+    """
+    문자열의 초성 추출 (한글 이외 문자는 그대로 유지)
+    
+    예: "SK하이닉스" → "skㅎㅇㄴㅅ"
+    """
+    result = []
+    for ch in text:
+        code = ord(ch) - HANGUL_BASE
+        if 0 <= code < HANGUL_COUNT:
+            result.append(CHOSUNG[code // 588])
+        else:
+            result.append(ch)
+    return "".join(result)
+
+
+def is_chosung_query(text: str) -> bool:
+    """초성으로만 이루어진 검색어인지 확인"""
+    return bool(text) and all(ch in CHOSUNG_SET for ch in text)
+
+
+def bounded_prefix_distance(query: str, target: str, max_distance: int) -> int:
+    """
+    검색어와 대상 문자열 접두부 사이의 최소 편집 거리
+    
+    입력 중인 검색어가 회사명 앞부분과 오타 범위 내에서 일치하는지 판단한다.
+    max_distance 를 넘는 순간 계산을 중단하고 max_distance + 1 을 반환한다.
+    """
+    previous = list(range(len(target) + 1))
+    for i, q_ch in enumerate(query, 1):
+        current = [i]
+        row_min = i
+        for j, t_ch in enumerate(target, 1):
+            value = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (q_ch != t_ch)
+            )
+            current.append(value)
+            if value < row_min:
+                row_min = value
+        if row_min > max_distance:
+            return max_distance + 1
+        previous = current
+    return min(previous)
+
+
+class CorpSearchEngine:
+    """
+    회사명 검색 인덱스
+    
+    회사명을 자모 분해 문자열과 초성 문자열로 변환해 각각 하나의 긴 문자열로
+    이어 붙여 두고, str.find (C 구현) 로 접두/부분 일치를 찾는다.
+    오타 허용 검색은 (글자 위치, 글자) → 레코드 집합 인덱스로 후보를 좁힌다:
+    오타 k 개는 최대 k 글자를 바꾸고 나머지 글자를 최대 k 칸 밀므로, 검색어 n 글자 중
+    n-k 글자가 ±k 칸 안에 있는 회사명만 집합 합/교집합(C 구현)으로 구한 뒤
+    제한 편집 거리로 검증한다.
+    BK-tree 는 10만 건 기준 생성에 수십 초, 조회에 수십 ms 가 걸려 사용하지 않는다.
+    """
+    
+    # 결과 정렬 순위 (작을수록 우선)
+    MATCH_RANK = {
+        "exact": 0,
+        "prefix": 1,
+        "chosung_prefix": 2,
+        "partial": 3,
+        "contained": 4,
+        "chosung": 5,
+        "fuzzy": 6
+    }
+    
+    # 부분 일치 후보 최대 수집 개수 (짧은 검색어 과다 매칭 방지)
+    MAX_SCAN_HITS = 2000
+    
+    # 오타 검색용 위치 인덱스에 포함할 회사명 앞부분 글자 수
+    MAX_FUZZY_CHARS = 12
+    
+    # 검색어 안에 포함된 회사명 탐색 시 최대 검색어 길이
+    MAX_CONTAINED_CHARS = 40
+    
+    def __init__(self):
+        self._records: List[Dict[str, Any]] = []
+        self._names: List[str] = []
+        self._jamo: List[str] = []
+        self._jamo_blob = ""
+        self._jamo_starts: List[int] = []
+        self._chosung_blob = ""
+        self._chosung_starts: List[int] = []
+        self._exact: Dict[str, List[int]] = {}
+        self._positions: Dict[Tuple[int, str], Set[int]] = {}
+        # 자동완성용 정렬 배열 (상장사 / 비상장사 분리, 키 배열 + 레코드 번호 배열)
+        self._suggest_arrays: Dict[str, Tuple[List[str], array]] = {}
+    
+    def __len__(self) -> int:
+        return len(self._records)
+    
+    @staticmethod
+    def _join(parts: List[str]) -> Tuple[str, List[int]]:
+        """문자열 목록을 구분자로 이어 붙이고 각 시작 위치 반환"""
+        starts = []
+        position = len(SEPARATOR)
+        for part in parts:
+            starts.append(position)
+            position += len(part) + len(SEPARATOR)
+        blob = SEPARATOR + SEPARATOR.join(parts) + SEPARATOR
+        return blob, starts
+    
+    def build(self, records: Iterable[Dict[str, Any]]):
+        """
+        검색 인덱스 생성
+        
+        Args:
+            records: corp_code/corp_name/stock_code 속성을 가진 회사 레코드
+        """
+        self._records = [r for r in records if r.corp_name]
+        self._names = [normalize_name(r.corp_name) for r in self._records]
+        self._jamo = [decompose(name) for name in self._names]
+        self._jamo_blob, self._jamo_starts = self._join(self._jamo)
+        self._chosung_blob, self._chosung_starts = self._join(
+            [extract_chosung(name) for name in self._names]
+        )
+        
+        self._exact = {}
+        self._positions = {}
+        for idx, name in enumerate(self._names):
+            self._exact.setdefault(strip_legal_suffix(name), []).append(idx)
+            for position, ch in enumerate(name[:self.MAX_FUZZY_CHARS]):
+                self._positions.setdefault((position, ch), set()).add(idx)
+        
+        self._build_suggest_arrays()
+    
+    @staticmethod
+    def _sorted_array(keys: List[str], indices: List[int]) -> Tuple[List[str], array]:
+        """키 기준으로 정렬된 (키 배열, 레코드 번호 배열) 생성"""
+        order = sorted(indices, key=keys.__getitem__)
+        return [keys[i] for i in order], array("i", order)
+    
+    def _build_suggest_arrays(self):
+        """자동완성용 접두 검색 정렬 배열 생성"""
+        listed = [i for i, r in enumerate(self._records) if r.stock_code]
+        unlisted = [i for i, r in enumerate(self._records) if not r.stock_code]
+        chosung = self._chosung_blob[len(SEPARATOR):-len(SEPARATOR)].split(SEPARATOR)
+        stock_codes = [r.stock_code or "" for r in self._records]
+        
+        self._suggest_arrays = {
+            "stock_code": self._sorted_array(stock_codes, listed),
+            "listed": self._sorted_array(self._jamo, listed),
+            "unlisted": self._sorted_array(self._jamo, unlisted),
+            "listed_chosung": self._sorted_array(chosung, listed),
+            "unlisted_chosung": self._sorted_array(chosung, unlisted)
+        }
+    
+    def _scan(
+        self,
+        blob: str,
+        starts: List[int],
+        needle: str,
+        limit: int,
+        prefix: bool = False,
+        unique: bool = True
+    ) -> List[Tuple[int, int]]:
+        """
+        인덱스 문자열에서 needle 위치 검색
+        
+        Args:
+            prefix: 이름 시작 부분 일치만 검색
+            unique: 레코드당 첫 위치만 반환
+        
+        Returns:
+            (레코드 번호, 이름 내 위치) 리스트
+        """
+        pattern = SEPARATOR + needle if prefix else needle
+        shift = len(SEPARATOR) if prefix else 0
+        
+        hits = []
+        seen = set()
+        position = blob.find(pattern)
+        while position != -1 and len(hits) < limit:
+            start = position + shift
+            idx = bisect_right(starts, start) - 1
+            if not unique or idx not in seen:
+                seen.add(idx)
+                hits.append((idx, start - starts[idx]))
+            position = blob.find(pattern, position + 1)
+        return hits
+    
+    def _max_distance(self, query_jamo: str) -> int:
+        """검색어 길이(자모 수)에 따른 허용 오타 수"""
+        if len(query_jamo) < 4:
+            return 0
+        if len(query_jamo) < 15:
+            return 1
+        return 2
+    
+    def _fuzzy(
+        self,
+        normalized: str,
+        query_jamo: str,
+        max_distance: int
+    ) -> Dict[int, int]:
+        """
+        오타 허용 접두 검색 (레코드 번호 → 편집 거리)
+        
+        글자 k 개가 바뀌거나 빠지거나 끼어들면 나머지 글자는 회사명에서 최대 k 칸
+        밀린 위치에 있으므로, 검색어 n 글자 중 n-k 글자가 ±k 칸 안에 있는 회사명만
+        후보로 삼는다 (교체뿐 아니라 삽입/삭제 오타도 포함).
+        """
+        # 밀린 위치까지 인덱스 범위 안에 들도록 앞부분만 사용
+        chars = normalized[:self.MAX_FUZZY_CHARS - max_distance]
+        if len(chars) - max_distance < 2:
+            return {}
+        
+        empty: FrozenSet[int] = frozenset()
+        postings = []
+        for position, ch in enumerate(chars):
+            shifted = [
+                self._positions.get((position + shift, ch), empty)
+                for shift in range(-max_distance, max_distance + 1)
+                if position + shift >= 0
+            ]
+            postings.append(shifted[0].union(*shifted[1:]))
+        
+        # 오타가 난 글자 위치 조합마다 나머지 글자가 모두 (밀린 위치 안에서) 일치하는 레코드
+        candidates: Set[int] = set()
+        for changed in combinations(range(len(chars)), max_distance):
+            kept = sorted(
+                (p for i, p in enumerate(postings) if i not in changed),
+                key=len
+            )
+            candidates |= kept[0].intersection(*kept[1:])
+        
+        # 접두 편집 거리는 검색어 길이 + k 까지만 비교하면 충분
+        window = len(query_jamo) + max_distance
+        results = {}
+        for idx in candidates:
+            distance = bounded_prefix_distance(
+                query_jamo, self._jamo[idx][:window], max_distance
+            )
+            if distance <= max_distance:
+                results[idx] = distance
+        return results
+    
+    def _rank(self, query: str, limit: int) -> List[Tuple[int, Tuple[str, int]]]:
+        """검색어와 일치하는 레코드를 우선순위 순으로 (레코드 번호, (일치 종류, 편집 거리)) 반환"""
+        normalized = normalize_name(query)
+        if not normalized or not self._records:
+            return []
+        
+        # 레코드 번호 → (일치 종류, 편집 거리)
+        matches: Dict[int, Tuple[str, int]] = {}
+        
+        def add(idx: int, match_type: str, distance: int = 0):
+            current = matches.get(idx)
+            rank = (self.MATCH_RANK[match_type], distance)
+            if current is None or rank < (self.MATCH_RANK[current[0]], current[1]):
+                matches[idx] = (match_type, distance)
+        
+        for idx in self._exact.get(strip_legal_suffix(normalized), []):
+            add(idx, "exact")
+        
+        if is_chosung_query(normalized):
+            blob, starts = self._chosung_blob, self._chosung_starts
+            needle = normalized
+            prefix_type, partial_type = "chosung_prefix", "chosung"
+        else:
+            blob, starts = self._jamo_blob, self._jamo_starts
+            needle = decompose(normalized)
+            prefix_type, partial_type = "prefix", "partial"
+        
+        # 접두 일치를 먼저 수집해 부분 일치 상한에 밀리지 않도록 함
+        for idx, _ in self._scan(blob, starts, needle, self.MAX_SCAN_HITS, prefix=True):
+            add(idx, prefix_type)
+        
+        if len(matches) < limit:
+            for idx, position in self._scan(blob, starts, needle, self.MAX_SCAN_HITS):
+                add(idx, prefix_type if position == 0 else partial_type)
+        
+        # 검색어에 포함된 회사명 (예: "삼성전자주식회사" → "삼성전자"), 긴 이름 우선
+        if len(matches) < limit and partial_type == "partial":
+            text = normalized[:self.MAX_CONTAINED_CHARS]
+            for length in range(len(text) - 1, 1, -1):
+                for start in range(len(text) - length + 1):
+                    for idx in self._exact.get(text[start:start + length], []):
+                        add(idx, "contained")
+                if len(matches) >= limit:
+                    break
+        
+        if len(matches) < limit and partial_type == "partial":
+            max_distance = self._max_distance(needle)
+            if max_distance:
+                fuzzy = self._fuzzy(normalized, needle, max_distance)
+                for idx, distance in fuzzy.items():
+                    add(idx, "fuzzy", distance)
+        
+        def sort_key(item: Tuple[int, Tuple[str, int]]):
+            idx, (match_type, distance) = item
+            record = self._records[idx]
+            return (
+                self.MATCH_RANK[match_type],
+                distance,
+                0 if record.stock_code else 1,
+                len(self._names[idx]),
+                self._names[idx],
+                record.corp_code
+            )
+        
+        return sorted(matches.items(), key=sort_key)[:limit]
+    
+    def search(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        회사명 후보 검색
+        
+        Args:
+            query: 회사명 일부, 초성, 오타가 포함된 회사명
+            limit: 최대 반환 개수
+        
+        Returns:
+            회사 정보에 match_type/distance 가 추가된 딕셔너리 리스트
+            (일치 종류 → 편집 거리 → 상장사 → 짧은 이름 순)
+        """
+        return [
+            {**self._records[idx].to_dict(), "match_type": match_type, "distance": distance}
+            for idx, (match_type, distance) in self._rank(query, limit)
+        ]
+    
+    def exact_matches(self, query: str) -> List[Any]:
+        """
+        정규화한 회사명이 검색어와 정확히 같은 레코드 (공백/대소문자/법인 표기 무시)
+        
+        예: "삼성 전자", "삼성전자(주)", "주식회사 삼성전자" → "삼성전자"
+        """
+        normalized = strip_legal_suffix(normalize_name(query))
+        return [self._records[idx] for idx in self._exact.get(normalized, [])]
+    
+    def _prefix_range(self, name: str, prefix: str, limit: int) -> List[int]:
+        """정렬 배열에서 접두 일치 레코드 번호를 최대 limit 개 반환"""
+        keys, indices = self._suggest_arrays[name]
+        start = bisect_left(keys, prefix)
+        result = []
+        for pos in range(start, min(start + limit, len(keys))):
+            if not keys[pos].startswith(prefix):
+                break
+            result.append(indices[pos])
+        return result
+    
+    def suggest(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        자동완성 후보 (접두 일치 전용, 정렬 배열 이진 탐색)
+        
+        상장사(종목코드 보유)를 먼저, 같은 그룹 안에서는 사전순으로 반환한다.
+        숫자 검색어는 종목코드 접두 일치를 우선한다.
+        
+        Args:
+            query: 입력 중인 회사명/초성/종목코드
+            limit: 최대 반환 개수
+        
+        Returns:
+            회사 정보 딕셔너리 리스트
+        """
+        normalized = normalize_name(query)
+        if not normalized or not self._records:
+            return []
+        
+        if is_chosung_query(normalized):
+            groups = [("listed_chosung", normalized), ("unlisted_chosung", normalized)]
+        else:
+            needle = decompose(normalized)
+            groups = [("listed", needle), ("unlisted", needle)]
+            if normalized.isdigit():
+                groups.insert(0, ("stock_code", normalized))
+        
+        results = []
+        seen = set()
+        for name, prefix in groups:
+            for idx in self._prefix_range(name, prefix, limit):
+                if idx in seen:
+                    continue
+                seen.add(idx)
+                results.append(self._records[idx].to_dict())
+                if len(results) >= limit:
+                    return results
+        return results
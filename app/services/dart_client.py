@@ -3,18 +3,30 @@ OPENDART API 클라이언트
 """
 import httpx
 import asyncio
-from typing import Dict, Any, Optional
+import json
+from pathlib import Path
+from typing import Dict, Any, List, Optional
 from app.config import settings
-from app.utils.rate_limiter import RateLimiter, ExponentialBackoff
+from app.utils.deadline import DeadlineExceeded, can_wait, check_deadline, remaining
+from app.utils.fair_queue import FairScheduler, request_consumer
+from app.utils.rate_limiter import RateLimiter, ExponentialBackoff, request_priority, PRIORITY_INTERACTIVE
 
 
 class DartAPIError(Exception):
     """DART API 에러"""
     
+    # 다시 요청해도 결과가 같은 에러 코드 (재시도하지 않음)
+    NON_RETRYABLE_CODES = frozenset({"010", "011", "013", "100", "800", "NOT_FOUND"})
+    
     def __init__(self, code: str, message: str):
         self.code = code
         self.message = message
         super().__init__(f"[{code}] {message}")
+    
+    @property
+    def retryable(self) -> bool:
+        """재시도 의미가 있는 에러인지 여부"""
+        return self.code not in self.NON_RETRYABLE_CODES
 
 
 class DartClient:
@@ -31,6 +43,12 @@ class DartClient:
         "800": "원활한 공시서비스를 위하여 접속이 차단되었습니다.",
     }
     
+    # fnlttMultiAcnt 한 번에 조회할 수 있는 최대 회사 수
+    MULTI_ACCOUNT_BATCH_SIZE = 100
+    
+    # HTTP 요청 제한 시간 (초, 요청 마감이 더 이르면 마감까지)
+    HTTP_TIMEOUT = 30.0
+    
     def __init__(self):
         self.api_key = settings.dart_api_key
         self.base_url = settings.dart_base_url
@@ -38,6 +56,13 @@ class DartClient:
             max_calls=settings.rate_limit_per_second,
             time_window=1.0
         )
+        # 일반 요청은 소비자별 공정 큐를 거쳐 토큰을 받는다 (대량 작업은 rate limiter 에서 직접)
+        self.scheduler = FairScheduler(
+            self.rate_limiter,
+            weights=settings.consumer_weights,
+            quotas=settings.consumer_quotas,
+            default_quota=settings.consumer_quota_per_minute
+        )
         self.backoff = ExponentialBackoff(max_retries=3)
         self._client: Optional[httpx.AsyncClient] = None
     
@@ -45,7 +70,7 @@ class DartClient:
         """HTTP 클라이언트 인스턴스 반환"""
         if self._client is None or self._client.is_closed:
             self._client = httpx.AsyncClient(
-                timeout=httpx.Timeout(30.0),
+                timeout=httpx.Timeout(self.HTTP_TIMEOUT),
                 limits=httpx.Limits(max_keepalive_connections=10)
             )
         return self._client
@@ -55,6 +80,44 @@ class DartClient:
         if self._client and not self._client.is_closed:
             await self._client.aclose()
     
+    async def _acquire_token(self, shared: bool = False) -> Optional[float]:
+        """
+        요청 마감 안에서 rate limit 토큰 획득
+        
+        Args:
+            shared: 여러 요청이 공유하는 호출 여부 (공정 큐를 거치지 않고
+                rate limiter 에서 바로 받으며, 어느 소비자의 할당량에도 세지 않음)
+        
+        Returns:
+            이번 HTTP 요청에 쓸 제한 시간 (초, 마감이 없으면 None)
+        
+        Raises:
+            DeadlineExceeded: 마감 전에 토큰을 받을 수 없는 경우
+            QuotaExceeded: 소비자의 호출 할당량을 모두 쓴 경우
+        """
+        check_deadline()
+        
+        if request_priority.get() == PRIORITY_INTERACTIVE and not shared:
+            consumer = request_consumer.get()
+            
+            # 소비자 차례가 마감 전에 오지 않을 것이 확실하면 기다리지 않음
+            if not can_wait(self.rate_limiter.estimated_wait(self.scheduler.ahead_of(consumer))):
+                raise DeadlineExceeded("OPENDART 호출 대기열에서 제한 시간을 초과했습니다.")
+            
+            acquired = await self.scheduler.acquire(consumer, timeout=remaining())
+        else:
+            acquired = await self.rate_limiter.acquire(timeout=remaining())
+        
+        if not acquired:
+            raise DeadlineExceeded("OPENDART 호출 대기열에서 제한 시간을 초과했습니다.")
+        
+        left = remaining()
+        if left is None:
+            return None
+        if left == 0.0:
+            raise DeadlineExceeded()
+        return min(self.HTTP_TIMEOUT, left)
+    
     def _get_user_friendly_message(self, code: str) -> str:
         """사용자 친화적 에러 메시지 반환"""
         return self.ERROR_MESSAGES.get(code, f"알 수 없는 에러 (코드: {code})")
@@ -62,25 +125,36 @@ class DartClient:
     async def _make_request(
         self,
         endpoint: str,
-        params: Dict[str, Any],
-        response_type: str = "json"
-    ) -> Any:
+        params: Dict[str, Any]
+    ) -> Dict[str, Any]:
         """
         DART API 요청 실행
         
         Args:
             endpoint: API 엔드포인트
             params: 요청 파라미터
-            response_type: 응답 타입 ('json' 또는 'binary')
         
         Returns:
-            API 응답 데이터
+            API 응답 데이터 (JSON)
         
         Raises:
             DartAPIError: API 에러 발생 시
+            DeadlineExceeded: 요청 마감 전에 끝낼 수 없는 경우
+            AdmissionRejected: 대기열이 길어 일반 요청을 받지 않는 경우
+            QuotaExceeded: 소비자의 호출 할당량을 모두 쓴 경우
         """
-        # Rate limiting
-        await self.rate_limiter.acquire()
+        # 과부하 시 대기열에 넣지 않고 바로 거절 (대량 작업은 원래 뒤에서 기다림)
+        # 공정 큐 기준으로 이 소비자 차례까지의 대기 시간을 추정한다
+        if request_priority.get() == PRIORITY_INTERACTIVE:
+            consumer = request_consumer.get()
+            self.scheduler.check_quota(consumer)
+            self.rate_limiter.admit(
+                settings.admission_max_wait,
+                ahead=self.scheduler.ahead_of(consumer)
+            )
+        
+        # Rate limiting (요청 마감까지만 대기)
+        http_timeout = await self._acquire_token()
         
         # API 키 추가
         params["crtfc_key"] = self.api_key
@@ -89,37 +163,12 @@ class DartClient:
         client = await self._get_client()
         
         try:
-            response = await client.get(url, params=params)
+            if http_timeout is None:
+                response = await client.get(url, params=params)
+            else:
+                response = await client.get(url, params=params, timeout=http_timeout)
             response.raise_for_status()
             
-            if response_type == "binary":
-                content = response.content
-                
-                # 빈 응답 체크
-                if not content:
-                    raise DartAPIError(
-                        "EMPTY_RESPONSE",
-                        "API 응답이 비어있습니다."
-                    )
-                
-                # binary 응답이 JSON 에러일 수 있으므로 확인
-                if content.startswith(b'{'):
-                    try:
-                        import json
-                        error_data = json.loads(content.decode('utf-8'))
-                        status = error_data.get("status", "UNKNOWN")
-                        message = self._get_user_friendly_message(status) if status in self.ERROR_MESSAGES else error_data.get("message", "알 수 없는 에러")
-                        raise DartAPIError(status, message)
-                    except (json.JSONDecodeError, UnicodeDecodeError):
-                        pass  # 실제 binary 데이터인 경우
-                
-                # XML 응답일 수도 있음 (<?xml 또는 <로 시작)
-                if content.startswith(b'<?xml') or content.strip().startswith(b'<'):
-                    # XML은 그대로 반환 (corp_resolver에서 처리)
-                    return content
-                
-                return content
-            
             # JSON 응답 처리
             data = response.json()
             
@@ -130,30 +179,128 @@ class DartClient:
                 raise DartAPIError(status, message)
             
             return data
-            
+        
         except httpx.HTTPStatusError as e:
             raise DartAPIError(
                 "HTTP_ERROR",
                 f"HTTP 에러 발생: {e.response.status_code}"
             )
+        except httpx.TimeoutException as e:
+            # 요청 마감 때문에 줄인 제한 시간이 지난 경우
+            if http_timeout is not None and http_timeout < self.HTTP_TIMEOUT:
+                raise DeadlineExceeded() from e
+            raise DartAPIError(
+                "NETWORK_ERROR",
+                f"네트워크 에러 발생: {str(e)}"
+            )
         except httpx.RequestError as e:
             raise DartAPIError(
                 "NETWORK_ERROR",
                 f"네트워크 에러 발생: {str(e)}"
             )
     
-    async def get_corp_code_xml(self) -> bytes:
+    async def _download_to_file(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        dest_path: Path,
+        shared: bool = False
+    ) -> int:
         """
-        고유번호(corpCode.xml) 다운로드
+        DART API 응답을 파일로 스트리밍 저장
+        
+        응답 전체를 메모리에 올리지 않고 청크 단위로 기록하므로
+        최대 메모리 사용량이 청크 크기로 제한된다.
+        
+        Args:
+            endpoint: API 엔드포인트
+            params: 요청 파라미터
+            dest_path: 저장 경로
+            shared: 여러 요청이 공유하는 다운로드 여부 (소비자 할당량에 세지 않음)
         
         Returns:
-            ZIP 바이너리 데이터
+            저장한 바이트 수
+        
+        Raises:
+            DartAPIError: API 에러 발생 시
+            DeadlineExceeded: 요청 마감 전에 끝낼 수 없는 경우
         """
-        return await self._make_request(
-            "corpCode.xml",
-            {},
-            response_type="binary"
-        )
+        # Rate limiting (요청 마감까지만 대기)
+        http_timeout = await self._acquire_token(shared)
+        
+        # API 키 추가
+        params["crtfc_key"] = self.api_key
+        
+        url = f"{self.base_url}/{endpoint}"
+        client = await self._get_client()
+        size = 0
+        
+        stream_kwargs = {} if http_timeout is None else {"timeout": http_timeout}
+        
+        try:
+            async with client.stream("GET", url, params=params, **stream_kwargs) as response:
+                response.raise_for_status()
+                
+                with open(dest_path, "wb") as f:
+                    async for chunk in response.aiter_bytes(settings.download_chunk_size):
+                        f.write(chunk)
+                        size += len(chunk)
+        
+        except httpx.HTTPStatusError as e:
+            raise DartAPIError(
+                "HTTP_ERROR",
+                f"HTTP 에러 발생: {e.response.status_code}"
+            )
+        except httpx.TimeoutException as e:
+            # 요청 마감 때문에 줄인 제한 시간이 지난 경우
+            if http_timeout is not None and http_timeout < self.HTTP_TIMEOUT:
+                raise DeadlineExceeded() from e
+            raise DartAPIError(
+                "NETWORK_ERROR",
+                f"네트워크 에러 발생: {str(e)}"
+            )
+        except httpx.RequestError as e:
+            raise DartAPIError(
+                "NETWORK_ERROR",
+                f"네트워크 에러 발생: {str(e)}"
+            )
+        
+        # 빈 응답 체크
+        if size == 0:
+            raise DartAPIError(
+                "EMPTY_RESPONSE",
+                "API 응답이 비어있습니다."
+            )
+        
+        # binary 응답이 JSON 에러일 수 있으므로 확인 (에러 응답은 작음)
+        if size <= settings.download_chunk_size:
+            with open(dest_path, "rb") as f:
+                content = f.read()
+            if content.startswith(b'{'):
+                try:
+                    error_data = json.loads(content.decode('utf-8'))
+                except (json.JSONDecodeError, UnicodeDecodeError):
+                    error_data = None  # 실제 binary 데이터인 경우
+                if isinstance(error_data, dict):
+                    status = error_data.get("status", "UNKNOWN")
+                    message = self._get_user_friendly_message(status) if status in self.ERROR_MESSAGES else error_data.get("message", "알 수 없는 에러")
+                    raise DartAPIError(status, message)
+        
+        return size
+    
+    async def download_corp_code_xml(self, dest_path: Path) -> int:
+        """
+        고유번호(corpCode.xml) ZIP 을 파일로 스트리밍 다운로드
+        
+        모든 요청이 공유하는 매핑 로드용이므로 다운로드를 일으킨 소비자에게 호출을 세지 않는다.
+        
+        Args:
+            dest_path: 저장 경로
+        
+        Returns:
+            저장한 바이트 수
+        """
+        return await self._download_to_file("corpCode.xml", {}, dest_path, shared=True)
     
     async def get_financial_statements(
         self,
@@ -187,6 +334,43 @@ class DartClient:
         
         # 재시도 로직 적용
         return await self.backoff.retry_with_backoff(_fetch)
+    
+    async def get_multi_company_accounts(
+        self,
+        corp_codes: List[str],
+        bsns_year: str,
+        reprt_code: str
+    ) -> Dict[str, Any]:
+        """
+        다중회사 주요계정 조회 (fnlttMultiAcnt)
+        
+        한 번의 호출로 여러 회사의 주요계정(매출액, 영업이익, 당기순이익 등)을
+        연결/개별 모두 조회한다. 감가상각비 등 세부 계정은 포함되지 않는다.
+        
+        Args:
+            corp_codes: 고유번호 목록 (최대 MULTI_ACCOUNT_BATCH_SIZE 개)
+            bsns_year: 사업연도 (YYYY)
+            reprt_code: 보고서 코드 (11011/11012/11013/11014)
+        
+        Returns:
+            주요계정 데이터
+        """
+        if len(corp_codes) > self.MULTI_ACCOUNT_BATCH_SIZE:
+            raise ValueError(
+                f"한 번에 최대 {self.MULTI_ACCOUNT_BATCH_SIZE}개 회사까지 조회할 수 있습니다."
+            )
+        
+        async def _fetch():
+            return await self._make_request(
+                "fnlttMultiAcnt.json",
+                {
+                    "corp_code": ",".join(corp_codes),
+                    "bsns_year": bsns_year,
+                    "reprt_code": reprt_code
+                }
+            )
+        
+        return await self.backoff.retry_with_backoff(_fetch)
 
 
 # 싱글톤 인스턴스
@@ -0,0 +1,79 @@
+"""
+EBITDA 일괄 계산 파이프라인 (동시성 제한 / 완료 순 스트리밍)
+"""
+import asyncio
+from typing import Any, AsyncIterator, Dict, Optional, Sequence, Tuple
+
+from app.config import settings
+from app.services.corp_resolver import corp_resolver
+from app.services.ebitda_calculator import ebitda_calculator
+
+
+class EBITDABatchService:
+    """
+    여러 (회사, 사업연도, 보고서, 재무제표 구분) 항목의 EBITDA 계산
+    
+    고정된 수의 작업자가 항목을 하나씩 가져가 회사 변환 → 재무정보 조회 → 계산을
+    수행하고, 끝난 순서대로 결과를 내보낸다. 동시에 처리 중인 항목과 대기 중인
+    결과가 작업자 수로 제한되므로 항목 수가 늘어도 메모리 사용량이 늘지 않는다.
+    """
+    
+    async def _calculate(self, item: Any) -> Tuple[Dict[str, str], Dict[str, Any]]:
+        """항목 하나 계산 (회사 정보, 계산 결과)"""
+        corp_info = await corp_resolver.resolve(item.company)
+        
+        result = await ebitda_calculator.calculate_ebitda(
+            corp_code=corp_info["corp_code"],
+            year=item.year,
+            report_code=item.report_code,
+            fs_div=item.fs_div
+        )
+        return corp_info, result
+    
+    async def stream(
+        self,
+        items: Sequence[Any],
+        concurrency: Optional[int] = None
+    ) -> AsyncIterator[Tuple[int, Optional[Dict[str, str]], Optional[Dict[str, Any]], Optional[Exception]]]:
+        """
+        항목별 계산 결과를 완료 순서대로 반환
+        
+        Args:
+            items: company/year/report_code/fs_div 속성을 가진 항목 목록
+            concurrency: 동시 처리 항목 수 (None 이면 설정 값 사용)
+        
+        Yields:
+            (항목 순번, 회사 정보, 계산 결과, 에러) 튜플 (성공 시 에러는 None)
+        """
+        concurrency = concurrency or settings.batch_concurrency
+        
+        # 작업자 수만큼만 결과를 쌓아두고, 소비가 늦으면 작업자가 대기한다
+        results: asyncio.Queue = asyncio.Queue(maxsize=concurrency)
+        pending = iter(range(len(items)))
+        
+        async def worker():
+            # 모든 작업자가 같은 반복자에서 다음 항목을 가져간다
+            for index in pending:
+                try:
+                    corp_info, result = await self._calculate(items[index])
+                    await results.put((index, corp_info, result, None))
+                except Exception as e:
+                    await results.put((index, None, None, e))
+        
+        workers = [
+            asyncio.create_task(worker())
+            for _ in range(min(concurrency, len(items)))
+        ]
+        
+        try:
+            for _ in range(len(items)):
+                yield await results.get()
+        finally:
+            # 클라이언트 연결이 끊긴 경우 남은 작업 중단
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+
+# 싱글톤 인스턴스
+ebitda_batch_service = EBITDABatchService()
@@ -1,15 +1,23 @@
 """
 EBITDA 계산 서비스
 """
+import math
 from typing import Dict, Any, List, Tuple, Optional
 from app.services.financial_service import financial_service
 from app.services.dart_client import DartAPIError
-from app.models import FinancialAccount
+from app.services.account_matcher import AccountMatcher
+from app.models import AccountRow
 
 
 class EBITDACalculator:
     """EBITDA 계산 로직"""
     
+    # 계산 로직 버전 (계산 결과가 달라지는 변경 시 올려 저장된 계산 결과를 무효화)
+    CALCULATION_VERSION = "2"
+    
+    # 통합 감가상각 계정에 포함되어 따로 합산하지 않은 무형자산상각비의 매칭 방식
+    INCLUDED_IN_DEPRECIATION = "included_in_depreciation"
+    
     # 계정 검색 키워드
     OPERATING_INCOME_KEYWORDS = [
         "영업이익", "영업이익(손실)", "영업손익"
@@ -30,6 +38,44 @@ class EBITDACalculator:
         "감가ㆍ상각비"
     ]
     
+    # 표준 계정 ID (IFRS/DART 택사노미 요소, 우선순위 순)
+    OPERATING_INCOME_IDS = [
+        "dart_OperatingIncomeLoss", "ifrs-full_OperatingIncomeLoss"
+    ]
+    
+    DEPRECIATION_IDS = [
+        "ifrs-full_AdjustmentsForDepreciationExpense",
+        "dart_AdjustmentsForDepreciationExpense"
+    ]
+    
+    AMORTIZATION_IDS = [
+        "ifrs-full_AdjustmentsForAmortisationExpense",
+        "dart_AdjustmentsForAmortisationExpense"
+    ]
+    
+    COMBINED_DEPRECIATION_IDS = [
+        "ifrs-full_AdjustmentsForDepreciationAndAmortisationExpense",
+        "dart_AdjustmentsForDepreciationAndAmortisationExpense"
+    ]
+    
+    # 과거 기간 금액 필드 (연도 차이, 구분, 당기금액 필드, 누적금액 필드)
+    # 전전기 금액(bfefrm)은 사업보고서에만 있고 누적금액이 없다
+    PRIOR_PERIOD_FIELDS = [
+        (1, "전기", "frmtrm_amount", "frmtrm_add_amount"),
+        (2, "전전기", "bfefrm_amount", None)
+    ]
+    
+    def __init__(self):
+        # 재무제표별 키워드 매처 (구성요소 우선순위 순으로 한 번만 컴파일)
+        self._is_matcher = AccountMatcher([
+            ("operating_income", self.OPERATING_INCOME_KEYWORDS)
+        ])
+        self._cf_matcher = AccountMatcher([
+            ("combined", self.COMBINED_DEPRECIATION_KEYWORDS),
+            ("depreciation", self.DEPRECIATION_KEYWORDS),
+            ("amortization", self.AMORTIZATION_KEYWORDS)
+        ])
+    
     async def calculate_ebitda(
         self,
         corp_code: str,
@@ -44,10 +90,10 @@ class EBITDACalculator:
             corp_code: 고유번호
             year: 사업연도
             report_code: 보고서 코드
-            fs_div: 재무제표 구분
+            fs_div: 재무제표 구분 (CFS/OFS/AUTO)
         
         Returns:
-            EBITDA 계산 결과
+            EBITDA 계산 결과 (fs_div 는 실제 사용한 구분)
         """
         # 재무정보 조회
         financial_data = await financial_service.get_financial_data(
@@ -55,14 +101,20 @@ class EBITDACalculator:
         )
         
         accounts = financial_data["accounts"]
+        used_fs_div = financial_data.get("fs_div", fs_div)
         
-        # 손익계산서(IS)에서 영업이익 추출
-        is_accounts = financial_service.extract_accounts_by_sj_div(accounts, "IS")
-        operating_income = self._find_operating_income(is_accounts)
+        # 재무제표 구분별 계정 분류 (단일 패스)
+        partitions = financial_service.partition_accounts(accounts)
         
-        # 현금흐름표(CF)에서 감가상각비 추출
-        cf_accounts = financial_service.extract_accounts_by_sj_div(accounts, "CF")
-        depreciation, amortization = self._find_depreciation_amortization(cf_accounts)
+        # 영업이익(IS) / 감가상각비(CF) 추출 - 표준 계정 ID 우선, 없으면 키워드
+        found, matched_by = self._find_components(
+            partitions.get("IS", []),
+            partitions.get("CF", [])
+        )
+        operating_income = found.get("operating_income")
+        depreciation = found.get("depreciation")
+        amortization = found.get("amortization")
+        amortization_included = matched_by.get("amortization") == self.INCLUDED_IN_DEPRECIATION
         
         # 당기/누적 판단
         use_cumulative = self._should_use_cumulative(report_code)
@@ -70,13 +122,13 @@ class EBITDACalculator:
         
         # 금액 추출
         op_amount = self._parse_amount(
-            getattr(operating_income, amount_field) if operating_income else None
+            self._account_amount(operating_income, amount_field)
         )
         dep_amount = self._parse_amount(
-            getattr(depreciation, amount_field) if depreciation else None
+            self._account_amount(depreciation, amount_field)
         )
         amort_amount = self._parse_amount(
-            getattr(amortization, amount_field) if amortization else None
+            self._account_amount(amortization, amount_field)
         )
         
         # EBITDA 계산
@@ -88,78 +140,254 @@ class EBITDACalculator:
             depreciation,
             amortization,
             use_cumulative,
-            report_code
+            report_code,
+            amortization_included
         )
         
+        # 같은 응답의 전기/전전기 금액으로 과거 EBITDA 계산 (추가 호출 없음)
+        prior_periods = self._calculate_prior_periods(
+            found, year, use_cumulative
+        )
+        
+        # AUTO 요청에서 개별재무제표로 대체된 경우 안내
+        if fs_div == financial_service.AUTO_FS_DIV and used_fs_div == "OFS":
+            warnings.append(
+                "ℹ️ 연결재무제표가 없어 개별재무제표 기준으로 계산되었습니다."
+            )
+        
         return {
             "components": {
                 "operating_income": {
                     "label": operating_income.account_nm if operating_income else "영업이익",
                     "amount": op_amount,
-                    "found": operating_income is not None
+                    "found": operating_income is not None,
+                    "matched_by": matched_by.get("operating_income")
                 },
                 "depreciation": {
                     "label": depreciation.account_nm if depreciation else "감가상각비",
                     "amount": dep_amount,
-                    "found": depreciation is not None
+                    "found": depreciation is not None,
+                    "matched_by": matched_by.get("depreciation")
                 },
                 "amortization": {
-                    "label": amortization.account_nm if amortization else "무형자산상각비",
+                    "label": (
+                        amortization.account_nm if amortization
+                        else "무형자산상각비 (감가상각비에 포함)" if amortization_included
+                        else "무형자산상각비"
+                    ),
                     "amount": amort_amount,
-                    "found": amortization is not None
+                    "found": amortization is not None,
+                    "matched_by": matched_by.get("amortization")
                 }
             },
             "ebitda_total": ebitda_total,
             "currency": "KRW",
             "basis": "누적금액" if use_cumulative else "당기금액",
-            "rcept_no": financial_data.get("rcept_no"),
+            "prior_periods": prior_periods,
+            "rcept_no": financial_data.get("rcept_no") or (
+                accounts[0].get("rcept_no") if accounts else None
+            ),
+            "fetched_at": financial_data["fetched_at"],
             "from_cache": financial_data.get("_from_cache", False),
             "warnings": warnings,
-            "report_name": financial_data.get("report_name", "")
+            "report_name": financial_data.get("report_name", ""),
+            "fs_div": used_fs_div,
+            "fs_name": financial_data.get(
+                "fs_name", financial_service.FS_DIV_NAMES.get(used_fs_div, used_fs_div)
+            )
         }
     
+    def _calculate_prior_periods(
+        self,
+        found: Dict[str, AccountRow],
+        year: int,
+        use_cumulative: bool
+    ) -> List[Dict[str, Any]]:
+        """
+        전기/전전기 EBITDA 계산
+        
+        구성요소 계정 중 해당 기간 금액이 하나도 없으면 그 기간은 제외한다.
+        
+        Returns:
+            [{year, label, operating_income, depreciation, amortization, ebitda_total}]
+        """
+        periods = []
+        
+        for offset, label, field, cumulative_field in self.PRIOR_PERIOD_FIELDS:
+            amount_field = cumulative_field if use_cumulative else field
+            if amount_field is None:
+                continue
+            
+            raw_amounts = {
+                component: self._account_amount(account, amount_field)
+                for component, account in found.items()
+            }
+            if not any(raw_amounts.values()):
+                continue
+            
+            amounts = {
+                component: self._parse_amount(raw_amounts.get(component))
+                for component in ("operating_income", "depreciation", "amortization")
+            }
+            periods.append({
+                "year": int(year) - offset,
+                "label": label,
+                **amounts,
+                "ebitda_total": sum(amounts.values())
+            })
+        
+        return periods
+    
+    def _find_components(
+        self,
+        is_accounts: List[Dict[str, Any]],
+        cf_accounts: List[Dict[str, Any]]
+    ) -> Tuple[Dict[str, AccountRow], Dict[str, str]]:
+        """
+        EBITDA 구성요소 계정 검색
+        
+        표준 계정 ID(account_id) 인덱스로 먼저 찾고,
+        ID 로 찾지 못한 구성요소만 계정명 키워드로 찾는다.
+        
+        통합 감가상각 계정(감가상각비 및 무형자산상각비)은 감가상각비에만 기록하고,
+        무형자산상각비는 계정 없이 매칭 방식만 INCLUDED_IN_DEPRECIATION 으로 표시한다
+        (당기/전기 금액과 분기/TTM 차감에서 한 번만 합산되도록).
+        
+        Returns:
+            ({구성요소: 계정}, {구성요소: 매칭 방식 (account_id/keyword/included_in_depreciation)})
+        """
+        found: Dict[str, AccountRow] = {}
+        matched_by: Dict[str, str] = {}
+        
+        def record(component: str, account: Optional[AccountRow], method: str) -> None:
+            if account is not None and component not in found:
+                found[component] = account
+                matched_by[component] = method
+        
+        # 1. 표준 계정 ID
+        is_index = financial_service.index_accounts_by_id(is_accounts)
+        cf_index = financial_service.index_accounts_by_id(cf_accounts)
+        
+        record(
+            "operating_income",
+            financial_service.find_account_by_ids(is_index, self.OPERATING_INCOME_IDS),
+            "account_id"
+        )
+        
+        combined = financial_service.find_account_by_ids(
+            cf_index, self.COMBINED_DEPRECIATION_IDS
+        )
+        if combined:
+            # 통합 계정은 감가상각비로 한 번만 합산하고 무형자산상각비는 포함된 것으로 표시
+            record("depreciation", combined, "account_id")
+            matched_by["amortization"] = self.INCLUDED_IN_DEPRECIATION
+        else:
+            record(
+                "depreciation",
+                financial_service.find_account_by_ids(cf_index, self.DEPRECIATION_IDS),
+                "account_id"
+            )
+            record(
+                "amortization",
+                financial_service.find_account_by_ids(cf_index, self.AMORTIZATION_IDS),
+                "account_id"
+            )
+        
+        # 2. 계정명 키워드 (ID 로 찾지 못한 구성요소만)
+        if "operating_income" not in found:
+            record("operating_income", self._find_operating_income(is_accounts), "keyword")
+        
+        missing_dep = "depreciation" not in found
+        missing_amort = "amortization" not in found and "amortization" not in matched_by
+        
+        if missing_dep or missing_amort:
+            depreciation, amortization = self._find_depreciation_amortization(cf_accounts)
+            
+            is_combined = depreciation is not None and depreciation is amortization
+            if not is_combined:
+                record("depreciation", depreciation, "keyword")
+                record("amortization", amortization, "keyword")
+            elif missing_dep and missing_amort:
+                # 통합 계정은 감가상각비로 한 번만 합산
+                record("depreciation", depreciation, "keyword")
+                matched_by["amortization"] = self.INCLUDED_IN_DEPRECIATION
+            # 한쪽만 ID 로 찾았는데 키워드가 통합 계정을 찾은 경우는 이중 합산 방지를 위해 무시
+        
+        return found, matched_by
+    
     def _find_operating_income(
         self,
-        accounts: List[FinancialAccount]
-    ) -> Optional[FinancialAccount]:
+        accounts: List[Dict[str, Any]]
+    ) -> Optional[AccountRow]:
         """영업이익 계정 검색"""
-        return financial_service.find_account_by_keywords(
-            accounts,
-            self.OPERATING_INCOME_KEYWORDS
+        return self._is_matcher.first(accounts)
+    
+    def operating_income_amount(
+        self,
+        accounts: List[Dict[str, Any]],
+        report_code: str
+    ) -> Optional[float]:
+        """
+        손익계산서 행에서 영업이익 금액만 추출 (주요계정 일괄 조회용)
+        
+        Args:
+            accounts: 손익계산서 계정 목록
+            report_code: 보고서 코드 (분기/반기는 누적금액)
+        
+        Returns:
+            영업이익 금액 (계정이 없으면 None)
+        """
+        account = self._find_operating_income(accounts)
+        if account is None:
+            return None
+        
+        amount_field = (
+            "thstrm_add_amount" if self._should_use_cumulative(report_code)
+            else "thstrm_amount"
         )
+        return self._parse_amount(self._account_amount(account, amount_field))
     
     def _find_depreciation_amortization(
         self,
-        accounts: List[FinancialAccount]
-    ) -> Tuple[Optional[FinancialAccount], Optional[FinancialAccount]]:
+        accounts: List[Dict[str, Any]]
+    ) -> Tuple[Optional[AccountRow], Optional[AccountRow]]:
         """
         감가상각비 및 무형자산상각비 검색
         
+        현금흐름표를 한 번만 훑어 통합/개별 계정을 함께 찾는다.
+        
         Returns:
             (감가상각비, 무형자산상각비) 튜플
         """
-        # 통합 계정 우선 검색
-        combined = financial_service.find_account_by_keywords(
-            accounts,
-            self.COMBINED_DEPRECIATION_KEYWORDS
-        )
+        hits = self._cf_matcher.match(accounts)
         
+        # 통합 계정 우선
+        combined = hits.get("combined")
         if combined:
             # 통합 계정이 있으면 둘 다 같은 계정 반환
             return (combined, combined)
         
-        # 개별 계정 검색
-        depreciation = financial_service.find_account_by_keywords(
-            accounts,
-            self.DEPRECIATION_KEYWORDS
-        )
+        return (hits.get("depreciation"), hits.get("amortization"))
+    
+    def _account_amount(
+        self,
+        account: Optional[AccountRow],
+        amount_field: str
+    ) -> Optional[str]:
+        """
+        계정 금액 필드 값
         
-        amortization = financial_service.find_account_by_keywords(
-            accounts,
-            self.AMORTIZATION_KEYWORDS
-        )
+        현금흐름표는 분기/반기 보고서에도 누적금액 필드가 없고 당기금액이 곧 누적이므로,
+        누적금액 필드가 비어 있으면 같은 기간의 금액 필드로 대체한다.
+        """
+        if account is None:
+            return None
         
-        return (depreciation, amortization)
+        amount = getattr(account, amount_field)
+        if not amount and amount_field.endswith("_add_amount"):
+            amount = getattr(account, amount_field.replace("_add_amount", "_amount"))
+        
+        return amount
     
     def _parse_amount(self, amount_str: Optional[str]) -> float:
         """금액 문자열을 숫자로 변환"""
@@ -168,9 +396,12 @@ class EBITDACalculator:
         
         try:
             # 쉼표 제거 후 변환
-            return float(amount_str.replace(",", ""))
+            amount = float(amount_str.replace(",", ""))
         except (ValueError, AttributeError):
             return 0.0
+        
+        # "NaN", "Infinity" 등은 금액이 아니다 (JSON 응답에 null 로 섞여 나가지 않게)
+        return amount if math.isfinite(amount) else 0.0
     
     def _should_use_cumulative(self, report_code: str) -> bool:
         """
@@ -183,11 +414,12 @@ class EBITDACalculator:
     
     def _generate_warnings(
         self,
-        operating_income: Optional[FinancialAccount],
-        depreciation: Optional[FinancialAccount],
-        amortization: Optional[FinancialAccount],
+        operating_income: Optional[AccountRow],
+        depreciation: Optional[AccountRow],
+        amortization: Optional[AccountRow],
         use_cumulative: bool,
-        report_code: str
+        report_code: str,
+        amortization_included: bool = False
     ) -> List[str]:
         """경고 메시지 생성"""
         warnings = []
@@ -205,7 +437,12 @@ class EBITDACalculator:
                 "현금흐름표에 해당 항목이 없는지 확인해주세요."
             )
         
-        if not amortization:
+        if amortization_included:
+            warnings.append(
+                f"ℹ️ 무형자산상각비는 통합 계정({depreciation.account_nm})에 포함되어 "
+                "감가상각비로 한 번만 합산되었습니다."
+            )
+        elif not amortization:
             # 통합 계정일 수 있으므로 약한 경고
             if depreciation and "무형자산" not in depreciation.account_nm:
                 warnings.append(
@@ -218,7 +455,7 @@ class EBITDACalculator:
             report_name = financial_service.REPORT_NAMES.get(report_code, "")
             warnings.append(
                 f"ℹ️ {report_name}의 누적금액 기준으로 계산되었습니다. "
-                "단일 분기 실적이 필요한 경우 이전 분기 데이터를 차감해야 합니다."
+                "단일 분기/최근 4분기(TTM) 실적은 /api/v1/ebitda/quarter 에서 조회할 수 있습니다."
             )
         else:
             warnings.append(
@@ -0,0 +1,280 @@
+"""
+EBITDA 시계열 서비스 (조회 계획 수립 / 동시 조회)
+"""
+import asyncio
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from app.config import settings
+from app.services.dart_client import DartAPIError
+from app.services.ebitda_calculator import ebitda_calculator
+from app.services.financial_service import financial_service
+
+
+def plan_fetches(
+    years: List[int],
+    span: int,
+    cached: Set[int],
+    attempted: Set[int],
+    max_year: int
+) -> List[int]:
+    """
+    필요한 연도를 모두 덮는 최소 조회 연도 계획
+    
+    Y 년 보고서 하나가 Y-span+1 ~ Y 년을 덮는다 (당기/전기/전전기).
+    캐시된 보고서는 비용 없이 먼저 쓰고, 나머지는 최신 연도부터 훑으며
+    덮이지 않은 연도 Y 를 만나면 Y 를 덮는 보고서 중 가장 이른 연도를 고른다
+    (위쪽은 이미 덮였으므로 아래로 가장 멀리 덮는 선택, 구간 덮기 탐욕법).
+    
+    Args:
+        years: 필요한 사업연도 목록
+        span: 보고서 하나가 덮는 연도 수
+        cached: 캐시에 있는 보고서 사업연도
+        attempted: 이미 조회했거나 실패한 보고서 사업연도 (다시 고르지 않음)
+        max_year: 새로 조회할 수 있는 최대 사업연도
+    
+    Returns:
+        조회할 보고서 사업연도 목록 (캐시 적중 포함)
+    """
+    needed = set(years)
+    covered: Set[int] = set()
+    plan: List[int] = []
+    
+    # 1. 캐시된 보고서 중 필요한 연도를 덮는 것
+    for fetch_year in sorted(cached - attempted, reverse=True):
+        gain = needed.intersection(range(fetch_year - span + 1, fetch_year + 1)) - covered
+        if gain:
+            plan.append(fetch_year)
+            covered |= gain
+    
+    # 2. 남은 연도는 최신 연도부터 탐욕적으로
+    for year in sorted(needed - covered, reverse=True):
+        if year in covered:
+            continue
+        
+        candidates = [
+            fetch_year
+            for fetch_year in range(year, min(year + span - 1, max_year) + 1)
+            if fetch_year not in attempted and fetch_year not in plan
+        ]
+        if not candidates:
+            continue
+        
+        fetch_year = candidates[0]
+        plan.append(fetch_year)
+        covered.update(range(fetch_year - span + 1, fetch_year + 1))
+    
+    return plan
+
+
+class EBITDASeriesService:
+    """여러 연도/보고서의 EBITDA 시계열 조회"""
+    
+    # 기간 구분 (연도 차이 -> 라벨)
+    PERIOD_LABELS = {0: "당기", 1: "전기", 2: "전전기"}
+    
+    def _span(self, report_code: str) -> int:
+        """보고서 하나가 덮는 연도 수 (사업보고서만 전전기 금액이 있다)"""
+        return 3 if report_code == "11011" else 2
+    
+    async def _cached_years(
+        self,
+        corp_code: str,
+        years: range,
+        report_code: str,
+        fs_div: str
+    ) -> Set[int]:
+        """캐시에 재무정보가 있는 사업연도 (한 번의 존재 확인 쿼리)"""
+        return await financial_service.cached_years(corp_code, years, report_code, fs_div)
+    
+    async def _fetch(
+        self,
+        corp_code: str,
+        year: int,
+        report_code: str,
+        fs_div: str,
+        semaphore: asyncio.Semaphore
+    ) -> Tuple[int, Optional[Dict[str, Any]], Optional[DartAPIError]]:
+        """보고서 하나 조회 (에러는 반환값으로, 동시 조회 수는 semaphore 로 제한)"""
+        try:
+            async with semaphore:
+                result = await ebitda_calculator.calculate_ebitda(
+                    corp_code=corp_code,
+                    year=year,
+                    report_code=report_code,
+                    fs_div=fs_div
+                )
+            return year, result, None
+        except DartAPIError as e:
+            return year, None, e
+    
+    def _points_from_result(
+        self,
+        fetch_year: int,
+        report_code: str,
+        result: Dict[str, Any]
+    ) -> Dict[int, Dict[str, Any]]:
+        """보고서 하나에서 나오는 연도별 시계열 포인트 (당기 + 전기/전전기)"""
+        components = result["components"]
+        base = {
+            "report_code": report_code,
+            "report_name": result.get("report_name", ""),
+            "fs_div": result.get("fs_div"),
+            "currency": result["currency"],
+            "basis": result["basis"],
+            "source_year": fetch_year,
+            "rcept_no": result.get("rcept_no"),
+            "cached": result.get("from_cache", False)
+        }
+        
+        points = {
+            fetch_year: {
+                **base,
+                "year": fetch_year,
+                "source_period": self.PERIOD_LABELS[0],
+                "operating_income": components["operating_income"]["amount"],
+                "depreciation": components["depreciation"]["amount"],
+                "amortization": components["amortization"]["amount"],
+                "total": result["ebitda_total"]
+            }
+        }
+        
+        for period in result.get("prior_periods", []):
+            points[period["year"]] = {
+                **base,
+                "year": period["year"],
+                "source_period": period["label"],
+                "operating_income": period["operating_income"],
+                "depreciation": period["depreciation"],
+                "amortization": period["amortization"],
+                "total": period["ebitda_total"]
+            }
+        
+        return points
+    
+    async def _report_series(
+        self,
+        corp_code: str,
+        from_year: int,
+        to_year: int,
+        report_code: str,
+        fs_div: str,
+        semaphore: asyncio.Semaphore
+    ) -> Dict[str, Any]:
+        """보고서 코드 하나의 시계열"""
+        years = list(range(from_year, to_year + 1))
+        span = self._span(report_code)
+        
+        cached = await self._cached_years(
+            corp_code, range(from_year, to_year + span), report_code, fs_div
+        )
+        
+        attempted: Set[int] = set()
+        points: Dict[int, Dict[str, Any]] = {}
+        errors: Dict[int, DartAPIError] = {}
+        fetched = 0
+        
+        # 계획한 보고서가 없으면(013) 남은 연도로 다시 계획
+        while True:
+            missing_years = [year for year in years if year not in points]
+            plan = plan_fetches(missing_years, span, cached, attempted, to_year)
+            if not plan:
+                break
+            
+            attempted.update(plan)
+            fetched += sum(1 for fetch_year in plan if fetch_year not in cached)
+            
+            results = await asyncio.gather(*[
+                self._fetch(corp_code, fetch_year, report_code, fs_div, semaphore)
+                for fetch_year in plan
+            ])
+            
+            for fetch_year, result, error in results:
+                if error is not None:
+                    errors[fetch_year] = error
+                    continue
+                
+                for year, point in self._points_from_result(
+                    fetch_year, report_code, result
+                ).items():
+                    if year not in years:
+                        continue
+                    # 같은 연도는 해당 연도 보고서(당기) 금액을 우선
+                    current = points.get(year)
+                    if current is None or point["source_year"] < current["source_year"]:
+                        points[year] = point
+        
+        missing = [
+            {
+                "year": year,
+                "report_code": report_code,
+                "error": errors[year].code if year in errors else "013",
+                "message": (
+                    errors[year].message if year in errors
+                    else "해당 기간의 재무정보가 존재하지 않습니다."
+                )
+            }
+            for year in years
+            if year not in points
+        ]
+        
+        return {
+            "points": [points[year] for year in years if year in points],
+            "missing": missing,
+            "errors": list(errors.values()),
+            "upstream_fetches": fetched,
+            "cached_fetches": len(attempted & cached)
+        }
+    
+    async def get_series(
+        self,
+        corp_code: str,
+        from_year: int,
+        to_year: int,
+        report_codes: List[str],
+        fs_div: str = "CFS"
+    ) -> Dict[str, Any]:
+        """
+        EBITDA 시계열 조회
+        
+        보고서 코드별로 최소 조회 계획을 세우고, 캐시에 없는 보고서만
+        동시에 조회한다 (요청 하나의 동시 조회 수는 series_concurrency 로 제한).
+        
+        Args:
+            corp_code: 고유번호
+            from_year: 시작 사업연도
+            to_year: 종료 사업연도
+            report_codes: 보고서 코드 목록
+            fs_div: 재무제표 구분 (CFS/OFS/AUTO)
+        
+        Returns:
+            {points, missing, upstream_fetches, cached_fetches}
+        
+        Raises:
+            DartAPIError: 한 건도 조회하지 못한 경우 첫 번째 에러
+        """
+        # 보고서 코드 전체가 공유하는 동시 조회 제한
+        semaphore = asyncio.Semaphore(settings.series_concurrency)
+        
+        reports = await asyncio.gather(*[
+            self._report_series(corp_code, from_year, to_year, report_code, fs_div, semaphore)
+            for report_code in report_codes
+        ])
+        
+        points = [point for report in reports for point in report["points"]]
+        errors = [error for report in reports for error in report["errors"]]
+        
+        if not points and errors:
+            raise errors[0]
+        
+        points.sort(key=lambda point: (point["year"], point["report_code"]))
+        
+        return {
+            "points": points,
+            "missing": [item for report in reports for item in report["missing"]],
+            "upstream_fetches": sum(report["upstream_fetches"] for report in reports),
+            "cached_fetches": sum(report["cached_fetches"] for report in reports)
+        }
+
+
+# 싱글톤 인스턴스
+ebitda_series_service = EBITDASeriesService()
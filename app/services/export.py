@@ -0,0 +1,177 @@
+"""
+전체 상장사 EBITDA 내보내기 (종목코드 순 스트리밍 / 커서 재개)
+"""
+import asyncio
+from bisect import bisect_right
+from collections import deque
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Tuple
+
+from app.config import settings
+from app.services.corp_resolver import corp_resolver
+from app.services.screening import screening_service
+from app.utils.rate_limiter import request_priority, PRIORITY_BULK
+
+
+class EBITDAExportService:
+    """
+    전체 상장사(종목코드가 있는 회사)의 EBITDA 를 종목코드 순으로 한 행씩 생성
+    
+    고정된 수의 회사를 미리 계산해 두고 앞에서부터 순서대로 내보낸다.
+    캐시된 재무정보는 바로 계산되고, 캐시에 없는 회사만 PRIORITY_BULK 로 조회하므로
+    일반 API 요청의 응답 시간을 밀어내지 않는다.
+    출력이 종목코드 순이므로 마지막으로 받은 행의 종목코드를 커서로 이어받을 수 있다.
+    """
+    
+    # 내보내기 컬럼 (컬럼명, Arrow 타입 별칭)
+    COLUMNS = (
+        ("stock_code", "string"),
+        ("corp_code", "string"),
+        ("corp_name", "string"),
+        ("year", "int32"),
+        ("report_code", "string"),
+        ("fs_div", "string"),
+        ("operating_income", "double"),
+        ("depreciation", "double"),
+        ("amortization", "double"),
+        ("ebitda", "double"),
+        ("currency", "string"),
+        ("basis", "string"),
+        ("rcept_no", "string"),
+        ("error", "string")
+    )
+    
+    async def companies(
+        self,
+        cursor: Optional[str] = None,
+        limit: Optional[int] = None
+    ) -> Tuple[List[Dict[str, Optional[str]]], bool]:
+        """
+        내보낼 상장사 목록
+        
+        Args:
+            cursor: 이 종목코드 다음 회사부터 (None 이면 처음부터)
+            limit: 최대 회사 수 (None 이면 끝까지)
+        
+        Returns:
+            (회사 목록, 뒤에 남은 회사가 있는지 여부)
+        """
+        listed = await corp_resolver.listed_companies()
+        
+        start = 0
+        if cursor is not None:
+            start = bisect_right([company["stock_code"] for company in listed], cursor)
+        
+        end = len(listed) if limit is None else min(start + limit, len(listed))
+        return listed[start:end], end < len(listed)
+    
+    def _row(
+        self,
+        company: Dict[str, Optional[str]],
+        year: int,
+        report_code: str,
+        fs_div: str,
+        result: Optional[Dict[str, Any]],
+        error: Optional[str]
+    ) -> Dict[str, Any]:
+        """내보내기 한 행 (실패 시 금액은 비움)"""
+        row = {
+            "stock_code": company["stock_code"],
+            "corp_code": company["corp_code"],
+            "corp_name": company["corp_name"],
+            "year": year,
+            "report_code": report_code,
+            "fs_div": fs_div,
+            "error": error
+        }
+        
+        if result is not None:
+            components = result["components"]
+            row.update({
+                "fs_div": result["fs_div"],
+                "operating_income": components["operating_income"]["amount"],
+                "depreciation": components["depreciation"]["amount"],
+                "amortization": components["amortization"]["amount"],
+                "ebitda": result["ebitda_total"],
+                "currency": result["currency"],
+                "basis": result["basis"],
+                "rcept_no": result.get("rcept_no")
+            })
+        
+        return row
+    
+    async def _calculate(
+        self,
+        company: Dict[str, Optional[str]],
+        year: int,
+        report_code: str,
+        fs_div: str
+    ) -> Dict[str, Any]:
+        """회사 하나의 행 계산 (에러는 error 컬럼에)"""
+        try:
+            result, error = await screening_service.calculate_detail(
+                company["corp_code"], year, report_code, fs_div
+            )
+        except Exception as e:
+            # 한 회사의 예기치 못한 실패로 전체 내보내기를 끊지 않는다
+            print(f"[Export] 계산 실패 ({company['corp_code']}): {e}")
+            return self._row(company, year, report_code, fs_div, None, "INTERNAL_ERROR")
+        
+        if error is not None:
+            return self._row(company, year, report_code, fs_div, None, error.code)
+        return self._row(company, year, report_code, fs_div, result, None)
+    
+    async def rows(
+        self,
+        companies: List[Dict[str, Optional[str]]],
+        year: int,
+        report_code: str,
+        fs_div: str,
+        concurrency: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        회사 목록 순서대로 EBITDA 행 생성
+        
+        앞쪽 concurrency 개 회사를 동시에 계산하고, 맨 앞 회사가 끝나면 내보낸 뒤
+        다음 회사를 채워 넣는다 (순서 유지, 메모리는 concurrency 개 행).
+        
+        Args:
+            companies: 회사 목록 (companies() 결과)
+            year: 사업연도
+            report_code: 보고서 코드
+            fs_div: 재무제표 구분 (CFS/OFS/AUTO)
+            concurrency: 동시 계산 회사 수 (None 이면 설정 값 사용)
+        
+        Yields:
+            COLUMNS 키를 가진 행
+        """
+        # 이후 만드는 계산 태스크의 OPENDART 호출은 대량 작업 우선순위
+        request_priority.set(PRIORITY_BULK)
+        
+        concurrency = concurrency or settings.export_concurrency
+        pending = iter(companies)
+        window: Deque[asyncio.Task] = deque()
+        
+        def schedule_next():
+            company = next(pending, None)
+            if company is not None:
+                window.append(asyncio.create_task(
+                    self._calculate(company, year, report_code, fs_div)
+                ))
+        
+        for _ in range(concurrency):
+            schedule_next()
+        
+        try:
+            while window:
+                row = await window.popleft()
+                schedule_next()
+                yield row
+        finally:
+            # 클라이언트 연결이 끊긴 경우 남은 계산 중단
+            for task in window:
+                task.cancel()
+            await asyncio.gather(*window, return_exceptions=True)
+
+
+# 싱글톤 인스턴스
+ebitda_export_service = EBITDAExportService()
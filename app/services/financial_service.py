@@ -1,10 +1,26 @@
 """
 재무정보 조회 서비스
 """
-from typing import Dict, List, Any, Optional
+import asyncio
+import inspect
+import time
+from datetime import datetime
+from itertools import groupby
+from operator import itemgetter
+from typing import Callable, Dict, Iterable, List, Any, Optional, Set
 from app.services.dart_client import dart_client, DartAPIError
-from app.utils.cache import cache_manager
-from app.models import FinancialAccount
+from app.config import settings
+from app.utils.cache import cache_manager, LRUCache
+from app.utils.rate_limiter import request_priority, PRIORITY_BULK
+from app.services.account_matcher import AccountMatcher
+from app.services.corp_resolver import corp_resolver
+from app.models import AccountRow
+
+
+_sj_div_of = itemgetter("sj_div")
+
+# 표준 계정 ID 가 없는 회사 고유 계정에 DART 가 넣는 값
+NON_STANDARD_ACCOUNT_ID = "-표준계정코드 미사용-"
 
 
 class FinancialService:
@@ -24,6 +40,45 @@ class FinancialService:
         "OFS": "개별재무제표"
     }
     
+    # 다중회사 주요계정 캐시 키 접두어
+    MAJOR_ACCOUNTS_NAMESPACE = "major_accounts"
+    
+    # fs_div=AUTO 우선순위 (연결 우선)
+    AUTO_FS_DIV = "AUTO"
+    AUTO_FS_ORDER = ("CFS", "OFS")
+    
+    # CFS 가 없다는 확인 결과 캐시 키 접두어
+    CFS_UNAVAILABLE_NAMESPACE = "cfs_unavailable"
+    
+    def __init__(self):
+        # 키워드 묶음별 컴파일된 매처
+        self._matchers: Dict[tuple, AccountMatcher] = {}
+        
+        # OPENDART 에서 새로 조회한 재무정보 리스너
+        self._refresh_listeners: List[Callable[[str, int, str, str, Optional[str]], Any]] = []
+        
+        # (corp_code, year, report_code) -> 연결재무제표(CFS)가 없다는 확인의 만료 시각
+        # (0.0 이면 캐시 DB 를 확인했고 기록이 없음)
+        self._cfs_unavailable = LRUCache(4096)
+        
+        # 추측 요청 후 결과를 기다리지 않은 OFS 조회 (캐시 채우기용)
+        self._background_fetches: set = set()
+    
+    def add_refresh_listener(
+        self,
+        listener: Callable[[str, int, str, str, Optional[str]], Any]
+    ):
+        """
+        재무정보 재조회 리스너 등록
+        
+        OPENDART 에서 재무정보를 새로 조회할 때마다
+        (corp_code, year, report_code, fs_div, rcept_no) 로 호출된다.
+        재무정보로 만든 계산 결과 캐시는 이 리스너로 무효화한다.
+        코루틴 함수는 조회 결과를 반환하기 전에 완료를 기다린다
+        (새 재무정보로 계산한 결과를 저장하기 전에 무효화가 끝나도록).
+        """
+        self._refresh_listeners.append(listener)
+    
     async def get_financial_data(
         self,
         corp_code: str,
@@ -39,19 +94,24 @@ class FinancialService:
             corp_code: 고유번호 (8자리)
             year: 사업연도
             report_code: 보고서 코드
-            fs_div: 재무제표 구분
+            fs_div: 재무제표 구분 (CFS/OFS/AUTO)
             use_cache: 캐시 사용 여부
         
         Returns:
-            재무정보 데이터
+            재무정보 데이터 (fs_div 는 실제 사용한 구분)
         """
+        if fs_div == self.AUTO_FS_DIV:
+            return await self._get_financial_data_auto(
+                corp_code, year, report_code, use_cache
+            )
+        
         # 캐시 키 생성 인자
         cache_key_args = (corp_code, year, report_code, fs_div)
         
-        # 캐시 확인
+        # 캐시 확인 (조회 시각이 없는 이전 형식 항목은 다시 조회)
         if use_cache:
             cached_data = await cache_manager.get(*cache_key_args)
-            if cached_data:
+            if cached_data and cached_data.get("fetched_at"):
                 cached_data["_from_cache"] = True
                 return cached_data
         
@@ -88,7 +148,8 @@ class FinancialService:
             "fs_div": fs_div,
             "report_name": self.REPORT_NAMES.get(report_code, report_code),
             "fs_name": self.FS_DIV_NAMES.get(fs_div, fs_div),
-            "rcept_no": response.get("rcept_no"),
+            "rcept_no": self._rcept_no(response),
+            "fetched_at": datetime.now().isoformat(),
             "accounts": response["list"],
             "_from_cache": False
         }
@@ -96,16 +157,395 @@ class FinancialService:
         # 캐시 저장
         await cache_manager.set(cleaned_data, *cache_key_args)
         
+        for listener in self._refresh_listeners:
+            pending = listener(corp_code, year, report_code, fs_div, cleaned_data["rcept_no"])
+            if inspect.isawaitable(pending):
+                await pending
+        
         return cleaned_data
     
+    @staticmethod
+    def _rcept_no(response: Dict[str, Any]) -> Optional[str]:
+        """접수번호 (응답 최상위에 없으면 계정 행에서)"""
+        if response.get("rcept_no"):
+            return response["rcept_no"]
+        
+        rows = response.get("list") or []
+        return rows[0].get("rcept_no") if rows else None
+    
+    async def get_major_accounts_bulk(
+        self,
+        corp_codes: List[str],
+        year: int,
+        report_code: str,
+        use_cache: bool = True
+    ) -> Dict[str, Any]:
+        """
+        여러 회사의 주요계정 일괄 조회 (fnlttMultiAcnt, 캐싱 적용)
+        
+        캐시에 없는 회사만 MULTI_ACCOUNT_BATCH_SIZE 개씩 묶어 동시에 조회한다.
+        데이터가 없는 회사는 빈 목록으로 캐시하되, 곧 공시될 수 있으므로
+        negative_cache_hours 동안만 유지한다.
+        
+        Args:
+            corp_codes: 고유번호 목록
+            year: 사업연도
+            report_code: 보고서 코드
+            use_cache: 캐시 사용 여부
+        
+        Returns:
+            {"accounts": {corp_code: 주요계정 행 리스트}, "failed": {corp_code: 에러 코드},
+             "upstream_calls": OPENDART 호출 수}
+        """
+        corp_codes = list(dict.fromkeys(corp_codes))
+        key_args = [
+            (self.MAJOR_ACCOUNTS_NAMESPACE, corp_code, year, report_code)
+            for corp_code in corp_codes
+        ]
+        
+        accounts: Dict[str, List[Dict[str, Any]]] = {}
+        if use_cache:
+            for corp_code, cached in zip(corp_codes, await cache_manager.get_many(key_args)):
+                if cached is not None:
+                    accounts[corp_code] = cached
+        
+        misses = [corp_code for corp_code in corp_codes if corp_code not in accounts]
+        batch_size = dart_client.MULTI_ACCOUNT_BATCH_SIZE
+        chunks = [misses[i:i + batch_size] for i in range(0, len(misses), batch_size)]
+        
+        async def fetch_chunk(chunk: List[str]) -> Any:
+            try:
+                response = await dart_client.get_multi_company_accounts(
+                    chunk, str(year), report_code
+                )
+                return response.get("list", [])
+            except DartAPIError as e:
+                # 묶음 전체에 데이터가 없는 경우
+                if e.code == "013":
+                    return []
+                return e
+        
+        results = await asyncio.gather(*[fetch_chunk(chunk) for chunk in chunks])
+        
+        failed: Dict[str, str] = {}
+        fetched: Dict[str, List[Dict[str, Any]]] = {}
+        
+        for chunk, result in zip(chunks, results):
+            if isinstance(result, DartAPIError):
+                failed.update({corp_code: result.code for corp_code in chunk})
+                continue
+            
+            grouped = await self._group_by_corp_code(chunk, result)
+            for corp_code in chunk:
+                fetched[corp_code] = grouped.get(corp_code, [])
+        
+        # 데이터가 있는 회사는 기본 기간, 없는 회사는 짧게 캐시
+        await cache_manager.set_many([
+            (rows, (self.MAJOR_ACCOUNTS_NAMESPACE, corp_code, year, report_code))
+            for corp_code, rows in fetched.items()
+            if rows
+        ])
+        await cache_manager.set_many([
+            (rows, (self.MAJOR_ACCOUNTS_NAMESPACE, corp_code, year, report_code))
+            for corp_code, rows in fetched.items()
+            if not rows
+        ], ttl_days=settings.negative_cache_hours / 24)
+        accounts.update(fetched)
+        
+        return {
+            "accounts": accounts,
+            "failed": failed,
+            "upstream_calls": len(chunks)
+        }
+    
+    async def _group_by_corp_code(
+        self,
+        corp_codes: List[str],
+        rows: List[Dict[str, Any]]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        다중회사 응답 행을 회사별로 분류
+        
+        행에 corp_code 가 없으면 종목코드로 고유번호를 찾는다.
+        """
+        stock_to_corp: Optional[Dict[str, str]] = None
+        grouped: Dict[str, List[Dict[str, Any]]] = {}
+        
+        for row in rows:
+            corp_code = row.get("corp_code")
+            
+            if not corp_code:
+                if stock_to_corp is None:
+                    records = await asyncio.gather(*[
+                        corp_resolver.get_by_corp_code(code) for code in corp_codes
+                    ])
+                    stock_to_corp = {
+                        record.stock_code: record.corp_code
+                        for record in records
+                        if record is not None and record.stock_code
+                    }
+                corp_code = stock_to_corp.get((row.get("stock_code") or "").strip())
+            
+            if corp_code:
+                grouped.setdefault(corp_code, []).append(row)
+        
+        return grouped
+    
+    async def cached_years(
+        self,
+        corp_code: str,
+        years: Iterable[int],
+        report_code: str,
+        fs_div: str = "CFS"
+    ) -> Set[int]:
+        """
+        재무정보 캐시가 있는 사업연도 (조회 계획 수립용, 캐시 값은 읽지 않음)
+        
+        AUTO 는 실제로 사용할 구분(CFS, CFS 가 없다고 확인된 경우 OFS)의 캐시를 확인한다.
+        """
+        years = list(years)
+        key_args = []
+        for year in years:
+            year_fs_div = fs_div
+            if fs_div == self.AUTO_FS_DIV:
+                unavailable = await self._is_cfs_unavailable((corp_code, year, report_code))
+                year_fs_div = "OFS" if unavailable else "CFS"
+            key_args.append((corp_code, year, report_code, year_fs_div))
+        
+        flags = await cache_manager.exists_many(key_args)
+        return {year for year, cached in zip(years, flags) if cached}
+    
+    async def _get_financial_data_auto(
+        self,
+        corp_code: str,
+        year: int,
+        report_code: str,
+        use_cache: bool = True
+    ) -> Dict[str, Any]:
+        """
+        연결(CFS) 우선, 없으면 개별(OFS) 재무정보 조회
+        
+        CFS 를 먼저 요청하고, fs_auto_hedge_delay 안에 응답이 없으면
+        OPENDART 호출 대기열이 비어 있고 토큰이 남을 때만 OFS 를 추측 요청한다
+        (느린 CFS 응답마다 호출이 두 배가 되지 않도록, 대량 작업은 추측 요청하지 않음).
+        CFS 가 "013" 이면 OFS 를 바로 요청한다.
+        CFS 가 성공하면 아직 보내지 않은 OFS 요청은 취소한다.
+        
+        Returns:
+            재무정보 데이터 (fs_div 는 실제 사용한 구분)
+        """
+        memo_key = (corp_code, year, report_code)
+        
+        # CFS 가 없다고 이미 확인된 경우 OFS 만 조회
+        if await self._is_cfs_unavailable(memo_key):
+            return await self._get_ofs_fallback(corp_code, year, report_code, use_cache)
+        
+        cfs_failed = asyncio.Event()
+        ofs_sent = False
+        
+        async def speculative_ofs() -> Dict[str, Any]:
+            nonlocal ofs_sent
+            
+            try:
+                await asyncio.wait_for(cfs_failed.wait(), settings.fs_auto_hedge_delay)
+            except asyncio.TimeoutError:
+                # 대기 중인 요청이 있거나 여유 토큰이 없으면 추측 요청하지 않고 CFS 결과를 기다림
+                if not self._can_hedge():
+                    await cfs_failed.wait()
+            
+            ofs_sent = True
+            return await self.get_financial_data(
+                corp_code, year, report_code, "OFS", use_cache
+            )
+        
+        ofs_task = asyncio.create_task(speculative_ofs())
+        
+        try:
+            data = await self.get_financial_data(
+                corp_code, year, report_code, "CFS", use_cache
+            )
+        except DartAPIError as e:
+            if e.code != "013":
+                ofs_task.cancel()
+                raise
+            
+            cfs_failed.set()
+            await self._mark_cfs_unavailable(memo_key)
+            return await self._get_ofs_fallback(
+                corp_code, year, report_code, use_cache, ofs_task
+            )
+        except BaseException:
+            ofs_task.cancel()
+            raise
+        
+        if ofs_sent:
+            # 이미 보낸 OFS 는 끝까지 받아 캐시만 채움
+            self._background_fetches.add(ofs_task)
+            ofs_task.add_done_callback(self._finish_background_fetch)
+        else:
+            ofs_task.cancel()
+        
+        return data
+    
+    async def _is_cfs_unavailable(self, memo_key: tuple) -> bool:
+        """
+        CFS 가 없다고 확인된 (corp_code, year, report_code) 인지
+        
+        확인 결과는 곧 공시될 수 있으므로 negative_cache_hours 동안만 유지하고,
+        재시작 후에는 캐시 DB 에서 만료 시각과 함께 복원한다.
+        """
+        expires_at = self._cfs_unavailable.get(memo_key)
+        if expires_at is None:
+            expires_at = await cache_manager.get(
+                self.CFS_UNAVAILABLE_NAMESPACE, *memo_key
+            ) or 0.0
+            self._cfs_unavailable.set(memo_key, expires_at)
+        
+        if expires_at and expires_at <= time.time():
+            self._cfs_unavailable.set(memo_key, 0.0)
+            return False
+        return expires_at > 0
+    
+    async def _mark_cfs_unavailable(self, memo_key: tuple) -> None:
+        """CFS 가 없다는 확인 결과 기록 (negative_cache_hours 동안 유지)"""
+        ttl_days = settings.negative_cache_hours / 24
+        expires_at = time.time() + ttl_days * 86400
+        
+        self._cfs_unavailable.set(memo_key, expires_at)
+        await cache_manager.set(
+            expires_at, self.CFS_UNAVAILABLE_NAMESPACE, *memo_key, ttl_days=ttl_days
+        )
+    
+    def _can_hedge(self) -> bool:
+        """OFS 추측 요청을 보낼 여유가 있는지 (일반 요청, 대기열 없음, 남는 토큰 있음)"""
+        if request_priority.get() == PRIORITY_BULK:
+            return False
+        
+        queued = dart_client.scheduler.waiting()
+        return queued == 0 and dart_client.rate_limiter.has_capacity(queued)
+    
+    async def _get_ofs_fallback(
+        self,
+        corp_code: str,
+        year: int,
+        report_code: str,
+        use_cache: bool,
+        ofs_task: Optional["asyncio.Task"] = None
+    ) -> Dict[str, Any]:
+        """AUTO 모드에서 CFS 가 없을 때 OFS 조회 (둘 다 없으면 013)"""
+        try:
+            if ofs_task is not None:
+                return await ofs_task
+            return await self.get_financial_data(
+                corp_code, year, report_code, "OFS", use_cache
+            )
+        except DartAPIError as e:
+            if e.code == "013":
+                raise DartAPIError(
+                    "013",
+                    f"{year}년 {self.REPORT_NAMES.get(report_code, report_code)}에 대한 "
+                    f"재무정보가 연결/개별재무제표 모두 존재하지 않습니다."
+                )
+            raise
+    
+    def _finish_background_fetch(self, task: "asyncio.Task") -> None:
+        """추측 요청 완료 처리 (결과/예외는 버림)"""
+        self._background_fetches.discard(task)
+        if not task.cancelled():
+            task.exception()
+    
+    def partition_accounts(
+        self,
+        accounts: List[Dict[str, Any]]
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        전체 계정을 재무제표 구분별로 한 번에 분류
+        
+        원본 행을 복사하거나 검증하지 않고 그대로 나눠 담는다.
+        DART 응답은 구분별로 연속되어 있으므로 groupby 로 묶어 C 레벨에서 처리한다.
+        
+        Args:
+            accounts: 전체 계정 리스트
+        
+        Returns:
+            {sj_div: 원본 계정 행 리스트} (BS/IS/CIS/CF/SCE 등)
+        """
+        partitions: Dict[str, List[Dict[str, Any]]] = {}
+        
+        try:
+            for sj_div, rows in groupby(accounts, key=_sj_div_of):
+                bucket = partitions.get(sj_div)
+                if bucket is None:
+                    partitions[sj_div] = list(rows)
+                else:
+                    bucket.extend(rows)
+        except KeyError:
+            # sj_div 가 빠진 행이 섞인 응답
+            partitions = {}
+            for acc in accounts:
+                partitions.setdefault(acc.get("sj_div", ""), []).append(acc)
+        
+        return partitions
+    
+    def index_accounts_by_id(
+        self,
+        accounts: List[Dict[str, Any]]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        표준 계정 ID(account_id) 인덱스 생성
+        
+        같은 ID 가 여러 번 나오면 먼저 나온 행을 쓴다.
+        표준 계정 ID 가 없는 행은 제외한다.
+        
+        Args:
+            accounts: 계정 행 리스트 (partition_accounts 결과)
+        
+        Returns:
+            {account_id: 계정 행}
+        """
+        index: Dict[str, Dict[str, Any]] = {}
+        
+        for acc in accounts:
+            account_id = acc.get("account_id")
+            if account_id and account_id not in index:
+                index[account_id] = acc
+        
+        index.pop(NON_STANDARD_ACCOUNT_ID, None)
+        
+        return index
+    
+    def find_account_by_ids(
+        self,
+        index: Dict[str, Dict[str, Any]],
+        account_ids: List[str]
+    ) -> Optional[AccountRow]:
+        """
+        표준 계정 ID 로 계정 검색
+        
+        Args:
+            index: index_accounts_by_id 결과
+            account_ids: 우선순위 순 표준 계정 ID 리스트
+        
+        Returns:
+            매칭된 계정 또는 None
+        """
+        for account_id in account_ids:
+            row = index.get(account_id)
+            if row is not None:
+                return AccountRow.from_row(row)
+        
+        return None
+    
     def extract_accounts_by_sj_div(
         self,
         accounts: List[Dict[str, Any]],
         sj_div: str
-    ) -> List[FinancialAccount]:
+    ) -> List[AccountRow]:
         """
         재무제표 구분별 계정 추출
         
+        여러 구분이 필요하면 partition_accounts 로 한 번에 분류하는 편이 빠르다.
+        
         Args:
             accounts: 전체 계정 리스트
             sj_div: 재무제표 구분 (BS/IS/CF 등)
@@ -113,43 +553,38 @@ class FinancialService:
         Returns:
             필터링된 계정 리스트
         """
-        filtered = []
-        
-        for acc in accounts:
-            if acc.get("sj_div") == sj_div:
-                filtered.append(FinancialAccount(
-                    account_nm=acc.get("account_nm", ""),
-                    thstrm_amount=acc.get("thstrm_amount"),
-                    thstrm_add_amount=acc.get("thstrm_add_amount"),
-                    sj_div=acc.get("sj_div", ""),
-                    currency=acc.get("currency", "KRW")
-                ))
-        
-        return filtered
+        return [
+            AccountRow.from_row(acc)
+            for acc in self.partition_accounts(accounts).get(sj_div, [])
+        ]
     
     def find_account_by_keywords(
         self,
-        accounts: List[FinancialAccount],
+        accounts: List[Dict[str, Any]],
         keywords: List[str]
-    ) -> Optional[FinancialAccount]:
+    ) -> Optional[AccountRow]:
         """
         키워드로 계정 검색
         
+        키워드 묶음별로 컴파일한 매처를 재사용한다.
+        공백/괄호/가운뎃점 차이는 무시한다.
+        
+        FinancialAccount 목록을 받던 이전 시그니처와 달리 원본 행(dict)을 받고,
+        찾은 행만 AccountRow 로 만들어 반환한다.
+        
         Args:
-            accounts: 계정 리스트
+            accounts: 계정 행(dict) 리스트 (partition_accounts 결과)
             keywords: 검색 키워드 리스트
         
         Returns:
             매칭된 계정 또는 None
         """
-        for account in accounts:
-            account_name_lower = account.account_nm.lower()
-            
-            for keyword in keywords:
-                if keyword.lower() in account_name_lower:
-                    return account
+        key = tuple(keywords)
+        matcher = self._matchers.get(key)
+        if matcher is None:
+            matcher = self._matchers[key] = AccountMatcher([("match", key)])
         
-        return None
+        return matcher.first(accounts)
 
 
 # 싱글톤 인스턴스
@@ -0,0 +1,336 @@
+"""
+비동기 작업(Job) 관리 (대량 스크리닝)
+"""
+import asyncio
+import uuid
+from typing import Any, Dict, List, Optional
+
+from app.config import settings
+from app.services.corp_resolver import corp_resolver
+from app.services.dart_client import dart_client, DartAPIError
+from app.services.screening import screening_service
+from app.utils.job_store import job_store
+from app.utils.rate_limiter import request_priority, PRIORITY_BULK
+
+
+class JobManager:
+    """
+    스크리닝 작업 큐 및 작업자 풀
+    
+    작업은 단계별로 진행하며 단계와 항목 결과를 SQLite 에 기록한다.
+    재시작 시 끝나지 않은 작업을 다시 큐에 넣고, 기록된 단계/항목 상태부터 이어서 처리한다.
+    
+    - resolve: 회사 목록 변환 (입력이 없으면 전체 상장사)
+    - screen: 주요계정 일괄 조회로 영업이익 추출 (100개 회사 묶음마다 기록)
+    - select: 영업이익 조건으로 상세 계산 대상 선별 및 순위 기록
+    - detail: 선별된 회사 EBITDA 계산 (회사마다 기록)
+    
+    작업자 태스크는 PRIORITY_BULK 로 실행되어 일반 API 요청보다 rate limit 토큰을 늦게 가져간다.
+    
+    일시적인 에러(rate limit 초과, 네트워크/HTTP 에러 등)를 받은 항목은 실패로 기록하지 않고
+    현재 상태로 남겨 두며, 작업은 JOB_RETRY_SECONDS 뒤 같은 단계부터 다시 실행된다.
+    재시도해도 결과가 같은 에러(DartAPIError.retryable 가 False)만 항목 실패로 기록한다.
+    """
+    
+    KIND_SCREEN = "screen"
+    
+    STAGE_RESOLVE = "resolve"
+    STAGE_SCREEN = "screen"
+    STAGE_SELECT = "select"
+    STAGE_DETAIL = "detail"
+    STAGE_DONE = "done"
+    
+    def __init__(self):
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._workers: List[asyncio.Task] = []
+    
+    async def start(self):
+        """작업자 시작 및 끝나지 않은 작업 재개"""
+        if self._workers:
+            return
+        
+        for job_id in await job_store.list_unfinished():
+            self._queue.put_nowait(job_id)
+        
+        self._workers = [
+            asyncio.create_task(self._worker())
+            for _ in range(settings.job_workers)
+        ]
+    
+    async def stop(self):
+        """작업자 중단 (진행 중인 작업은 다음 시작 시 이어서 처리)"""
+        for task in self._workers:
+            task.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+    
+    async def submit(self, params: Dict[str, Any]) -> str:
+        """
+        스크리닝 작업 등록
+        
+        Args:
+            params: {companies, year, report_code, fs_div, min_operating_income, top_n}
+        
+        Returns:
+            작업 ID
+        """
+        job_id = uuid.uuid4().hex
+        await job_store.create_job(job_id, self.KIND_SCREEN, params, self.STAGE_RESOLVE)
+        self._queue.put_nowait(job_id)
+        return job_id
+    
+    async def get_status(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """작업 상태 및 항목 상태별 개수 (없으면 None)"""
+        job = await job_store.get_job(job_id)
+        if job is None:
+            return None
+        
+        counts = await job_store.count_items(job_id)
+        job["progress"] = {
+            "total": sum(counts.values()),
+            "pending": counts.get(job_store.ITEM_PENDING, 0),
+            "screened": counts.get(job_store.ITEM_SCREENED, 0),
+            "selected": counts.get(job_store.ITEM_SELECTED, 0),
+            "done": counts.get(job_store.ITEM_DONE, 0),
+            "failed": counts.get(job_store.ITEM_FAILED, 0)
+        }
+        return job
+    
+    async def _worker(self):
+        """큐에서 작업을 하나씩 꺼내 실행"""
+        # 이 태스크(및 하위 태스크)의 OPENDART 호출은 대량 작업 우선순위
+        request_priority.set(PRIORITY_BULK)
+        
+        while True:
+            job_id = await self._queue.get()
+            try:
+                await self._run(job_id)
+            except Exception as e:
+                # 작업 기록(SQLite) 실패 등으로 작업자가 끝나지 않도록 한다 (작업은 재시작 시 재개)
+                print(f"[JobManager] 작업 실행 중 에러 ({job_id}): {e}")
+            finally:
+                self._queue.task_done()
+    
+    def _retry_later(self, job_id: str):
+        """JOB_RETRY_SECONDS 뒤 작업을 다시 큐에 넣음"""
+        asyncio.get_running_loop().call_later(
+            settings.job_retry_seconds, self._queue.put_nowait, job_id
+        )
+    
+    @staticmethod
+    def _retryable(code: str) -> bool:
+        """항목 에러 코드가 재시도 의미가 있는 에러인지 여부"""
+        return code not in DartAPIError.NON_RETRYABLE_CODES
+    
+    async def _run(self, job_id: str):
+        """작업 실행 (일시적 에러는 나중에 재시도, 그 밖의 예외는 작업 실패로 기록)"""
+        job = await job_store.get_job(job_id)
+        if job is None or job["status"] in (job_store.COMPLETED, job_store.FAILED):
+            return
+        
+        await job_store.update_job(job_id, status=job_store.RUNNING)
+        
+        try:
+            finished = await self._run_screen(job)
+        except DartAPIError as e:
+            if not e.retryable:
+                print(f"[JobManager] 작업 실패 ({job_id}): {e}")
+                await job_store.update_job(job_id, status=job_store.FAILED, error=str(e))
+                return
+            print(f"[JobManager] 일시적 에러, {settings.job_retry_seconds:g}초 뒤 재시도 ({job_id}): {e}")
+            finished = False
+        except Exception as e:
+            print(f"[JobManager] 작업 실패 ({job_id}): {e}")
+            await job_store.update_job(job_id, status=job_store.FAILED, error=str(e))
+            return
+        
+        if not finished:
+            self._retry_later(job_id)
+            return
+        
+        await job_store.update_job(job_id, status=job_store.COMPLETED, stage=self.STAGE_DONE)
+    
+    async def _run_screen(self, job: Dict[str, Any]) -> bool:
+        """
+        스크리닝 작업 단계 실행 (기록된 단계부터)
+        
+        Returns:
+            모든 단계를 마쳤는지 여부 (일시적 에러로 남은 항목이 있으면 그 단계에서 멈추고 False)
+        """
+        job_id = job["job_id"]
+        params = job["params"]
+        stage = job["stage"]
+        
+        if stage == self.STAGE_RESOLVE:
+            await self._resolve(job_id, params)
+            stage = self.STAGE_SCREEN
+            await job_store.update_job(job_id, stage=stage)
+        
+        if stage == self.STAGE_SCREEN:
+            if await self._screen(job_id, params):
+                return False
+            stage = self.STAGE_SELECT
+            await job_store.update_job(job_id, stage=stage)
+        
+        if stage == self.STAGE_SELECT:
+            await self._select(job_id, params)
+            stage = self.STAGE_DETAIL
+            await job_store.update_job(job_id, stage=stage)
+        
+        if stage == self.STAGE_DETAIL:
+            if await self._detail(job_id, params):
+                return False
+        
+        return True
+    
+    async def _resolve(self, job_id: str, params: Dict[str, Any]):
+        """회사 목록 변환 후 항목 등록"""
+        companies = params.get("companies")
+        
+        if companies:
+            matches = await corp_resolver.resolve_many(companies)
+        else:
+            listed = await corp_resolver.listed_companies()
+            companies = [company["stock_code"] for company in listed]
+            matches = listed
+        
+        items = []
+        for idx, (query, match) in enumerate(zip(companies, matches)):
+            if match:
+                items.append({
+                    "idx": idx,
+                    "query": query,
+                    "corp_code": match["corp_code"],
+                    "corp_name": match["corp_name"],
+                    "stock_code": match.get("stock_code"),
+                    "state": job_store.ITEM_PENDING
+                })
+            else:
+                items.append({
+                    "idx": idx,
+                    "query": query,
+                    "state": job_store.ITEM_FAILED,
+                    "error": "NOT_FOUND"
+                })
+        
+        await job_store.add_items(job_id, items)
+    
+    async def _screen(self, job_id: str, params: Dict[str, Any]) -> int:
+        """
+        영업이익 일괄 조회 (묶음마다 기록, 기록된 항목은 건너뜀)
+        
+        Returns:
+            일시적 에러로 ITEM_PENDING 에 남은 항목 수
+        """
+        pending = await job_store.get_items(job_id, [job_store.ITEM_PENDING])
+        batch_size = dart_client.MULTI_ACCOUNT_BATCH_SIZE
+        retry = 0
+        
+        for start in range(0, len(pending), batch_size):
+            chunk = pending[start:start + batch_size]
+            
+            screened = await screening_service.screen_operating_income(
+                [item["corp_code"] for item in chunk],
+                params["year"],
+                params["report_code"],
+                params["fs_div"]
+            )
+            
+            updates = []
+            for item in chunk:
+                result = screened["items"][item["corp_code"]]
+                if result["error"] is not None and self._retryable(result["error"]):
+                    # 상태는 그대로 두고 마지막 에러만 기록
+                    retry += 1
+                    updates.append({"idx": item["idx"], "error": result["error"]})
+                elif result["error"] is not None:
+                    updates.append({
+                        "idx": item["idx"],
+                        "state": job_store.ITEM_FAILED,
+                        "error": result["error"]
+                    })
+                else:
+                    updates.append({
+                        "idx": item["idx"],
+                        "state": job_store.ITEM_SCREENED,
+                        "operating_income": result["operating_income"],
+                        "fs_div": result["fs_div"],
+                        "error": None
+                    })
+            
+            await job_store.update_items(job_id, updates)
+        
+        return retry
+    
+    async def _select(self, job_id: str, params: Dict[str, Any]):
+        """
+        영업이익 순위 기록 및 상세 계산 대상 선별
+        
+        이미 선별된 항목도 함께 다시 선별하므로, 순위를 기록한 뒤 단계를 넘기기 전에
+        중단되어 다시 실행해도 같은 항목만 선별된다.
+        """
+        screened = await job_store.get_items(
+            job_id, [job_store.ITEM_SCREENED, job_store.ITEM_SELECTED]
+        )
+        by_income, selected = screening_service.select(
+            screened,
+            params.get("min_operating_income"),
+            params.get("top_n")
+        )
+        
+        selected_idx = {item["idx"] for item in selected}
+        await job_store.update_items(job_id, [
+            {
+                "idx": item["idx"],
+                "rank": rank,
+                "state": (
+                    job_store.ITEM_SELECTED if item["idx"] in selected_idx
+                    else job_store.ITEM_SCREENED
+                )
+            }
+            for rank, item in enumerate(by_income, start=1)
+        ])
+    
+    async def _detail(self, job_id: str, params: Dict[str, Any]) -> int:
+        """
+        선별된 회사 EBITDA 계산 (회사마다 기록, 기록된 항목은 건너뜀)
+        
+        Returns:
+            일시적 에러로 ITEM_SELECTED 에 남은 항목 수
+        """
+        selected = iter(await job_store.get_items(job_id, [job_store.ITEM_SELECTED]))
+        retry = 0
+        
+        async def worker():
+            nonlocal retry
+            # 모든 작업자가 같은 반복자에서 다음 항목을 가져간다
+            for item in selected:
+                result, error = await screening_service.calculate_detail(
+                    item["corp_code"],
+                    params["year"],
+                    params["report_code"],
+                    item["fs_div"]
+                )
+                
+                if error is not None and error.retryable:
+                    # 상태는 그대로 두고 마지막 에러만 기록
+                    retry += 1
+                    update = {"idx": item["idx"], "error": error.code}
+                elif error is not None:
+                    update = {"idx": item["idx"], "state": job_store.ITEM_FAILED, "error": error.code}
+                else:
+                    update = {
+                        "idx": item["idx"],
+                        "state": job_store.ITEM_DONE,
+                        "ebitda": result["ebitda_total"],
+                        "fs_div": result.get("fs_div", item["fs_div"]),
+                        "error": None
+                    }
+                await job_store.update_items(job_id, [update])
+        
+        await asyncio.gather(*[worker() for _ in range(settings.job_concurrency)])
+        return retry
+
+
+# 싱글톤 인스턴스
+job_manager = JobManager()
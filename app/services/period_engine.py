@@ -0,0 +1,301 @@
+"""
+분기/TTM EBITDA 계산 엔진 (누적 보고서 차감)
+"""
+import asyncio
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.services.dart_client import DartAPIError
+from app.services.ebitda_calculator import ebitda_calculator
+from app.services.financial_service import financial_service
+from app.utils.cache import cache_manager, LRUCache
+
+
+# 분기 -> 누적 보고서 코드 (4분기는 사업보고서)
+QUARTER_REPORT_CODES = {1: "11013", 2: "11012", 3: "11014", 4: "11011"}
+
+COMPONENTS = ("operating_income", "depreciation", "amortization")
+
+
+def _amounts_from_result(result: Dict[str, Any]) -> Dict[str, float]:
+    """calculate_ebitda 결과의 당기(누적) 구성요소 금액"""
+    return {
+        component: result["components"][component]["amount"]
+        for component in COMPONENTS
+    }
+
+
+def _prior_amounts_from_result(result: Dict[str, Any]) -> Optional[Dict[str, float]]:
+    """calculate_ebitda 결과의 전기(누적) 구성요소 금액"""
+    for period in result.get("prior_periods", []):
+        if period["label"] == "전기":
+            return {component: period[component] for component in COMPONENTS}
+    return None
+
+
+def _combine(*terms: Tuple[int, Dict[str, float]]) -> Dict[str, float]:
+    """구성요소 금액 선형 결합 ((부호, 금액) 목록) 후 합계 추가"""
+    amounts = {
+        component: sum(sign * values[component] for sign, values in terms)
+        for component in COMPONENTS
+    }
+    amounts["total"] = sum(amounts.values())
+    return amounts
+
+
+class EBITDAPeriodEngine:
+    """
+    누적 보고서를 차감해 단일 분기 및 최근 4분기(TTM) EBITDA 계산
+    
+    - Q1 = 1분기 누적, Q2 = 반기 누적 - 1분기 누적
+    - Q3 = 3분기 누적 - 반기 누적, Q4 = 사업보고서 - 3분기 누적
+    - TTM(Y, q) = Y년 q분기 누적 + (Y-1)년 사업보고서 - (Y-1)년 q분기 누적
+      ((Y-1)년 q분기 누적은 Y년 q분기 보고서의 전기 금액을 사용)
+    """
+    
+    # 계산 결과 캐시 키 접두어
+    CACHE_NAMESPACE = "ebitda_quarter"
+    
+    def __init__(self):
+        # (corp_code, year, report_code, fs_div) -> 마지막으로 조회한 보고서 접수번호
+        self._latest_rcept_nos = LRUCache(4096)
+        
+        # 보고서를 새로 조회하면(정정 공시 등) 그 보고서로 계산한 분기/TTM 결과 제거
+        financial_service.add_refresh_listener(self._on_financial_refresh)
+    
+    def _cache_key_args(self, corp_code: str, year: int, quarter: int, fs_div: str) -> tuple:
+        """계산 결과 캐시 키 (계산 로직이 바뀌면 이전 버전으로 저장된 결과는 쓰지 않는다)"""
+        return (
+            self.CACHE_NAMESPACE, corp_code, year, quarter, fs_div,
+            ebitda_calculator.CALCULATION_VERSION
+        )
+    
+    def _dependent_quarters(self, year: int, report_code: str) -> List[Tuple[int, int]]:
+        """보고서 (year, report_code) 로 계산하는 (사업연도, 분기) 목록 (당해 분기 + 다음 해 TTM)"""
+        return [
+            (target_year, quarter)
+            for target_year in (year, year + 1)
+            for quarter in QUARTER_REPORT_CODES
+            if (year, report_code) in self._required_reports(target_year, quarter)
+        ]
+    
+    async def _on_financial_refresh(
+        self,
+        corp_code: str,
+        year: int,
+        report_code: str,
+        fs_div: str,
+        rcept_no: Optional[str]
+    ):
+        """
+        재무정보를 OPENDART 에서 새로 조회하면 그 보고서를 쓰는 분기/TTM 결과 제거 (AUTO 요청 포함)
+        
+        재무정보 조회가 끝나기 전에 기다리므로, 새 보고서로 계산한 결과를 저장하기 전에 끝난다.
+        같은 접수번호로 계산한 결과는 유지한다.
+        """
+        report_key = (corp_code, year, report_code, fs_div)
+        if rcept_no is not None and self._latest_rcept_nos.peek(report_key) == rcept_no:
+            return
+        self._latest_rcept_nos.set(report_key, rcept_no)
+        
+        keys = [
+            self._cache_key_args(corp_code, target_year, quarter, requested_fs_div)
+            for target_year, quarter in self._dependent_quarters(year, report_code)
+            for requested_fs_div in (fs_div, financial_service.AUTO_FS_DIV)
+        ]
+        
+        for key, cached in zip(keys, await cache_manager.get_many(keys)):
+            if cached is None:
+                continue
+            
+            stale = rcept_no is None or any(
+                (source["year"], source["report_code"]) == (year, report_code)
+                and source["rcept_no"] != rcept_no
+                for source in cached.get("sources", [])
+            )
+            if stale:
+                await cache_manager.delete(*key)
+    
+    def _is_latest(
+        self,
+        corp_code: str,
+        results: Dict[Tuple[int, str], Any],
+        fs_div: str
+    ) -> bool:
+        """
+        계산에 쓴 보고서가 모두 마지막으로 조회한 접수번호인지
+        
+        계산하는 동안 다른 요청이 보고서를 재조회했다면 이전 보고서로 계산한 결과다.
+        """
+        return all(
+            self._latest_rcept_nos.peek(
+                (corp_code, year, report_code, result.get("fs_div", fs_div)),
+                result.get("rcept_no")
+            ) == result.get("rcept_no")
+            for (year, report_code), result in results.items()
+            if not isinstance(result, DartAPIError)
+        )
+    
+    async def _fetch_reports(
+        self,
+        corp_code: str,
+        reports: List[Tuple[int, str]],
+        fs_div: str
+    ) -> Dict[Tuple[int, str], Any]:
+        """필요한 보고서 동시 조회 ({(year, report_code): 결과 또는 DartAPIError})"""
+        async def fetch(year: int, report_code: str) -> Any:
+            try:
+                return await ebitda_calculator.calculate_ebitda(
+                    corp_code=corp_code,
+                    year=year,
+                    report_code=report_code,
+                    fs_div=fs_div
+                )
+            except DartAPIError as e:
+                return e
+        
+        results = await asyncio.gather(*[
+            fetch(year, report_code) for year, report_code in reports
+        ])
+        return dict(zip(reports, results))
+    
+    def _required_reports(self, year: int, quarter: int) -> List[Tuple[int, str]]:
+        """분기/TTM 계산에 필요한 보고서 목록"""
+        reports = [(year, QUARTER_REPORT_CODES[quarter])]
+        
+        if quarter > 1:
+            previous = 3 if quarter == 4 else quarter - 1
+            reports.append((year, QUARTER_REPORT_CODES[previous]))
+        
+        if quarter < 4:
+            reports.append((year - 1, QUARTER_REPORT_CODES[4]))
+        
+        return reports
+    
+    async def calculate_quarter(
+        self,
+        corp_code: str,
+        year: int,
+        quarter: int,
+        fs_div: str = "CFS",
+        use_cache: bool = True
+    ) -> Dict[str, Any]:
+        """
+        단일 분기 및 TTM EBITDA 계산
+        
+        Args:
+            corp_code: 고유번호
+            year: 사업연도
+            quarter: 분기 (1~4)
+            fs_div: 재무제표 구분 (CFS/OFS/AUTO)
+            use_cache: 계산 결과 캐시 사용 여부
+        
+        Returns:
+            {year, quarter, quarter_ebitda, ttm_ebitda, sources, warnings, from_cache}
+        
+        Raises:
+            DartAPIError: 해당 분기 보고서를 조회하지 못한 경우
+        """
+        cache_key_args = self._cache_key_args(corp_code, year, quarter, fs_div)
+        
+        if use_cache:
+            cached = await cache_manager.get(*cache_key_args)
+            if cached:
+                cached["from_cache"] = True
+                return cached
+        
+        reports = self._required_reports(year, quarter)
+        results = await self._fetch_reports(corp_code, reports, fs_div)
+        
+        current_key = reports[0]
+        current = results[current_key]
+        if isinstance(current, DartAPIError):
+            raise current
+        
+        warnings: List[str] = []
+        current_amounts = _amounts_from_result(current)
+        
+        # 1. 단일 분기
+        quarter_ebitda: Optional[Dict[str, float]] = None
+        if quarter == 1:
+            quarter_ebitda = _combine((1, current_amounts))
+        else:
+            previous = results[reports[1]]
+            if isinstance(previous, DartAPIError):
+                warnings.append(
+                    f"⚠️ 직전 누적 보고서를 조회하지 못해 {quarter}분기 단일 실적을 "
+                    f"계산할 수 없습니다. ({previous.message})"
+                )
+            else:
+                quarter_ebitda = _combine(
+                    (1, current_amounts), (-1, _amounts_from_result(previous))
+                )
+        
+        # 2. 최근 4분기 (TTM)
+        ttm_ebitda: Optional[Dict[str, float]] = None
+        if quarter == 4:
+            ttm_ebitda = _combine((1, current_amounts))
+        else:
+            last_annual = results[(year - 1, QUARTER_REPORT_CODES[4])]
+            prior_cumulative = _prior_amounts_from_result(current)
+            
+            if isinstance(last_annual, DartAPIError):
+                warnings.append(
+                    f"⚠️ {year - 1}년 사업보고서를 조회하지 못해 TTM 을 계산할 수 없습니다."
+                )
+            elif prior_cumulative is None:
+                warnings.append(
+                    "⚠️ 보고서에 전기 누적금액이 없어 TTM 을 계산할 수 없습니다."
+                )
+            else:
+                ttm_ebitda = _combine(
+                    (1, current_amounts),
+                    (1, _amounts_from_result(last_annual)),
+                    (-1, prior_cumulative)
+                )
+        
+        # 재무제표 구분이 섞인 경우 (AUTO)
+        used = [result for result in results.values() if not isinstance(result, DartAPIError)]
+        fs_divs = {result.get("fs_div") for result in used}
+        if len(fs_divs) > 1:
+            warnings.append(
+                "⚠️ 보고서마다 연결/개별 재무제표 구분이 달라 차감 결과가 정확하지 않을 수 있습니다."
+            )
+        
+        for result in used:
+            for warning in result.get("warnings", []):
+                if warning.startswith("⚠️") and warning not in warnings:
+                    warnings.append(warning)
+        
+        data = {
+            "year": year,
+            "quarter": quarter,
+            "fs_div": current.get("fs_div", fs_div),
+            "currency": current["currency"],
+            "quarter_ebitda": quarter_ebitda,
+            "ttm_ebitda": ttm_ebitda,
+            "sources": [
+                {
+                    "year": report_year,
+                    "report_code": report_code,
+                    "rcept_no": result.get("rcept_no")
+                }
+                for (report_year, report_code), result in results.items()
+                if not isinstance(result, DartAPIError)
+            ],
+            "warnings": warnings,
+            "from_cache": False
+        }
+        
+        # 필요한 보고서를 모두 사용한 결과만 저장 (계산 중 보고서가 재조회됐으면 저장하지 않음)
+        if (
+            quarter_ebitda is not None
+            and ttm_ebitda is not None
+            and self._is_latest(corp_code, results, fs_div)
+        ):
+            await cache_manager.set(data, *cache_key_args)
+        
+        return data
+
+
+# 싱글톤 인스턴스
+ebitda_period_engine = EBITDAPeriodEngine()
@@ -0,0 +1,210 @@
+"""
+EBITDA 스크리닝 서비스 (다중회사 주요계정 일괄 조회 + 선별 상세 조회)
+"""
+import asyncio
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from app.services.dart_client import DartAPIError
+from app.services.ebitda_calculator import ebitda_calculator
+from app.services.financial_service import financial_service
+
+
+class ScreeningService:
+    """
+    여러 회사 EBITDA 스크리닝
+    
+    1. fnlttMultiAcnt 로 100개 회사씩 묶어 영업이익을 일괄 조회
+       (2,500개 회사 -> 25회 호출)
+    2. 조건(최소 영업이익, 상위 N개)을 통과한 회사만 전체 재무제표를 조회해
+       감가상각비/무형자산상각비까지 포함한 EBITDA 계산
+    """
+    
+    def _operating_income(
+        self,
+        rows: List[Dict[str, Any]],
+        report_code: str,
+        fs_div: str
+    ) -> Tuple[Optional[float], Optional[str]]:
+        """
+        주요계정 행에서 영업이익 추출
+        
+        Returns:
+            (영업이익, 사용한 재무제표 구분) 튜플
+        """
+        if fs_div == financial_service.AUTO_FS_DIV:
+            candidates = financial_service.AUTO_FS_ORDER
+        else:
+            candidates = (fs_div,)
+        
+        for candidate in candidates:
+            income_statement = [
+                row for row in rows
+                if row.get("fs_div") == candidate and row.get("sj_div") == "IS"
+            ]
+            if not income_statement:
+                continue
+            
+            amount = ebitda_calculator.operating_income_amount(income_statement, report_code)
+            if amount is not None:
+                return amount, candidate
+        
+        return None, None
+    
+    async def screen_operating_income(
+        self,
+        corp_codes: List[str],
+        year: int,
+        report_code: str,
+        fs_div: str = "CFS"
+    ) -> Dict[str, Any]:
+        """
+        주요계정 일괄 조회로 회사별 영업이익 추출
+        
+        Args:
+            corp_codes: 고유번호 목록
+            year: 사업연도
+            report_code: 보고서 코드
+            fs_div: 재무제표 구분 (CFS/OFS/AUTO)
+        
+        Returns:
+            {"items": {corp_code: {corp_code, operating_income, fs_div, ebitda, error}},
+             "bulk_calls": OPENDART 호출 수}
+        """
+        bulk = await financial_service.get_major_accounts_bulk(corp_codes, year, report_code)
+        
+        items: Dict[str, Dict[str, Any]] = {}
+        for corp_code in dict.fromkeys(corp_codes):
+            item = {
+                "corp_code": corp_code,
+                "operating_income": None,
+                "fs_div": None,
+                "ebitda": None,
+                "error": bulk["failed"].get(corp_code)
+            }
+            rows = bulk["accounts"].get(corp_code)
+            
+            if rows:
+                item["operating_income"], item["fs_div"] = self._operating_income(
+                    rows, report_code, fs_div
+                )
+            elif item["error"] is None:
+                item["error"] = "013"
+            
+            items[corp_code] = item
+        
+        return {"items": items, "bulk_calls": bulk["upstream_calls"]}
+    
+    def select(
+        self,
+        items: Iterable[Dict[str, Any]],
+        min_operating_income: Optional[float] = None,
+        top_n: Optional[int] = None
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        영업이익 조건으로 상세 계산할 회사 선별
+        
+        Args:
+            items: screen_operating_income 항목
+            min_operating_income: 최소 영업이익 (None 이면 제한 없음)
+            top_n: 영업이익 상위 N개만 (None 이면 전부)
+        
+        Returns:
+            (영업이익 내림차순 전체 항목, 선별된 항목) 튜플
+        """
+        by_income = sorted(
+            (item for item in items if item["operating_income"] is not None),
+            key=lambda item: item["operating_income"],
+            reverse=True
+        )
+        
+        selected = by_income
+        if min_operating_income is not None:
+            selected = [
+                item for item in selected if item["operating_income"] >= min_operating_income
+            ]
+        if top_n is not None:
+            selected = selected[:top_n]
+        
+        return by_income, selected
+    
+    async def calculate_detail(
+        self,
+        corp_code: str,
+        year: int,
+        report_code: str,
+        fs_div: str
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[DartAPIError]]:
+        """선별된 회사 하나의 EBITDA 계산 (에러는 반환값으로)"""
+        try:
+            result = await ebitda_calculator.calculate_ebitda(
+                corp_code=corp_code,
+                year=year,
+                report_code=report_code,
+                fs_div=fs_div
+            )
+            return result, None
+        except DartAPIError as e:
+            return None, e
+    
+    async def screen(
+        self,
+        corp_codes: List[str],
+        year: int,
+        report_code: str,
+        fs_div: str = "CFS",
+        min_operating_income: Optional[float] = None,
+        top_n: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        영업이익 기준 스크리닝 후 선별된 회사만 EBITDA 상세 계산
+        
+        Args:
+            corp_codes: 고유번호 목록
+            year: 사업연도
+            report_code: 보고서 코드
+            fs_div: 재무제표 구분 (CFS/OFS/AUTO)
+            min_operating_income: 최소 영업이익 (None 이면 제한 없음)
+            top_n: 영업이익 상위 N개만 상세 계산 (None 이면 전부)
+        
+        Returns:
+            {items, bulk_calls, detail_calls}
+            items 는 상세 계산한 회사, 나머지 회사 순으로 각각 영업이익 내림차순
+            (영업이익이 없는 회사는 마지막)
+        """
+        # 1. 영업이익 조건으로 선별
+        screened = await self.screen_operating_income(corp_codes, year, report_code, fs_div)
+        items = screened["items"]
+        by_income, ranked = self.select(items.values(), min_operating_income, top_n)
+        
+        # 2. 선별된 회사만 전체 재무제표 조회 (동시성은 rate limiter 가 조절)
+        details = await asyncio.gather(*[
+            self.calculate_detail(item["corp_code"], year, report_code, item["fs_div"])
+            for item in ranked
+        ])
+        
+        for item, (result, error) in zip(ranked, details):
+            if error is not None:
+                item["error"] = error.code
+                continue
+            item["ebitda"] = result["ebitda_total"]
+            item["fs_div"] = result.get("fs_div", item["fs_div"])
+        
+        selected = {item["corp_code"] for item in ranked}
+        ordered = ranked + [
+            item for item in by_income if item["corp_code"] not in selected
+        ] + [
+            item for item in items.values() if item["operating_income"] is None
+        ]
+        
+        return {
+            "items": ordered,
+            "bulk_calls": screened["bulk_calls"],
+            "detail_calls": sum(
+                1 for item, (result, _) in zip(ranked, details)
+                if result is None or not result.get("from_cache", False)
+            )
+        }
+
+
+# 싱글톤 인스턴스
+screening_service = ScreeningService()
@@ -4,9 +4,10 @@ SQLite 기반 캐싱 시스템
 import aiosqlite
 import json
 import hashlib
+from collections import OrderedDict
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, Any
+from typing import Optional, Any, List, NamedTuple, Tuple, Iterable
 from app.config import settings
 
 
@@ -86,7 +87,7 @@ class CacheManager:
         self,
         value: Any,
         *args,
-        ttl_days: Optional[int] = None,
+        ttl_days: Optional[float] = None,
         **kwargs
     ):
         """
@@ -95,7 +96,7 @@ class CacheManager:
         Args:
             value: 저장할 데이터
             *args, **kwargs: 캐시 키 생성에 사용될 인자
-            ttl_days: 캐시 유효 기간 (일), None이면 설정 값 사용
+            ttl_days: 캐시 유효 기간 (일, 소수 가능), None이면 설정 값 사용
         """
         await self.initialize()
         
@@ -118,6 +119,108 @@ class CacheManager:
             ))
             await db.commit()
     
+    async def get_many(self, key_args: List[tuple]) -> List[Optional[Any]]:
+        """
+        여러 캐시 항목을 한 번의 연결로 조회
+        
+        Args:
+            key_args: 항목별 캐시 키 생성 인자 튜플 목록
+        
+        Returns:
+            입력 순서와 같은 캐시 데이터 목록 (없거나 만료된 항목은 None)
+        """
+        await self.initialize()
+        
+        keys = [self._generate_key(*args) for args in key_args]
+        found = {}
+        now = datetime.now().isoformat()
+        
+        async with aiosqlite.connect(self.db_path) as db:
+            # SQLite 변수 개수 제한 내에서 나눠 조회
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                async with db.execute(
+                    f"SELECT key, value FROM cache "
+                    f"WHERE key IN ({placeholders}) AND expires_at >= ?",
+                    (*chunk, now)
+                ) as cursor:
+                    async for key, value_json in cursor:
+                        found[key] = value_json
+        
+        return [
+            json.loads(found[key]) if key in found else None
+            for key in keys
+        ]
+    
+    async def exists_many(self, key_args: List[tuple]) -> List[bool]:
+        """
+        여러 캐시 항목의 존재 여부 (값은 읽거나 역직렬화하지 않음)
+        
+        Args:
+            key_args: 항목별 캐시 키 생성 인자 튜플 목록
+        
+        Returns:
+            입력 순서와 같은 존재 여부 목록 (만료된 항목은 False)
+        """
+        await self.initialize()
+        
+        keys = [self._generate_key(*args) for args in key_args]
+        found = set()
+        now = datetime.now().isoformat()
+        
+        async with aiosqlite.connect(self.db_path) as db:
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                async with db.execute(
+                    f"SELECT key FROM cache "
+                    f"WHERE key IN ({placeholders}) AND expires_at >= ?",
+                    (*chunk, now)
+                ) as cursor:
+                    async for (key,) in cursor:
+                        found.add(key)
+        
+        return [key in found for key in keys]
+    
+    async def set_many(
+        self,
+        items: List[Tuple[Any, tuple]],
+        ttl_days: Optional[float] = None
+    ):
+        """
+        여러 캐시 항목을 한 트랜잭션으로 저장
+        
+        Args:
+            items: (저장할 데이터, 캐시 키 생성 인자 튜플) 목록
+            ttl_days: 캐시 유효 기간 (일, 소수 가능), None이면 설정 값 사용
+        """
+        if not items:
+            return
+        
+        await self.initialize()
+        
+        created_at = datetime.now()
+        ttl = ttl_days if ttl_days is not None else settings.cache_expiry_days
+        expires_at = created_at + timedelta(days=ttl)
+        
+        rows = [
+            (
+                self._generate_key(*args),
+                json.dumps(value),
+                created_at.isoformat(),
+                expires_at.isoformat()
+            )
+            for value, args in items
+        ]
+        
+        async with aiosqlite.connect(self.db_path) as db:
+            await db.executemany("""
+                INSERT OR REPLACE INTO cache (key, value, created_at, expires_at)
+                VALUES (?, ?, ?, ?)
+            """, rows)
+            await db.commit()
+    
     async def delete(self, *args, **kwargs):
         """캐시에서 데이터 삭제"""
         await self.initialize()
@@ -140,5 +243,248 @@ class CacheManager:
             await db.commit()
 
 
+class LRUCache:
+    """프로세스 메모리 LRU 캐시 (적중률 집계 포함)"""
+    
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: OrderedDict = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+    
+    def __len__(self) -> int:
+        return len(self._data)
+    
+    def get(self, key: Any, default: Any = None) -> Any:
+        """
+        캐시 조회 (조회된 항목은 최근 사용으로 갱신)
+        
+        Args:
+            key: 캐시 키
+            default: 항목이 없을 때 반환 값
+        """
+        try:
+            value = self._data[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+    
+    def set(self, key: Any, value: Any):
+        """캐시 저장 (최대 크기 초과 시 가장 오래된 항목 제거)"""
+        self._data[key] = value
+        self._data.move_to_end(key)
+        
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+    
+    def peek(self, key: Any, default: Any = None) -> Any:
+        """캐시 조회 (최근 사용 갱신/적중률 집계 없음)"""
+        return self._data.get(key, default)
+    
+    def pop(self, key: Any, default: Any = None) -> Any:
+        """항목 제거 (없으면 default)"""
+        return self._data.pop(key, default)
+    
+    def keys(self) -> List[Any]:
+        """현재 키 목록 (오래된 순)"""
+        return list(self._data)
+    
+    def clear(self):
+        """전체 항목 삭제 (집계는 유지)"""
+        self._data.clear()
+    
+    def stats(self) -> dict:
+        """적중률 집계"""
+        total = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0
+        }
+
+
+class CachedResponse(NamedTuple):
+    """직렬화된 응답"""
+    body: bytes
+    etag: str
+    rcept_no: Optional[str]
+    expires_at: datetime
+
+
+class ResponseCache:
+    """
+    계산 결과 응답 바이트 메모리 캐시
+    
+    직렬화까지 끝난 응답 본문을 보관해, 적중 시 계산/모델 생성/직렬화 없이 바로 응답한다.
+    항목은 근거가 된 재무정보 캐시가 만료되는 시각에 함께 만료되고,
+    재무정보를 다시 조회해 접수번호가 바뀌면 invalidate 로 제거한다.
+    """
+    
+    def __init__(self, maxsize: int):
+        self._entries = LRUCache(maxsize)
+    
+    def get(self, key: Tuple) -> Optional[CachedResponse]:
+        """유효한 응답 (없거나 만료되면 None)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        if entry.expires_at < datetime.now():
+            self._entries.pop(key)
+            return None
+        
+        return entry
+    
+    def set(
+        self,
+        key: Tuple,
+        body: bytes,
+        etag: str,
+        rcept_no: Optional[str],
+        fetched_at: str
+    ):
+        """
+        응답 저장
+        
+        본문은 그대로 다시 보내므로 요청마다 달라지는 값(현재 시각 등)이 없어야 한다.
+        
+        Args:
+            key: 요청 키
+            body: 직렬화된 응답 본문 (적중 시 그대로 응답)
+            etag: 본문 ETag
+            rcept_no: 근거 재무정보 접수번호
+            fetched_at: 근거 재무정보 조회 시각 (ISO 형식)
+        """
+        expires_at = datetime.fromisoformat(fetched_at) + timedelta(days=settings.cache_expiry_days)
+        self._entries.set(key, CachedResponse(body, etag, rcept_no, expires_at))
+    
+    def invalidate(self, key: Tuple, rcept_no: Optional[str] = None):
+        """
+        응답 제거
+        
+        Args:
+            key: 요청 키
+            rcept_no: 새 접수번호 (주어지면 같은 접수번호로 만든 응답은 유지)
+        """
+        entry = self._entries.peek(key)
+        if entry is not None and (rcept_no is None or entry.rcept_no != rcept_no):
+            self._entries.pop(key)
+    
+    def invalidate_where(self, predicate):
+        """키가 조건을 만족하는 응답 모두 제거"""
+        for key in self._entries.keys():
+            if predicate(key):
+                self._entries.pop(key)
+    
+    def stats(self) -> dict:
+        """적중률 집계"""
+        return self._entries.stats()
+
+
+class CorpCodeSnapshot:
+    """
+    corpCode 매핑 스냅샷 저장소 (SQLite)
+    
+    전체 목록을 매번 다시 쓰지 않고 변경분(추가/수정/삭제)만 반영한다.
+    """
+    
+    def __init__(self, db_path: Optional[Path] = None):
+        self.db_path = db_path or settings.cache_dir / "cache.db"
+        self._initialized = False
+    
+    async def initialize(self):
+        """스냅샷 테이블 초기화"""
+        if self._initialized:
+            return
+        
+        async with aiosqlite.connect(self.db_path) as db:
+            await db.execute("""
+                CREATE TABLE IF NOT EXISTS corp_code (
+                    corp_code TEXT PRIMARY KEY,
+                    corp_name TEXT NOT NULL,
+                    stock_code TEXT,
+                    modify_date TEXT NOT NULL
+                )
+            """)
+            
+            await db.execute("""
+                CREATE TABLE IF NOT EXISTS corp_code_meta (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL
+                )
+            """)
+            
+            await db.commit()
+        
+        self._initialized = True
+    
+    async def load(self) -> List[Tuple[str, str, Optional[str], str]]:
+        """
+        스냅샷 전체 조회
+        
+        Returns:
+            (corp_code, corp_name, stock_code, modify_date) 리스트
+        """
+        await self.initialize()
+        
+        async with aiosqlite.connect(self.db_path) as db:
+            async with db.execute(
+                "SELECT corp_code, corp_name, stock_code, modify_date FROM corp_code"
+            ) as cursor:
+                return await cursor.fetchall()
+    
+    async def get_refreshed_at(self) -> Optional[datetime]:
+        """마지막 갱신 시각 (스냅샷이 없으면 None)"""
+        await self.initialize()
+        
+        async with aiosqlite.connect(self.db_path) as db:
+            async with db.execute(
+                "SELECT value FROM corp_code_meta WHERE key = 'refreshed_at'"
+            ) as cursor:
+                row = await cursor.fetchone()
+        
+        return datetime.fromisoformat(row[0]) if row else None
+    
+    async def apply_delta(
+        self,
+        upserts: Iterable[Tuple[str, str, Optional[str], str]],
+        deletes: Iterable[str]
+    ):
+        """
+        변경분 반영 및 갱신 시각 기록
+        
+        Args:
+            upserts: 추가/수정할 (corp_code, corp_name, stock_code, modify_date)
+            deletes: 삭제할 corp_code
+        """
+        await self.initialize()
+        
+        async with aiosqlite.connect(self.db_path) as db:
+            await db.executemany("""
+                INSERT OR REPLACE INTO corp_code (corp_code, corp_name, stock_code, modify_date)
+                VALUES (?, ?, ?, ?)
+            """, upserts)
+            
+            await db.executemany(
+                "DELETE FROM corp_code WHERE corp_code = ?",
+                ((corp_code,) for corp_code in deletes)
+            )
+            
+            await db.execute("""
+                INSERT OR REPLACE INTO corp_code_meta (key, value)
+                VALUES ('refreshed_at', ?)
+            """, (datetime.now().isoformat(),))
+            
+            await db.commit()
+
+
 # 싱글톤 인스턴스
 cache_manager = CacheManager()
+corp_code_snapshot = CorpCodeSnapshot()
+ebitda_response_cache = ResponseCache(settings.response_cache_size)
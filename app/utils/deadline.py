@@ -0,0 +1,114 @@
+"""
+요청 처리 제한 시간(deadline) 전파 유틸리티
+"""
+import asyncio
+import time
+from contextvars import ContextVar
+from typing import Any, Awaitable, Optional
+
+from starlette.requests import Request
+
+
+# 요청 처리 마감 시각 (time.monotonic 기준, None 이면 제한 없음)
+# 라우터에서 설정하면 같은 태스크와 하위 태스크의 rate limiter 대기, HTTP 요청, 재시도가 모두 따른다.
+request_deadline: ContextVar[Optional[float]] = ContextVar("request_deadline", default=None)
+
+# 클라이언트 연결 끊김 확인 주기 (초)
+DISCONNECT_POLL_INTERVAL = 0.5
+
+
+class DeadlineExceeded(Exception):
+    """요청 처리 제한 시간 초과 (또는 남은 시간 안에 끝낼 수 없음)"""
+    
+    code = "DEADLINE_EXCEEDED"
+    retryable = False
+    
+    def __init__(self, message: str = "요청 처리 제한 시간을 초과했습니다."):
+        self.message = message
+        super().__init__(f"[{self.code}] {message}")
+
+
+class ClientDisconnected(Exception):
+    """응답을 보내기 전에 클라이언트 연결이 끊김"""
+
+
+def start_deadline(timeout: float):
+    """현재 컨텍스트의 마감 시각을 지금부터 timeout 초 뒤로 설정"""
+    request_deadline.set(time.monotonic() + timeout)
+
+
+def remaining() -> Optional[float]:
+    """마감까지 남은 시간 (초, 지났으면 0, 제한이 없으면 None)"""
+    deadline = request_deadline.get()
+    if deadline is None:
+        return None
+    return max(deadline - time.monotonic(), 0.0)
+
+
+def can_wait(seconds: float) -> bool:
+    """마감 전에 seconds 초를 기다릴 수 있는지 여부"""
+    left = remaining()
+    return left is None or seconds < left
+
+
+def check_deadline():
+    """
+    마감 시각이 지났으면 DeadlineExceeded
+    
+    Raises:
+        DeadlineExceeded: 남은 시간이 없는 경우
+    """
+    if remaining() == 0.0:
+        raise DeadlineExceeded()
+
+
+async def _without_deadline(awaitable: Awaitable) -> Any:
+    request_deadline.set(None)
+    return await awaitable
+
+
+def _discard_result(task: "asyncio.Task") -> None:
+    """기다리지 않게 된 작업의 결과/예외는 버림"""
+    if not task.cancelled():
+        task.exception()
+
+
+async def wait_detached(awaitable: Awaitable) -> Any:
+    """
+    여러 요청이 공유하는 작업을 마감과 무관하게 끝까지 실행하고, 호출자는 마감까지만 기다림
+    
+    (회사 코드 매핑 로드처럼 한 요청의 마감 때문에 중단되면 안 되는 작업)
+    
+    Raises:
+        DeadlineExceeded: 마감까지 끝나지 않은 경우 (작업은 계속 진행)
+    """
+    task = asyncio.ensure_future(_without_deadline(awaitable))
+    
+    try:
+        return await asyncio.wait_for(asyncio.shield(task), remaining())
+    except asyncio.TimeoutError:
+        task.add_done_callback(_discard_result)
+        raise DeadlineExceeded()
+
+
+async def run_until_disconnected(request: Request, awaitable: Awaitable) -> Any:
+    """
+    클라이언트 연결이 끊기면 작업을 취소하는 실행
+    
+    Raises:
+        ClientDisconnected: 작업이 끝나기 전에 연결이 끊긴 경우 (작업은 취소됨)
+    """
+    task = asyncio.ensure_future(awaitable)
+    
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=DISCONNECT_POLL_INTERVAL)
+            if done:
+                return task.result()
+            
+            if await request.is_disconnected():
+                raise ClientDisconnected()
+    finally:
+        if not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
@@ -0,0 +1,77 @@
+"""
+HTTP 조건부 요청(ETag) 유틸리티
+"""
+import hashlib
+from datetime import datetime
+from typing import Any, Optional
+from app.config import settings
+
+
+def make_etag(*parts: Any) -> str:
+    """
+    구성 값으로 강한(strong) ETag 생성
+    
+    같은 구성 값이면 항상 같은 ETag 가 나온다.
+    """
+    digest = hashlib.sha256("|".join(str(part) for part in parts).encode()).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def body_etag(body: bytes) -> str:
+    """
+    응답 본문 바이트로 강한(strong) ETag 생성
+    
+    본문이 한 바이트라도 다르면 ETag 도 달라진다 (source.cached 등 응답마다 바뀌는 값 포함).
+    """
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    If-None-Match 헤더가 ETag 와 일치하는지 여부 (약한 비교, 목록/* 지원)
+    
+    Args:
+        if_none_match: 요청 헤더 값
+        etag: 현재 ETag
+    """
+    if not if_none_match:
+        return False
+    
+    if if_none_match.strip() == "*":
+        return True
+    
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    
+    return False
+
+
+def cache_control_for(year: int, report_code: str) -> str:
+    """
+    보고서 기간에 따른 Cache-Control 값
+    
+    지난 사업연도 사업보고서는 정정공시 외에는 바뀌지 않으므로 오래 보관하고,
+    진행 중인 연도의 보고서는 짧게 보관한 뒤 ETag 로 재검증하게 한다.
+    """
+    settled = report_code == "11011" and year < datetime.now().year - 1
+    max_age = settings.http_cache_max_age_settled if settled else settings.http_cache_max_age
+    return f"public, max-age={max_age}"
+
+
+def variant_etag(etag: str, media_type: str, default_media_type: str = "application/json") -> str:
+    """
+    응답 형식별 ETag (기본 형식은 그대로, 다른 형식은 형식 이름을 섞어 새로 생성)
+    
+    같은 데이터라도 표현(바이트)이 다르면 강한 ETag 도 달라야 한다.
+    약한 ETag 는 약한 ETag 로 유지한다.
+    """
+    if media_type == default_media_type:
+        return etag
+    
+    variant = make_etag(etag, media_type)
+    return "W/" + variant if etag.startswith("W/") else variant
@@ -0,0 +1,236 @@
+"""
+소비자(API 키)별 공정 큐 (Deficit Round Robin)
+"""
+import asyncio
+import math
+import time
+from collections import deque
+from contextvars import ContextVar
+from typing import Any, Deque, Dict, Optional, Tuple
+
+from app.utils.deadline import request_deadline
+from app.utils.rate_limiter import RateLimiter, request_priority, PRIORITY_INTERACTIVE
+
+
+# API 키가 없거나 등록되지 않은 요청의 소비자 이름
+ANONYMOUS_CONSUMER = "anonymous"
+
+# 요청을 보낸 소비자 (라우터에서 API 키로 설정)
+request_consumer: ContextVar[str] = ContextVar("request_consumer", default=ANONYMOUS_CONSUMER)
+
+# 소비자 할당량 시간 윈도우 (초)
+QUOTA_WINDOW = 60.0
+
+
+class QuotaExceeded(Exception):
+    """소비자의 OPENDART 호출 할당량 초과"""
+    
+    code = "QUOTA_EXCEEDED"
+    retryable = False
+    
+    def __init__(self, consumer: str, quota: int, retry_after: float):
+        self.consumer = consumer
+        self.quota = quota
+        self.retry_after = max(1, math.ceil(retry_after))
+        self.message = (
+            f"OPENDART 호출 할당량(분당 {quota}회)을 모두 사용했습니다. "
+            f"{self.retry_after}초 후 다시 시도해주세요."
+        )
+        super().__init__(f"[{self.code}] {self.message}")
+
+
+class FairScheduler:
+    """
+    소비자별 대기열에서 Deficit Round Robin 으로 rate limit 토큰 배분
+    
+    배분 작업자 하나가 토큰을 받을 때마다 차례인 소비자의 가장 오래된 요청에 넘긴다.
+    차례가 올 때마다 소비자의 deficit 에 가중치만큼 더하고, 호출 1회에 1씩 쓰므로
+    대기 중인 소비자들은 가중치 비율로 토큰을 나눠 갖는다
+    (가중치 2 인 소비자는 차례마다 2회, 0.5 인 소비자는 두 차례에 1회).
+    한 소비자가 요청을 많이 쌓아도 다른 소비자의 대기 시간은 늘지 않는다.
+    
+    할당량은 요청이 대기열에 들어가기 전에 확인하며, 실제로 토큰을 받은 호출만 센다.
+    """
+    
+    def __init__(
+        self,
+        rate_limiter: RateLimiter,
+        weights: Optional[Dict[str, float]] = None,
+        quotas: Optional[Dict[str, int]] = None,
+        default_quota: int = 0
+    ):
+        """
+        Args:
+            rate_limiter: 토큰을 받아올 rate limiter
+            weights: 소비자별 가중치 (없으면 1)
+            quotas: 소비자별 분당 호출 할당량 (없으면 default_quota)
+            default_quota: 기본 분당 호출 할당량 (0 이면 제한 없음)
+        """
+        self.rate_limiter = rate_limiter
+        self.weights = weights or {}
+        self.quotas = quotas or {}
+        self.default_quota = default_quota
+        
+        self._queues: Dict[str, Deque[asyncio.Future]] = {}
+        self._active: Deque[str] = deque()
+        self._deficit: Dict[str, float] = {}
+        self._new_turn = True
+        self._usage: Dict[str, Deque[float]] = {}
+        self._dispatcher: Optional[asyncio.Task] = None
+    
+    def _weight(self, consumer: str) -> float:
+        return self.weights.get(consumer, 1.0)
+    
+    def _quota(self, consumer: str) -> int:
+        return self.quotas.get(consumer, self.default_quota)
+    
+    def _recent_usage(self, consumer: str) -> Deque[float]:
+        """할당량 윈도우 안의 호출 시각"""
+        usage = self._usage.setdefault(consumer, deque())
+        threshold = time.time() - QUOTA_WINDOW
+        while usage and usage[0] <= threshold:
+            usage.popleft()
+        return usage
+    
+    def check_quota(self, consumer: str):
+        """
+        대기 중인 요청까지 포함해 할당량 확인
+        
+        Raises:
+            QuotaExceeded: 할당량을 모두 쓴 경우
+        """
+        quota = self._quota(consumer)
+        if quota <= 0:
+            return
+        
+        usage = self._recent_usage(consumer)
+        if len(usage) + self.waiting(consumer) < quota:
+            return
+        
+        # 가장 오래된 호출이 윈도우를 벗어나는 시각
+        retry_after = usage[0] + QUOTA_WINDOW - time.time() if usage else QUOTA_WINDOW
+        raise QuotaExceeded(consumer, quota, retry_after)
+    
+    def waiting(self, consumer: Optional[str] = None) -> int:
+        """대기 중인 요청 수 (consumer 가 None 이면 전체)"""
+        if consumer is not None:
+            return sum(1 for waiter in self._queues.get(consumer, ()) if not waiter.done())
+        return sum(self.waiting(name) for name in self._queues)
+    
+    def ahead_of(self, consumer: str) -> int:
+        """
+        지금 consumer 의 요청이 들어오면 먼저 토큰을 받을 요청 수 (DRR 배분 기준 추정)
+        
+        자신의 대기열 k 번째 요청이 나갈 때까지 다른 소비자는
+        가중치 비율만큼(대기 중인 요청 수 이내) 토큰을 받는다.
+        """
+        position = self.waiting(consumer) + 1
+        weight = self._weight(consumer)
+        
+        ahead = position - 1
+        for name in self._queues:
+            if name != consumer:
+                share = math.ceil(position * self._weight(name) / weight)
+                ahead += min(self.waiting(name), share)
+        return ahead
+    
+    async def acquire(self, consumer: str, timeout: Optional[float] = None) -> bool:
+        """
+        소비자 차례가 올 때까지 기다려 rate limit 토큰 획득
+        
+        Args:
+            consumer: 소비자 이름
+            timeout: 최대 대기 시간 (초), None이면 무한 대기
+        
+        Returns:
+            토큰 획득 성공 여부
+        
+        Raises:
+            QuotaExceeded: 소비자의 할당량을 모두 쓴 경우
+        """
+        self.check_quota(consumer)
+        
+        waiter = asyncio.get_running_loop().create_future()
+        
+        if consumer not in self._queues:
+            self._queues[consumer] = deque()
+            self._active.append(consumer)
+        self._queues[consumer].append(waiter)
+        
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch())
+        
+        try:
+            await asyncio.wait({waiter}, timeout=timeout)
+        finally:
+            # 취소/시간 초과로 포기한 요청은 배분 대상에서 제외
+            if not waiter.done():
+                waiter.cancel()
+        
+        return not waiter.cancelled()
+    
+    def _next_waiter(self) -> Optional[Tuple[str, asyncio.Future]]:
+        """DRR 로 다음에 토큰을 받을 (소비자, 요청) 선택 (대기 중인 요청이 없으면 None)"""
+        while self._active:
+            consumer = self._active[0]
+            queue = self._queues[consumer]
+            
+            while queue and queue[0].done():
+                queue.popleft()
+            
+            # 대기열이 빈 소비자는 빠지고 남은 deficit 도 버린다
+            if not queue:
+                self._active.popleft()
+                del self._queues[consumer]
+                self._deficit.pop(consumer, None)
+                self._new_turn = True
+                continue
+            
+            if self._new_turn:
+                self._deficit[consumer] = self._deficit.get(consumer, 0.0) + self._weight(consumer)
+                self._new_turn = False
+            
+            if self._deficit[consumer] >= 1.0:
+                self._deficit[consumer] -= 1.0
+                return consumer, queue.popleft()
+            
+            # 이번 차례 몫을 다 쓰면 다음 소비자 차례
+            self._active.rotate(-1)
+            self._new_turn = True
+        
+        return None
+    
+    async def _dispatch(self):
+        """대기 중인 요청이 있는 동안 토큰을 받아 차례대로 배분"""
+        # 배분 작업자는 특정 요청의 마감을 따르지 않고, 대량 작업보다 먼저 토큰을 받는다
+        request_deadline.set(None)
+        request_priority.set(PRIORITY_INTERACTIVE)
+        
+        while self.waiting():
+            await self.rate_limiter.acquire()
+            
+            selected = self._next_waiter()
+            if selected is None:
+                # 기다리던 요청이 모두 포기한 경우 받은 토큰을 돌려준다
+                self.rate_limiter.refund()
+                continue
+            
+            consumer, waiter = selected
+            self._recent_usage(consumer).append(time.time())
+            waiter.set_result(True)
+    
+    def stats(self) -> Dict[str, Any]:
+        """소비자별 대기 요청 수 / 최근 1분 호출 수 / 가중치 / 할당량"""
+        consumers = set(self._queues) | set(self._usage)
+        return {
+            "waiting": self.waiting(),
+            "consumers": {
+                name: {
+                    "waiting": self.waiting(name),
+                    "used_last_minute": len(self._recent_usage(name)),
+                    "weight": self._weight(name),
+                    "quota_per_minute": self._quota(name)
+                }
+                for name in sorted(consumers)
+            }
+        }
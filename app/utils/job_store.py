@@ -0,0 +1,275 @@
+"""
+작업(Job) 진행 상태 저장소 (SQLite)
+"""
+import aiosqlite
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from app.config import settings
+
+
+class JobStore:
+    """
+    작업 및 항목별 진행 상태 저장소
+    
+    항목 단위로 결과를 기록하므로, 프로세스가 재시작되어도
+    끝난 항목은 다시 계산하지 않고 남은 항목부터 이어서 처리한다.
+    """
+    
+    # 작업 상태
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    
+    # 항목 상태
+    ITEM_PENDING = "pending"        # 영업이익 조회 전
+    ITEM_SCREENED = "screened"      # 영업이익 조회 완료
+    ITEM_SELECTED = "selected"      # 상세 계산 대상
+    ITEM_DONE = "done"              # 상세 계산 완료
+    ITEM_FAILED = "failed"          # 실패 (error 에 사유)
+    
+    ITEM_COLUMNS = (
+        "idx", "query", "corp_code", "corp_name", "stock_code",
+        "operating_income", "fs_div", "ebitda", "rank", "state", "error"
+    )
+    
+    def __init__(self, db_path: Optional[Path] = None):
+        self.db_path = db_path or settings.cache_dir / "jobs.db"
+        self._initialized = False
+    
+    async def initialize(self):
+        """작업 테이블 초기화"""
+        if self._initialized:
+            return
+        
+        async with aiosqlite.connect(self.db_path) as db:
+            await db.execute("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    job_id TEXT PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    params TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    stage TEXT NOT NULL,
+                    error TEXT,
+                    created_at TEXT NOT NULL,
+                    updated_at TEXT NOT NULL
+                )
+            """)
+            
+            await db.execute("""
+                CREATE TABLE IF NOT EXISTS job_items (
+                    job_id TEXT NOT NULL,
+                    idx INTEGER NOT NULL,
+                    query TEXT,
+                    corp_code TEXT,
+                    corp_name TEXT,
+                    stock_code TEXT,
+                    operating_income REAL,
+                    fs_div TEXT,
+                    ebitda REAL,
+                    rank INTEGER,
+                    state TEXT NOT NULL,
+                    error TEXT,
+                    PRIMARY KEY (job_id, idx)
+                )
+            """)
+            
+            await db.execute("""
+                CREATE INDEX IF NOT EXISTS idx_job_items_state
+                ON job_items(job_id, state)
+            """)
+            
+            await db.commit()
+        
+        self._initialized = True
+    
+    def _job_from_row(self, row: Tuple) -> Dict[str, Any]:
+        job_id, kind, params, status, stage, error, created_at, updated_at = row
+        return {
+            "job_id": job_id,
+            "kind": kind,
+            "params": json.loads(params),
+            "status": status,
+            "stage": stage,
+            "error": error,
+            "created_at": created_at,
+            "updated_at": updated_at
+        }
+    
+    async def create_job(self, job_id: str, kind: str, params: Dict[str, Any], stage: str):
+        """작업 등록 (QUEUED)"""
+        await self.initialize()
+        
+        now = datetime.now().isoformat()
+        
+        async with aiosqlite.connect(self.db_path) as db:
+            await db.execute("""
+                INSERT INTO jobs (job_id, kind, params, status, stage, error, created_at, updated_at)
+                VALUES (?, ?, ?, ?, ?, NULL, ?, ?)
+            """, (job_id, kind, json.dumps(params), self.QUEUED, stage, now, now))
+            await db.commit()
+    
+    async def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """작업 조회 (없으면 None)"""
+        await self.initialize()
+        
+        async with aiosqlite.connect(self.db_path) as db:
+            async with db.execute(
+                "SELECT job_id, kind, params, status, stage, error, created_at, updated_at "
+                "FROM jobs WHERE job_id = ?",
+                (job_id,)
+            ) as cursor:
+                row = await cursor.fetchone()
+        
+        return self._job_from_row(row) if row else None
+    
+    async def list_unfinished(self) -> List[str]:
+        """재시작 시 이어서 처리할 작업 ID (등록 순)"""
+        await self.initialize()
+        
+        async with aiosqlite.connect(self.db_path) as db:
+            async with db.execute(
+                "SELECT job_id FROM jobs WHERE status IN (?, ?) ORDER BY created_at",
+                (self.QUEUED, self.RUNNING)
+            ) as cursor:
+                return [row[0] for row in await cursor.fetchall()]
+    
+    async def update_job(
+        self,
+        job_id: str,
+        status: Optional[str] = None,
+        stage: Optional[str] = None,
+        error: Optional[str] = None
+    ):
+        """작업 상태/단계 갱신"""
+        await self.initialize()
+        
+        async with aiosqlite.connect(self.db_path) as db:
+            await db.execute("""
+                UPDATE jobs SET
+                    status = COALESCE(?, status),
+                    stage = COALESCE(?, stage),
+                    error = COALESCE(?, error),
+                    updated_at = ?
+                WHERE job_id = ?
+            """, (status, stage, error, datetime.now().isoformat(), job_id))
+            await db.commit()
+    
+    async def add_items(self, job_id: str, items: Iterable[Dict[str, Any]]):
+        """
+        작업 항목 일괄 등록
+        
+        Args:
+            job_id: 작업 ID
+            items: ITEM_COLUMNS 키를 가진 항목 (없는 키는 NULL)
+        """
+        await self.initialize()
+        
+        columns = ", ".join(self.ITEM_COLUMNS)
+        placeholders = ", ".join("?" * len(self.ITEM_COLUMNS))
+        
+        async with aiosqlite.connect(self.db_path) as db:
+            await db.executemany(
+                f"INSERT OR REPLACE INTO job_items (job_id, {columns}) VALUES (?, {placeholders})",
+                (
+                    (job_id, *(item.get(column) for column in self.ITEM_COLUMNS))
+                    for item in items
+                )
+            )
+            await db.commit()
+    
+    async def update_items(self, job_id: str, updates: Iterable[Dict[str, Any]]):
+        """
+        항목 결과 기록 (체크포인트)
+        
+        Args:
+            job_id: 작업 ID
+            updates: idx 와 갱신할 컬럼 값을 가진 딕셔너리 목록 (한 트랜잭션으로 기록)
+        """
+        await self.initialize()
+        
+        async with aiosqlite.connect(self.db_path) as db:
+            for update in updates:
+                columns = [column for column in update if column != "idx"]
+                assignments = ", ".join(f"{column} = ?" for column in columns)
+                await db.execute(
+                    f"UPDATE job_items SET {assignments} WHERE job_id = ? AND idx = ?",
+                    (*(update[column] for column in columns), job_id, update["idx"])
+                )
+            
+            await db.execute(
+                "UPDATE jobs SET updated_at = ? WHERE job_id = ?",
+                (datetime.now().isoformat(), job_id)
+            )
+            await db.commit()
+    
+    async def get_items(
+        self,
+        job_id: str,
+        states: Optional[Iterable[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        작업 항목 조회 (등록 순)
+        
+        Args:
+            job_id: 작업 ID
+            states: 조회할 항목 상태 (None 이면 전체)
+        """
+        await self.initialize()
+        
+        query = f"SELECT {', '.join(self.ITEM_COLUMNS)} FROM job_items WHERE job_id = ?"
+        params: List[Any] = [job_id]
+        
+        if states is not None:
+            states = list(states)
+            query += f" AND state IN ({', '.join('?' * len(states))})"
+            params.extend(states)
+        
+        async with aiosqlite.connect(self.db_path) as db:
+            async with db.execute(query + " ORDER BY idx", params) as cursor:
+                rows = await cursor.fetchall()
+        
+        return [dict(zip(self.ITEM_COLUMNS, row)) for row in rows]
+    
+    async def count_items(self, job_id: str) -> Dict[str, int]:
+        """항목 상태별 개수"""
+        await self.initialize()
+        
+        async with aiosqlite.connect(self.db_path) as db:
+            async with db.execute(
+                "SELECT state, COUNT(*) FROM job_items WHERE job_id = ? GROUP BY state",
+                (job_id,)
+            ) as cursor:
+                return {state: count for state, count in await cursor.fetchall()}
+    
+    async def get_results_page(
+        self,
+        job_id: str,
+        page: int,
+        page_size: int
+    ) -> List[Dict[str, Any]]:
+        """
+        결과 페이지 조회 (순위 순, 순위가 없는 항목은 등록 순으로 마지막)
+        
+        Args:
+            job_id: 작업 ID
+            page: 페이지 번호 (1부터)
+            page_size: 페이지 크기
+        """
+        await self.initialize()
+        
+        async with aiosqlite.connect(self.db_path) as db:
+            async with db.execute(
+                f"SELECT {', '.join(self.ITEM_COLUMNS)} FROM job_items WHERE job_id = ? "
+                "ORDER BY rank IS NULL, rank, idx LIMIT ? OFFSET ?",
+                (job_id, page_size, (page - 1) * page_size)
+            ) as cursor:
+                rows = await cursor.fetchall()
+        
+        return [dict(zip(self.ITEM_COLUMNS, row)) for row in rows]
+
+
+# 싱글톤 인스턴스
+job_store = JobStore()
@@ -2,13 +2,45 @@
 Rate Limiting 유틸리티
 """
 import asyncio
+import math
 import time
 from collections import deque
+from contextvars import ContextVar
 from typing import Optional
+from app.utils.deadline import DeadlineExceeded, can_wait
+
+
+# 요청 우선순위 (작업 큐 등 대량 작업은 태스크 컨텍스트에 BULK 로 설정)
+PRIORITY_INTERACTIVE = "interactive"
+PRIORITY_BULK = "bulk"
+
+request_priority: ContextVar[str] = ContextVar("request_priority", default=PRIORITY_INTERACTIVE)
+
+
+class AdmissionRejected(Exception):
+    """예상 대기 시간이 너무 길어 요청을 받지 않음 (과부하)"""
+    
+    code = "OVERLOADED"
+    retryable = False
+    
+    def __init__(self, estimated_wait: float, max_wait: float):
+        self.estimated_wait = estimated_wait
+        # 새 요청이 없다면 대기열이 max_wait 안으로 줄어드는 시점 (초, 최소 1)
+        self.retry_after = max(1, math.ceil(estimated_wait - max_wait))
+        self.message = (
+            f"OPENDART 호출 대기열이 가득 찼습니다. "
+            f"{self.retry_after}초 후 다시 시도해주세요."
+        )
+        super().__init__(f"[{self.code}] {self.message}")
 
 
 class RateLimiter:
-    """토큰 버킷 알고리즘 기반 Rate Limiter"""
+    """
+    토큰 버킷 알고리즘 기반 Rate Limiter
+    
+    현재 컨텍스트의 request_priority 가 BULK 이면 대기 중인 일반 요청이 없을 때만
+    토큰을 가져가므로, 대량 작업이 사용자 요청의 응답 시간을 밀어내지 않는다.
+    """
     
     def __init__(self, max_calls: int, time_window: float = 1.0):
         """
@@ -20,20 +52,47 @@ class RateLimiter:
         self.time_window = time_window
         self.calls: deque = deque()
         self._lock = asyncio.Lock()
+        self._interactive_waiting = 0
     
     async def acquire(self, timeout: Optional[float] = None) -> bool:
         """
         Rate limit 토큰 획득
         
+        다음 토큰까지 기다려야 하는 시간이 timeout 을 넘으면 끝까지 기다리지 않고 바로 실패한다.
+        
         Args:
             timeout: 최대 대기 시간 (초), None이면 무한 대기
         
         Returns:
             토큰 획득 성공 여부
         """
+        if request_priority.get() == PRIORITY_BULK:
+            return await self._acquire_bulk(timeout)
+        
+        self._interactive_waiting += 1
+        try:
+            return await self._acquire_interactive(timeout)
+        finally:
+            self._interactive_waiting -= 1
+    
+    async def _acquire_interactive(self, timeout: Optional[float]) -> bool:
+        """일반 요청 토큰 획득 (잠금을 잡고 순서대로 대기, 잠금 대기도 timeout 에 포함)"""
         start_time = time.time()
         
-        async with self._lock:
+        # wait_for(lock.acquire()) 는 시간 초과와 잠금 획득이 겹치면 잠금을 놓지 않을 수 있으므로
+        # 획득 태스크를 직접 기다리고, 기다리지 않게 되면 획득한 잠금을 반환한다
+        waiter = asyncio.ensure_future(self._lock.acquire())
+        try:
+            done, _ = await asyncio.wait({waiter}, timeout=timeout)
+        except BaseException:
+            self._abandon_lock_waiter(waiter)
+            raise
+        
+        if not done:
+            self._abandon_lock_waiter(waiter)
+            return False
+        
+        try:
             while True:
                 now = time.time()
                 
@@ -46,14 +105,116 @@ class RateLimiter:
                     self.calls.append(now)
                     return True
                 
-                # 타임아웃 체크
-                if timeout is not None and (now - start_time) >= timeout:
+                # 다음 토큰이 사용 가능할 때까지 대기 (제한 시간 안에 못 받으면 실패)
+                sleep_time = self.calls[0] + self.time_window - now
+                if timeout is not None and (now - start_time) + sleep_time > timeout:
                     return False
                 
-                # 다음 토큰이 사용 가능할 때까지 대기
-                sleep_time = self.calls[0] + self.time_window - now
                 if sleep_time > 0:
                     await asyncio.sleep(min(sleep_time, 0.1))
+        finally:
+            self._lock.release()
+    
+    def _abandon_lock_waiter(self, waiter: "asyncio.Future") -> None:
+        """시간 초과/취소로 기다리지 않게 된 잠금 획득 정리 (이미 획득했으면 반환)"""
+        def release_if_acquired(task: "asyncio.Future") -> None:
+            if not task.cancelled() and task.exception() is None:
+                self._lock.release()
+        
+        if waiter.done():
+            release_if_acquired(waiter)
+        else:
+            waiter.cancel()
+            waiter.add_done_callback(release_if_acquired)
+    
+    async def _acquire_bulk(self, timeout: Optional[float]) -> bool:
+        """
+        대량 작업 토큰 획득
+        
+        잠금을 잡은 채 기다리지 않으므로, 대기 중에 들어온 일반 요청이 먼저 토큰을 가져간다.
+        """
+        start_time = time.time()
+        
+        while True:
+            sleep_time = 0.1
+            
+            if not self._interactive_waiting and not self._lock.locked():
+                async with self._lock:
+                    now = time.time()
+                    
+                    while self.calls and self.calls[0] <= now - self.time_window:
+                        self.calls.popleft()
+                    
+                    if len(self.calls) < self.max_calls:
+                        self.calls.append(now)
+                        return True
+                    
+                    sleep_time = self.calls[0] + self.time_window - now
+                    
+                    if timeout is not None and (now - start_time) + sleep_time > timeout:
+                        return False
+            
+            if timeout is not None and (time.time() - start_time) >= timeout:
+                return False
+            
+            await asyncio.sleep(min(max(sleep_time, 0.01), 0.1))
+    
+    def estimated_wait(self, ahead: Optional[int] = None) -> float:
+        """
+        지금 일반 요청이 들어오면 토큰을 받기까지 걸릴 예상 시간 (초)
+        
+        앞에서 기다리는 요청이 모두 토큰을 받은 뒤 차례가 오므로,
+        시간 윈도우 안의 호출 기록에 앞선 요청들의 토큰 획득 시각을 차례로 이어 붙여 계산한다.
+        (대량 작업은 일반 요청이 없을 때만 토큰을 가져가므로 세지 않는다)
+        
+        Args:
+            ahead: 앞에서 기다리는 요청 수 (None 이면 현재 대기 중인 일반 요청 수)
+        """
+        now = time.time()
+        ahead = self._interactive_waiting if ahead is None else ahead
+        
+        history = [called_at for called_at in self.calls if called_at > now - self.time_window]
+        granted_at = now
+        
+        for _ in range(ahead + 1):
+            if len(history) >= self.max_calls:
+                granted_at = max(now, history[-self.max_calls] + self.time_window)
+            else:
+                granted_at = now
+            history.append(granted_at)
+        
+        return granted_at - now
+    
+    def admit(self, max_wait: float, ahead: Optional[int] = None):
+        """
+        일반 요청 수락 여부 확인 (토큰은 소비하지 않음)
+        
+        Args:
+            max_wait: 허용하는 최대 예상 대기 시간 (초)
+            ahead: 앞에서 기다리는 요청 수 (None 이면 현재 대기 중인 일반 요청 수)
+        
+        Raises:
+            AdmissionRejected: 예상 대기 시간이 max_wait 를 넘는 경우
+        """
+        estimated_wait = self.estimated_wait(ahead)
+        if estimated_wait > max_wait:
+            raise AdmissionRejected(estimated_wait, max_wait)
+    
+    def refund(self):
+        """마지막으로 내준 토큰 반환 (받고 나서 쓰지 않게 된 경우)"""
+        if self.calls:
+            self.calls.pop()
+    
+    def has_capacity(self, queued: int = 0) -> bool:
+        """
+        대기 중인 요청이 모두 토큰을 받은 뒤에도 토큰이 남는지 여부 (토큰은 소비하지 않음)
+        
+        Args:
+            queued: 이 limiter 앞 단계(공정 큐 등)에서 기다리는 요청 수
+        """
+        threshold = time.time() - self.time_window
+        in_window = sum(1 for called_at in self.calls if called_at > threshold)
+        return in_window + self._interactive_waiting + queued < self.max_calls
 
 
 class ExponentialBackoff:
@@ -94,7 +255,8 @@ class ExponentialBackoff:
             함수 실행 결과
         
         Raises:
-            마지막 시도의 예외
+            마지막 시도의 예외 (retryable 이 False 인 예외는 즉시)
+            DeadlineExceeded: 다음 재시도까지 기다리면 요청 마감이 지나는 경우
         """
         last_exception = None
         
@@ -104,8 +266,13 @@ class ExponentialBackoff:
             except Exception as e:
                 last_exception = e
                 
+                if not getattr(e, "retryable", True):
+                    raise
+                
                 if retry < self.max_retries - 1:
                     delay = self.get_delay(retry)
+                    if not can_wait(delay):
+                        raise DeadlineExceeded() from e
                     await asyncio.sleep(delay)
         
         raise last_exception
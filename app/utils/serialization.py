@@ -0,0 +1,353 @@
+"""
+고속 직렬화 (orjson) 및 응답 형식 협상 (JSON / MessagePack / Arrow IPC), 표 형식 스트리밍 (CSV / Parquet)
+"""
+import csv
+import io
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, List, Optional, Sequence, Tuple
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+# 선택 의존성: 설치되지 않았으면 해당 형식을 제공하지 않는다 (JSON 은 항상 제공)
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import pyarrow
+    import pyarrow.ipc
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+
+MEDIA_JSON = "application/json"
+MEDIA_NDJSON = "application/x-ndjson"
+MEDIA_MSGPACK = "application/msgpack"
+MEDIA_ARROW = "application/vnd.apache.arrow.stream"
+MEDIA_CSV = "text/csv"
+MEDIA_PARQUET = "application/vnd.apache.parquet"
+
+# 같은 형식의 다른 이름
+MEDIA_ALIASES = {
+    "application/x-msgpack": MEDIA_MSGPACK,
+    "application/vnd.msgpack": MEDIA_MSGPACK
+}
+
+
+def _default(obj: Any) -> Any:
+    """orjson 이 직접 처리하지 못하는 값 변환"""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def loads(data: bytes) -> Any:
+    """JSON 역직렬화"""
+    return orjson.loads(data)
+
+
+def dumps(content: Any) -> bytes:
+    """
+    JSON 직렬화 (UTF-8 바이트, 한글은 이스케이프하지 않음)
+    
+    datetime/date 는 ISO 형식, pydantic 모델은 model_dump 결과로 변환한다.
+    NaN/Infinity 는 에러 없이 null 로 기록된다 (json.dumps(allow_nan=False) 와 다름).
+    금액은 파싱 단계에서 유한한 값만 받으므로 응답에 나오지 않는다.
+    """
+    return orjson.dumps(content, default=_default, option=orjson.OPT_NON_STR_KEYS)
+
+
+@lru_cache(maxsize=1024)
+def encode_constant(value: Tuple[str, ...]) -> bytes:
+    """
+    반복되는 문자열 목록(경고 메시지 등)의 JSON 배열 인코딩 (결과 재사용)
+    
+    Args:
+        value: 문자열 튜플 (해시 가능해야 캐싱된다)
+    """
+    return orjson.dumps(list(value))
+
+
+def dumps_with_fragments(content: Dict[str, Any], fragments: Dict[str, bytes]) -> bytes:
+    """
+    미리 인코딩한 조각을 끼워 넣어 객체 직렬화
+    
+    content 의 필드 순서대로 기록하되, fragments 에 있는 필드는 content 의 값 대신
+    이미 인코딩된 JSON 을 그 자리에 넣는다. content 에 없는 조각 필드는 끝에 붙인다.
+    orjson.Fragment(3.9+) 대신 바이트를 직접 이어 붙이므로 최소 버전(3.8)에서도 동작한다.
+    
+    Args:
+        content: 객체 (조각 필드는 자리만 표시하는 아무 값)
+        fragments: {필드명: 인코딩된 JSON 값}
+    """
+    parts: List[bytes] = []
+    run: Dict[str, Any] = {}
+    
+    def flush():
+        # 조각 사이의 일반 필드는 한 번에 직렬화한 뒤 중괄호만 떼어 낸다
+        if run:
+            parts.append(dumps(run)[1:-1])
+            run.clear()
+    
+    for key, value in content.items():
+        if key in fragments:
+            flush()
+            parts.append(dumps(key) + b":" + fragments[key])
+        else:
+            run[key] = value
+    flush()
+    
+    for key, encoded in fragments.items():
+        if key not in content:
+            parts.append(dumps(key) + b":" + encoded)
+    
+    return b"{" + b",".join(parts) + b"}"
+
+
+class ORJSONUTF8Response(JSONResponse):
+    """orjson 기반 JSON 응답 (한글 그대로 UTF-8 출력)"""
+    
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def _msgpack_default(obj: Any) -> Any:
+    """msgpack 이 직접 처리하지 못하는 값 변환 (JSON 과 같은 표현)"""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    if isinstance(obj, (datetime, date)):
+        return obj.isoformat()
+    raise TypeError(f"Type is not MessagePack serializable: {type(obj).__name__}")
+
+
+def pack(content: Any) -> bytes:
+    """MessagePack 직렬화 (문자열은 UTF-8 str, 바이트는 bin 타입)"""
+    return msgpack.packb(content, default=_msgpack_default, use_bin_type=True)
+
+
+def is_available(media_type: str) -> bool:
+    """해당 형식의 직렬화 라이브러리가 설치되어 있는지 여부"""
+    if media_type == MEDIA_MSGPACK:
+        return msgpack is not None
+    if media_type in (MEDIA_ARROW, MEDIA_PARQUET):
+        return pyarrow is not None
+    return True
+
+
+def negotiate_media_type(
+    accept: Optional[str],
+    offered: Sequence[str],
+    aliases: Optional[Dict[str, str]] = None
+) -> Optional[str]:
+    """
+    Accept 헤더로 응답 형식 선택
+    
+    각 형식에 가장 구체적으로 일치하는 범위(type/subtype > type/* > */*)의 q 값을 쓰고,
+    q 값이 같으면 offered 순서(앞쪽이 기본 형식)를 따른다.
+    
+    Args:
+        accept: Accept 헤더 값 (없으면 첫 번째 형식)
+        offered: 제공 가능한 형식 (설치되지 않은 형식은 제외)
+        aliases: 이 협상에서만 같은 형식으로 볼 이름 {Accept 의 형식: offered 의 형식}
+    
+    Returns:
+        선택된 형식 (받을 수 있는 형식이 없으면 None)
+    """
+    offered = [media_type for media_type in offered if is_available(media_type)]
+    if not accept or not accept.strip():
+        return offered[0]
+    
+    aliases = {**MEDIA_ALIASES, **(aliases or {})}
+    
+    ranges: List[Tuple[str, float]] = []
+    for part in accept.split(","):
+        media_range, *params = (piece.strip() for piece in part.split(";"))
+        if not media_range:
+            continue
+        
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        
+        media_range = media_range.lower()
+        ranges.append((aliases.get(media_range, media_range), quality))
+    
+    best: Optional[str] = None
+    best_quality = 0.0
+    
+    for media_type in offered:
+        main_type = media_type.split("/")[0]
+        specificity, quality = -1, 0.0
+        
+        for media_range, range_quality in ranges:
+            if media_range == media_type:
+                match = 2
+            elif media_range == f"{main_type}/*":
+                match = 1
+            elif media_range == "*/*":
+                match = 0
+            else:
+                continue
+            
+            if match > specificity:
+                specificity, quality = match, range_quality
+        
+        if quality > best_quality:
+            best, best_quality = media_type, quality
+    
+    return best
+
+
+class _ChunkSink:
+    """Arrow IPC 기록 결과를 조각 단위로 꺼내기 위한 파일 객체"""
+    
+    def __init__(self):
+        self.chunks: List[bytes] = []
+        self.closed = False
+    
+    def write(self, data) -> int:
+        self.chunks.append(bytes(data))
+        return len(data)
+    
+    def flush(self):
+        pass
+    
+    def close(self):
+        self.closed = True
+    
+    def drain(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks.clear()
+        return data
+
+
+def arrow_schema(columns: Sequence[Tuple[str, str]]):
+    """(컬럼명, Arrow 타입 별칭) 목록으로 스키마 생성 (예: ("year", "int32"))"""
+    return pyarrow.schema([
+        (name, pyarrow.type_for_alias(type_alias))
+        for name, type_alias in columns
+    ])
+
+
+async def arrow_stream(
+    rows: AsyncIterator[Dict[str, Any]],
+    columns: Sequence[Tuple[str, str]],
+    batch_rows: int = 256
+) -> AsyncIterator[bytes]:
+    """
+    행 딕셔너리를 Arrow IPC 스트림 형식으로 인코딩
+    
+    batch_rows 행마다 레코드 배치 하나를 내보내므로 전체 표를 메모리에 들고 있지 않는다.
+    
+    Args:
+        rows: 컬럼명을 키로 가진 행 (없는 키는 null)
+        columns: (컬럼명, Arrow 타입 별칭) 목록
+        batch_rows: 레코드 배치 하나의 행 수
+    
+    Yields:
+        IPC 스트림 조각 (이어 붙이면 하나의 스트림)
+    """
+    schema = arrow_schema(columns)
+    sink = _ChunkSink()
+    writer = pyarrow.ipc.new_stream(sink, schema)
+    buffer: List[Dict[str, Any]] = []
+    
+    async for row in rows:
+        buffer.append(row)
+        if len(buffer) >= batch_rows:
+            writer.write_batch(pyarrow.RecordBatch.from_pylist(buffer, schema=schema))
+            buffer.clear()
+            yield sink.drain()
+    
+    if buffer:
+        writer.write_batch(pyarrow.RecordBatch.from_pylist(buffer, schema=schema))
+    writer.close()
+    yield sink.drain()
+
+
+async def csv_stream(
+    rows: AsyncIterator[Dict[str, Any]],
+    columns: Sequence[Tuple[str, str]],
+    chunk_rows: int = 500
+) -> AsyncIterator[bytes]:
+    """
+    행 딕셔너리를 CSV(UTF-8, 첫 줄 헤더)로 인코딩
+    
+    chunk_rows 행마다 완성된 줄 단위로 내보낸다.
+    
+    Args:
+        rows: 컬럼명을 키로 가진 행 (없는 키/None 은 빈 값)
+        columns: (컬럼명, Arrow 타입 별칭) 목록 (컬럼명만 사용)
+        chunk_rows: 한 번에 내보낼 행 수
+    
+    Yields:
+        CSV 조각
+    """
+    buffer = io.StringIO()
+    writer = csv.DictWriter(
+        buffer,
+        fieldnames=[name for name, _ in columns],
+        extrasaction="ignore",
+        lineterminator="\n"
+    )
+    writer.writeheader()
+    count = 0
+    
+    async for row in rows:
+        writer.writerow(row)
+        count += 1
+        
+        if count >= chunk_rows:
+            yield buffer.getvalue().encode("utf-8")
+            buffer.seek(0)
+            buffer.truncate()
+            count = 0
+    
+    yield buffer.getvalue().encode("utf-8")
+
+
+async def parquet_stream(
+    rows: AsyncIterator[Dict[str, Any]],
+    columns: Sequence[Tuple[str, str]],
+    chunk_rows: int = 500
+) -> AsyncIterator[bytes]:
+    """
+    행 딕셔너리를 Parquet 파일로 인코딩
+    
+    chunk_rows 행마다 행 그룹 하나를 기록해 내보내므로 전체 표를 메모리에 들고 있지 않는다.
+    (파일 메타데이터는 마지막 조각에 기록되므로 끝까지 받아야 읽을 수 있다)
+    
+    Args:
+        rows: 컬럼명을 키로 가진 행 (없는 키는 null)
+        columns: (컬럼명, Arrow 타입 별칭) 목록
+        chunk_rows: 행 그룹 하나의 행 수
+    
+    Yields:
+        Parquet 파일 조각 (이어 붙이면 하나의 파일)
+    """
+    schema = arrow_schema(columns)
+    sink = _ChunkSink()
+    writer = pyarrow.parquet.ParquetWriter(sink, schema)
+    buffer: List[Dict[str, Any]] = []
+    
+    async for row in rows:
+        buffer.append(row)
+        if len(buffer) >= chunk_rows:
+            writer.write_table(pyarrow.Table.from_pylist(buffer, schema=schema))
+            buffer.clear()
+            yield sink.drain()
+    
+    if buffer:
+        writer.write_table(pyarrow.Table.from_pylist(buffer, schema=schema))
+    writer.close()
+    yield sink.drain()
@@ -0,0 +1,3 @@
+"""
+성능 측정 스크립트
+"""
@@ -0,0 +1,64 @@
+"""
+계정 키워드 매칭 벤치마크 (중첩 루프 4회 vs 컴파일된 매처 단일 패스)
+
+실행: python -m benchmarks.bench_account_matcher
+"""
+import timeit
+
+from app.models import AccountRow
+from app.services.ebitda_calculator import ebitda_calculator
+from app.services.financial_service import financial_service
+from benchmarks.payloads import make_accounts
+
+
+def nested_find(accounts, keywords):
+    """기존 방식: 비교할 때마다 계정명과 키워드를 lower()"""
+    for account in accounts:
+        account_name_lower = account.account_nm.lower()
+        for keyword in keywords:
+            if keyword.lower() in account_name_lower:
+                return account
+    return None
+
+
+def nested_components(is_accounts, cf_accounts):
+    """기존 방식: 영업이익 / 통합 / 감가상각비 / 무형자산상각비 순차 검색"""
+    calc = ebitda_calculator
+    operating_income = nested_find(is_accounts, calc.OPERATING_INCOME_KEYWORDS)
+    combined = nested_find(cf_accounts, calc.COMBINED_DEPRECIATION_KEYWORDS)
+    if combined:
+        return operating_income, combined, combined
+    return (
+        operating_income,
+        nested_find(cf_accounts, calc.DEPRECIATION_KEYWORDS),
+        nested_find(cf_accounts, calc.AMORTIZATION_KEYWORDS)
+    )
+
+
+def main():
+    partitions = financial_service.partition_accounts(make_accounts())
+    is_rows, cf_rows = partitions["IS"], partitions["CF"]
+    is_records = [AccountRow.from_row(row) for row in is_rows]
+    cf_records = [AccountRow.from_row(row) for row in cf_rows]
+    number = 5000
+
+    before = timeit.timeit(
+        lambda: nested_components(is_records, cf_records),
+        number=number
+    )
+    after = timeit.timeit(
+        lambda: (
+            ebitda_calculator._find_operating_income(is_rows),
+            ebitda_calculator._find_depreciation_amortization(cf_rows)
+        ),
+        number=number
+    )
+
+    print(f"rows: IS {len(is_rows)} / CF {len(cf_rows)}")
+    print(f"중첩 루프 4회:        {before / number * 1e6:8.1f} us/req")
+    print(f"컴파일된 매처:        {after / number * 1e6:8.1f} us/req")
+    print(f"개선 배율:            {before / after:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+계정 분류 벤치마크 (pydantic 2회 필터링 vs 단일 패스 분류)
+
+양쪽 모두 같은 작업(IS/CF 분류 → 영업이익/통합/감가상각비/무형자산상각비 키워드 검색)을
+끝까지 수행한다. 키워드 검색 방식도 같은 중첩 루프로 맞춰 분류/레코드 생성 차이만 비교한다.
+양쪽에 같은 검색 비용(약 40us)이 남으므로 배율은 300행 기준 6~8배로, 목표한 10배에는 못 미친다.
+
+실행: python -m benchmarks.bench_account_partition
+"""
+import timeit
+
+from app.models import AccountRow, FinancialAccount
+from app.services.ebitda_calculator import ebitda_calculator
+from app.services.financial_service import financial_service
+from benchmarks.payloads import make_accounts
+
+
+def pydantic_extract(accounts, sj_div):
+    """기존 방식: 구분마다 전체를 훑으며 pydantic 모델 생성"""
+    return [
+        FinancialAccount(
+            account_nm=acc.get("account_nm", ""),
+            thstrm_amount=acc.get("thstrm_amount"),
+            thstrm_add_amount=acc.get("thstrm_add_amount"),
+            sj_div=acc.get("sj_div", ""),
+            currency=acc.get("currency", "KRW")
+        )
+        for acc in accounts
+        if acc.get("sj_div") == sj_div
+    ]
+
+
+def model_find(accounts, keywords):
+    """기존 방식: pydantic 모델 목록에서 키워드 검색"""
+    for account in accounts:
+        account_name_lower = account.account_nm.lower()
+        for keyword in keywords:
+            if keyword.lower() in account_name_lower:
+                return account
+    return None
+
+
+def row_find(rows, keywords):
+    """단일 패스 방식: 원본 행에서 키워드 검색, 찾은 행만 레코드 생성"""
+    keywords_lower = [keyword.lower() for keyword in keywords]
+    for row in rows:
+        account_name_lower = row.get("account_nm", "").lower()
+        for keyword in keywords_lower:
+            if keyword in account_name_lower:
+                return AccountRow.from_row(row)
+    return None
+
+
+def find_components(is_accounts, cf_accounts, find):
+    """영업이익 / 통합 / 감가상각비 / 무형자산상각비 순차 검색"""
+    calc = ebitda_calculator
+    operating_income = find(is_accounts, calc.OPERATING_INCOME_KEYWORDS)
+    combined = find(cf_accounts, calc.COMBINED_DEPRECIATION_KEYWORDS)
+    if combined:
+        return operating_income, combined, combined
+    return (
+        operating_income,
+        find(cf_accounts, calc.DEPRECIATION_KEYWORDS),
+        find(cf_accounts, calc.AMORTIZATION_KEYWORDS)
+    )
+
+
+def extract_before(accounts):
+    """기존 추출: IS/CF 각각 pydantic 필터링 후 검색"""
+    return find_components(
+        pydantic_extract(accounts, "IS"),
+        pydantic_extract(accounts, "CF"),
+        model_find
+    )
+
+
+def extract_after(accounts):
+    """단일 패스 추출: 한 번 분류 후 원본 행에서 검색"""
+    partitions = financial_service.partition_accounts(accounts)
+    return find_components(
+        partitions.get("IS", []),
+        partitions.get("CF", []),
+        row_find
+    )
+
+
+def main():
+    accounts = make_accounts()
+    number = 2000
+    
+    # 같은 계정을 찾는지 확인
+    before_names = [acc and acc.account_nm for acc in extract_before(accounts)]
+    after_names = [acc and acc.account_nm for acc in extract_after(accounts)]
+    assert before_names == after_names, (before_names, after_names)
+    
+    before = timeit.timeit(lambda: extract_before(accounts), number=number)
+    after = timeit.timeit(lambda: extract_after(accounts), number=number)
+    
+    print(f"rows: {len(accounts)}")
+    print(f"pydantic 분류 + 검색:  {before / number * 1e6:8.1f} us/req")
+    print(f"단일 패스 분류 + 검색: {after / number * 1e6:8.1f} us/req")
+    print(f"개선 배율:            {before / after:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+일괄 계산 응답 형식 벤치마크 (NDJSON vs MessagePack vs Arrow IPC, 2,000개 회사)
+
+실행: python -m benchmarks.bench_batch_formats (msgpack, pyarrow 필요)
+"""
+import asyncio
+import io
+import time
+
+import msgpack
+import pyarrow
+
+from app.models import EBITDABatchItem
+from app.routers.ebitda import BATCH_ARROW_COLUMNS, _batch_line, _batch_row, _encode_batch_line
+from app.utils.serialization import arrow_stream, loads, pack
+from benchmarks.bench_response_serialization import CORP_INFO, RESULT
+
+
+COMPANIES = 2000
+
+
+def make_results():
+    """(항목 순번, 항목, 회사 정보, 계산 결과, 에러) 목록"""
+    results = []
+    for index in range(COMPANIES):
+        item = EBITDABatchItem(company=f"{index:06d}", year=2023, report_code="11011")
+        corp_info = dict(CORP_INFO, corp_code=f"{index:08d}", stock_code=f"{index:06d}")
+        results.append((index, item, corp_info, RESULT, None))
+    return results
+
+
+def encode_ndjson(results):
+    return b"".join(_encode_batch_line(*entry) for entry in results)
+
+
+def encode_msgpack(results):
+    return b"".join(pack(_batch_line(*entry)) for entry in results)
+
+
+def encode_arrow(results):
+    async def rows():
+        for entry in results:
+            yield _batch_row(*entry)
+    
+    async def collect():
+        return b"".join([chunk async for chunk in arrow_stream(rows(), BATCH_ARROW_COLUMNS)])
+    
+    return asyncio.run(collect())
+
+
+def decode_ndjson(data):
+    return [loads(line) for line in data.splitlines()]
+
+
+def decode_msgpack(data):
+    return list(msgpack.Unpacker(io.BytesIO(data), raw=False))
+
+
+def decode_arrow(data):
+    return pyarrow.ipc.open_stream(data).read_all()
+
+
+def measure(func, arg, number=10):
+    """최소 실행 시간 (ms)"""
+    best = float("inf")
+    for _ in range(number):
+        start = time.perf_counter()
+        func(arg)
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3
+
+
+def main():
+    results = make_results()
+    
+    formats = (
+        ("NDJSON (orjson)", encode_ndjson, decode_ndjson),
+        ("MessagePack", encode_msgpack, decode_msgpack),
+        ("Arrow IPC (펼친 표)", encode_arrow, decode_arrow)
+    )
+    
+    print(f"companies: {COMPANIES}")
+    print(f"{'형식':22s} {'크기(KB)':>10s} {'인코딩(ms)':>12s} {'디코딩(ms)':>12s}")
+    for name, encode, decode in formats:
+        data = encode(results)
+        print(
+            f"{name:22s} {len(data) / 1024:10.1f} "
+            f"{measure(encode, results):12.2f} {measure(decode, data):12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
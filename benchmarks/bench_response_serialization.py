@@ -0,0 +1,142 @@
+"""
+EBITDA 응답 직렬화 벤치마크 (중첩 모델 + json.dumps vs 딕셔너리 + orjson)
+
+실행: python -m benchmarks.bench_response_serialization
+"""
+import json
+import timeit
+from datetime import datetime
+
+from fastapi.encoders import jsonable_encoder
+
+from app.models import (
+    EBITDAResponse, CompanyInfo, PeriodInfo, EBITDAComponents, ComponentAmount,
+    EBITDAResult, PriorPeriodEBITDA, SourceInfo
+)
+from app.routers.ebitda import _encode_ebitda_response
+
+
+CORP_INFO = {"corp_code": "00126380", "corp_name": "삼성전자", "stock_code": "005930"}
+
+RESULT = {
+    "report_name": "사업보고서",
+    "fs_div": "CFS",
+    "fs_name": "연결재무제표",
+    "currency": "KRW",
+    "basis": "누적",
+    "components": {
+        "operating_income": {"label": "영업이익", "amount": 6566976000000.0, "matched_by": "account_id"},
+        "depreciation": {"label": "감가상각비", "amount": 38666559000000.0, "matched_by": "account_nm"},
+        "amortization": {"label": "무형자산상각비", "amount": 3177856000000.0, "matched_by": "account_nm"}
+    },
+    "ebitda_total": 48411391000000.0,
+    "prior_periods": [
+        {
+            "year": 2022,
+            "label": "전기",
+            "operating_income": 43376630000000.0,
+            "depreciation": 35952120000000.0,
+            "amortization": 2926890000000.0,
+            "ebitda_total": 82255640000000.0
+        },
+        {
+            "year": 2021,
+            "label": "전전기",
+            "operating_income": 51633856000000.0,
+            "depreciation": 31285209000000.0,
+            "amortization": 2962152000000.0,
+            "ebitda_total": 85881217000000.0
+        }
+    ],
+    "rcept_no": "20240312000736",
+    "fetched_at": datetime(2024, 3, 12, 9, 30).isoformat(),
+    "from_cache": True,
+    "warnings": ["무형자산상각비는 주석 금액을 사용했습니다.", "전기 금액은 재작성 전 기준입니다."]
+}
+
+
+def build_models(corp_info, year, report_code, fs_div, result):
+    """기존 방식: 핸들러에서 중첩 응답 모델 생성"""
+    currency = result["currency"]
+    components = result["components"]
+    return EBITDAResponse(
+        company=CompanyInfo(**corp_info),
+        period=PeriodInfo(
+            year=year,
+            report_code=report_code,
+            report_name=result["report_name"],
+            fs_div=result["fs_div"],
+            fs_name=result["fs_name"],
+            requested_fs_div=fs_div
+        ),
+        components=EBITDAComponents(**{
+            name: ComponentAmount(currency=currency, **component)
+            for name, component in components.items()
+        }),
+        ebitda=EBITDAResult(total=result["ebitda_total"], currency=currency, basis=result["basis"]),
+        prior_periods=[
+            PriorPeriodEBITDA(
+                year=period["year"],
+                label=period["label"],
+                operating_income=period["operating_income"],
+                depreciation=period["depreciation"],
+                amortization=period["amortization"],
+                total=period["ebitda_total"],
+                currency=currency,
+                basis=result["basis"]
+            )
+            for period in result["prior_periods"]
+        ],
+        source=SourceInfo(
+            rcept_no=result["rcept_no"],
+            fetched_at=result["fetched_at"],
+            cached=result["from_cache"]
+        ),
+        warnings=result["warnings"]
+    )
+
+
+def legacy_path():
+    """모델 생성 → response_model 재검증 → jsonable_encoder → json.dumps"""
+    model = build_models(CORP_INFO, 2023, "11011", "CFS", RESULT)
+    validated = EBITDAResponse.model_validate(model.model_dump())
+    return json.dumps(
+        jsonable_encoder(validated),
+        ensure_ascii=False,
+        separators=(",", ":")
+    ).encode("utf-8")
+
+
+def model_dump_json_path():
+    """모델 생성 → model_dump_json"""
+    return build_models(CORP_INFO, 2023, "11011", "CFS", RESULT).model_dump_json().encode("utf-8")
+
+
+def fast_path():
+    """딕셔너리 → orjson (경고 목록은 미리 인코딩한 조각)"""
+    return _encode_ebitda_response(CORP_INFO, 2023, "11011", "CFS", RESULT)
+
+
+def main():
+    legacy = json.loads(legacy_path())
+    fast = json.loads(fast_path())
+    assert legacy == fast, "응답 본문이 기존 방식과 다릅니다"
+    assert "삼성전자".encode("utf-8") in fast_path(), "한글이 이스케이프되었습니다"
+    
+    number = 5000
+    timings = {
+        name: timeit.timeit(func, number=number) / number * 1e6
+        for name, func in (
+            ("모델 + json.dumps", legacy_path),
+            ("모델 + model_dump_json", model_dump_json_path),
+            ("딕셔너리 + orjson", fast_path)
+        )
+    }
+    
+    for name, micros in timings.items():
+        print(f"{name:24s} {micros:8.1f} us/req")
+    print(f"개선 배율 (기존 대비):     {timings['모델 + json.dumps'] / timings['딕셔너리 + orjson']:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
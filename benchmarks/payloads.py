@@ -0,0 +1,108 @@
+"""
+벤치마크용 fnlttSinglAcntAll 응답 생성
+"""
+import random
+from typing import Any, Dict, List
+
+
+# (sj_div, 재무제표명, 대표 계정명, account_id) - 실제 응답의 계정 구성을 본뜬 샘플
+STATEMENT_ACCOUNTS = {
+    "BS": ("재무상태표", [
+        ("유동자산", "ifrs-full_CurrentAssets"),
+        ("현금및현금성자산", "ifrs-full_CashAndCashEquivalents"),
+        ("매출채권", "dart_ShortTermTradeReceivable"),
+        ("재고자산", "ifrs-full_Inventories"),
+        ("비유동자산", "ifrs-full_NoncurrentAssets"),
+        ("유형자산", "ifrs-full_PropertyPlantAndEquipment"),
+        ("무형자산", "ifrs-full_IntangibleAssetsOtherThanGoodwill"),
+        ("자산총계", "ifrs-full_Assets"),
+        ("유동부채", "ifrs-full_CurrentLiabilities"),
+        ("부채총계", "ifrs-full_Liabilities"),
+        ("자본총계", "ifrs-full_Equity"),
+    ]),
+    "IS": ("손익계산서", [
+        ("매출액", "ifrs-full_Revenue"),
+        ("매출원가", "ifrs-full_CostOfSales"),
+        ("매출총이익", "ifrs-full_GrossProfit"),
+        ("판매비와관리비", "dart_TotalSellingGeneralAdministrativeExpenses"),
+        ("영업이익", "dart_OperatingIncomeLoss"),
+        ("기타수익", "dart_OtherGains"),
+        ("금융수익", "ifrs-full_FinanceIncome"),
+        ("법인세비용차감전순이익(손실)", "ifrs-full_ProfitLossBeforeTax"),
+        ("법인세비용", "ifrs-full_IncomeTaxExpenseContinuingOperations"),
+        ("당기순이익(손실)", "ifrs-full_ProfitLoss"),
+    ]),
+    "CIS": ("포괄손익계산서", [
+        ("당기순이익(손실)", "ifrs-full_ProfitLoss"),
+        ("기타포괄손익", "ifrs-full_OtherComprehensiveIncome"),
+        ("총포괄손익", "ifrs-full_ComprehensiveIncome"),
+    ]),
+    "CF": ("현금흐름표", [
+        ("영업활동현금흐름", "ifrs-full_CashFlowsFromUsedInOperatingActivities"),
+        ("당기순이익", "ifrs-full_ProfitLoss"),
+        ("조정", "ifrs-full_AdjustmentsForReconcileProfitLoss"),
+        ("감가상각비", "ifrs-full_AdjustmentsForDepreciationExpense"),
+        ("무형자산상각비", "ifrs-full_AdjustmentsForAmortisationExpense"),
+        ("이자수익", "ifrs-full_AdjustmentsForInterestIncome"),
+        ("투자활동현금흐름", "ifrs-full_CashFlowsFromUsedInInvestingActivities"),
+        ("유형자산의 취득", "ifrs-full_PurchaseOfPropertyPlantAndEquipmentClassifiedAsInvestingActivities"),
+        ("재무활동현금흐름", "ifrs-full_CashFlowsFromUsedInFinancingActivities"),
+    ]),
+    "SCE": ("자본변동표", [
+        ("기초자본", "ifrs-full_Equity"),
+        ("배당금지급", "ifrs-full_DividendsPaid"),
+        ("기말자본", "ifrs-full_Equity"),
+    ]),
+}
+
+# 구분별 행 수 (합계 300행)
+STATEMENT_ROWS = {"BS": 90, "IS": 35, "CIS": 25, "CF": 90, "SCE": 60}
+
+
+def _amount(rng: random.Random) -> str:
+    return str(rng.randint(-10 ** 12, 10 ** 13))
+
+
+def make_accounts(report_code: str = "11011", seed: int = 0) -> List[Dict[str, Any]]:
+    """
+    300행 규모의 fnlttSinglAcntAll list 생성
+    
+    대표 계정 뒤에 '기타 계정' 들을 채워 실제 응답과 비슷한 분포를 만든다.
+    """
+    rng = random.Random(seed)
+    rows = []
+    order = 0
+    
+    for sj_div, count in STATEMENT_ROWS.items():
+        sj_nm, accounts = STATEMENT_ACCOUNTS[sj_div]
+        for i in range(count):
+            if i < len(accounts):
+                account_nm, account_id = accounts[i]
+            else:
+                account_nm, account_id = f"기타{sj_nm}항목{i}", "-표준계정코드 미사용-"
+            order += 1
+            row = {
+                "rcept_no": "20240314000001",
+                "reprt_code": report_code,
+                "bsns_year": "2023",
+                "corp_code": "00126380",
+                "sj_div": sj_div,
+                "sj_nm": sj_nm,
+                "account_id": account_id,
+                "account_nm": account_nm,
+                "account_detail": "-",
+                "thstrm_nm": "제 55 기",
+                "thstrm_amount": _amount(rng),
+                "frmtrm_nm": "제 54 기",
+                "frmtrm_amount": _amount(rng),
+                "bfefrm_nm": "제 53 기",
+                "bfefrm_amount": _amount(rng),
+                "ord": str(order),
+                "currency": "KRW",
+            }
+            if report_code != "11011":
+                row["thstrm_add_amount"] = _amount(rng)
+                row["frmtrm_add_amount"] = _amount(rng)
+            rows.append(row)
+    
+    return rows
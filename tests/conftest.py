@@ -0,0 +1,213 @@
+"""
+공통 픽스처: OPENDART 를 호출하지 않는 회사 매핑 / EBITDA API 클라이언트
+"""
+from collections import deque
+from datetime import datetime
+
+import httpx
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.routers import ebitda as ebitda_router
+from app.services import corp_resolver as corp_resolver_module
+from app.services import financial_service as financial_service_module
+from app.services import period_engine as period_engine_module
+from app.services.corp_resolver import CorpRecord, CorpResolver
+from app.services.dart_client import dart_client
+from app.services.financial_service import financial_service
+from app.utils.cache import CacheManager, CorpCodeSnapshot, ResponseCache
+
+
+CORP_INFO = {"corp_code": "00126380", "corp_name": "삼성전자", "stock_code": "005930"}
+
+# 회사 매핑 (corp_code, corp_name, stock_code, modify_date)
+CORP_ROWS = [
+    ("00126380", "삼성전자", "005930", "20240101"),
+    ("00126362", "삼성SDI", "006400", "20240101"),
+    ("00999999", "삼성전자서비스", None, "20240101"),
+    ("00164779", "SK하이닉스", "000660", "20240101"),
+    ("00164742", "현대자동차", "005380", "20240101"),
+    ("00258801", "카카오", "035720", "20240101"),
+    ("01133217", "카카오뱅크", "323410", "20240101"),
+    ("00413046", "셀트리온", "068270", "20240101"),
+    # 동명 회사: 상장사가 하나뿐
+    ("00111111", "대한전선", "001440", "20240101"),
+    ("00222222", "대한전선", None, "20240101"),
+    # 동명 회사: 모두 비상장
+    ("00333333", "한국상사", None, "20240101"),
+    ("00444444", "한국상사", None, "20240101")
+]
+
+
+# 응답 캐시가 만료되지 않도록 테스트 시작 시각으로 고정
+FETCHED_AT = datetime.now().replace(microsecond=0).isoformat()
+
+
+def make_result(from_cache: bool = False, **overrides):
+    """calculate_ebitda 결과 형태의 고정 값"""
+    def component(label, amount):
+        return {"label": label, "amount": amount, "account_id": None, "matched_by": "keyword"}
+    
+    result = {
+        "fs_div": "CFS",
+        "fs_name": "연결재무제표",
+        "report_name": "사업보고서",
+        "currency": "KRW",
+        "basis": "annual",
+        "ebitda_total": 600.0,
+        "components": {
+            "operating_income": component("영업이익", 100.0),
+            "depreciation": component("감가상각비", 200.0),
+            "amortization": component("무형자산상각비", 300.0)
+        },
+        "prior_periods": [],
+        "rcept_no": "20250311001085",
+        "fetched_at": FETCHED_AT,
+        "from_cache": from_cache,
+        "warnings": []
+    }
+    result.update(overrides)
+    return result
+
+
+class FakeCalculator:
+    """호출 횟수를 세고, 처음 호출만 OPENDART 에서 조회한 것처럼 응답"""
+    
+    def __init__(self):
+        self.calls = 0
+        self.error = None
+    
+    async def calculate_ebitda(self, corp_code, year, report_code, fs_div):
+        self.calls += 1
+        if self.error is not None:
+            raise self.error
+        return make_result(from_cache=self.calls > 1)
+
+
+def corp_records():
+    return [CorpRecord(*row) for row in CORP_ROWS]
+
+
+def corp_code_xml(rows) -> bytes:
+    """corpCode.xml 형식 문서"""
+    items = "".join(
+        f"<list><corp_code>{corp_code}</corp_code><corp_name>{corp_name}</corp_name>"
+        f"<stock_code>{stock_code or ' '}</stock_code><modify_date>{modify_date}</modify_date></list>"
+        for corp_code, corp_name, stock_code, modify_date in rows
+    )
+    return f'<?xml version="1.0" encoding="UTF-8"?><result>{items}</result>'.encode()
+
+
+@pytest.fixture
+def resolver(monkeypatch, tmp_path):
+    """CORP_ROWS 로 매핑을 채운 resolver (스냅샷은 임시 디렉터리)"""
+    monkeypatch.setattr(
+        corp_resolver_module, "corp_code_snapshot", CorpCodeSnapshot(tmp_path / "cache.db")
+    )
+    resolver = CorpResolver()
+    resolver.cache_file = tmp_path / "corp_code.xml"
+    resolver.mapping = resolver._build_mapping(corp_records())
+    return resolver
+
+
+class FakeOpenDart:
+    """
+    OPENDART HTTP 응답 대역 (httpx.MockTransport)
+    
+    routes[엔드포인트] 에 httpx.Response 또는 (요청 → httpx.Response) 함수를 넣는다.
+    """
+    
+    def __init__(self):
+        self.routes = {}
+        self.requests = []
+    
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        endpoint = request.url.path.rsplit("/", 1)[-1]
+        self.requests.append(request)
+        route = self.routes.get(endpoint)
+        if route is None:
+            return httpx.Response(200, json={"status": "013", "message": "조회된 데이타가 없습니다."})
+        return route(request) if callable(route) else route
+    
+    def calls(self, endpoint: str):
+        return [r for r in self.requests if r.url.path.endswith("/" + endpoint)]
+
+
+@pytest.fixture
+def opendart(monkeypatch):
+    """dart_client 의 HTTP 요청을 FakeOpenDart 로 보냄 (호출 한도는 테스트마다 새로)"""
+    fake = FakeOpenDart()
+    monkeypatch.setattr(dart_client.rate_limiter, "calls", deque())
+    monkeypatch.setattr(
+        dart_client, "_client", httpx.AsyncClient(transport=httpx.MockTransport(fake.handle))
+    )
+    return fake
+
+
+def account_row(sj_div, account_nm, amount, account_id="", **fields):
+    """fnlttSinglAcntAll 계정 행"""
+    return {
+        "rcept_no": "20250311001085",
+        "sj_div": sj_div,
+        "account_id": account_id,
+        "account_nm": account_nm,
+        "thstrm_amount": amount,
+        "currency": "KRW",
+        **fields
+    }
+
+
+class FakeFinancialData:
+    """financial_service.get_financial_data 대역 (accounts 를 그대로 응답)"""
+    
+    def __init__(self):
+        self.accounts = []
+        self.calls = []
+    
+    async def get_financial_data(self, corp_code, year, report_code, fs_div="CFS", use_cache=True):
+        self.calls.append((corp_code, year, report_code, fs_div))
+        return {
+            "corp_code": corp_code,
+            "year": year,
+            "report_code": report_code,
+            "fs_div": "CFS" if fs_div == "AUTO" else fs_div,
+            "rcept_no": "20250311001085",
+            "fetched_at": FETCHED_AT,
+            "accounts": self.accounts,
+            "_from_cache": False
+        }
+
+
+@pytest.fixture
+def cache(monkeypatch, tmp_path):
+    """재무정보/분기 계산 결과 캐시를 임시 디렉터리의 CacheManager 로 교체"""
+    cache = CacheManager(tmp_path / "cache.db")
+    monkeypatch.setattr(financial_service_module, "cache_manager", cache)
+    monkeypatch.setattr(period_engine_module, "cache_manager", cache)
+    return cache
+
+
+@pytest.fixture
+def financial_data(monkeypatch):
+    fake = FakeFinancialData()
+    monkeypatch.setattr(financial_service, "get_financial_data", fake.get_financial_data)
+    return fake
+
+
+@pytest.fixture
+def calculator(monkeypatch):
+    fake = FakeCalculator()
+    
+    async def resolve(query):
+        return dict(CORP_INFO)
+    
+    monkeypatch.setattr(ebitda_router.corp_resolver, "resolve", resolve)
+    monkeypatch.setattr(ebitda_router.ebitda_calculator, "calculate_ebitda", fake.calculate_ebitda)
+    monkeypatch.setattr(ebitda_router, "ebitda_response_cache", ResponseCache(16))
+    return fake
+
+
+@pytest.fixture
+def client(calculator):
+    return TestClient(app)
@@ -0,0 +1,74 @@
+"""
+계정명 키워드 매처 테스트
+"""
+from app.models import AccountRow
+from app.services.account_matcher import AccountMatcher, normalize_account_name
+
+
+def rows(*names):
+    return [{"account_nm": name, "thstrm_amount": str(i)} for i, name in enumerate(names)]
+
+
+def test_normalize_account_name():
+    assert normalize_account_name(" 영업이익 (손실) ") == "영업이익손실"
+    assert normalize_account_name("감가·상각비") == "감가ㆍ상각비"
+    assert normalize_account_name("감가•상각비") == "감가ㆍ상각비"
+    assert normalize_account_name("EBITDA") == "ebitda"
+    assert normalize_account_name("") == ""
+
+
+def test_match_ignores_spacing_brackets_and_dots():
+    matcher = AccountMatcher([
+        ("operating_income", ["영업이익(손실)"]),
+        ("combined", ["감가ㆍ상각비"]),
+    ])
+    hits = matcher.match(rows("매출액", "영업 이익 손실", "감가·상각비"))
+    
+    assert hits["operating_income"].account_nm == "영업 이익 손실"
+    assert hits["combined"].account_nm == "감가·상각비"
+    assert all(isinstance(row, AccountRow) for row in hits.values())
+
+
+def test_match_returns_all_components_in_one_pass():
+    matcher = AccountMatcher([
+        ("combined", ["감가상각비및무형자산상각비"]),
+        ("depreciation", ["감가상각비"]),
+        ("amortization", ["무형자산상각비"]),
+    ])
+    accounts = rows("당기순이익", "무형자산상각비", "감가상각비")
+    hits = matcher.match_rows(accounts)
+    
+    assert set(hits) == {"depreciation", "amortization"}
+    assert hits["depreciation"] is accounts[2]
+    assert hits["amortization"] is accounts[1]
+
+
+def test_first_account_in_list_order_wins():
+    matcher = AccountMatcher([("depreciation", ["감가상각비", "유형자산상각비"])])
+    accounts = rows("유형자산상각비", "감가상각비")
+    
+    assert matcher.match_rows(accounts)["depreciation"] is accounts[0]
+
+
+def test_first_uses_component_priority():
+    matcher = AccountMatcher([
+        ("combined", ["감가상각비및무형자산상각비"]),
+        ("depreciation", ["감가상각비"]),
+    ])
+    
+    found = matcher.first(rows("감가상각비", "감가상각비 및 무형자산상각비"))
+    assert found.account_nm == "감가상각비 및 무형자산상각비"
+    assert matcher.first(rows("매출액")) is None
+
+
+def test_keyword_does_not_match_across_rows():
+    matcher = AccountMatcher([("operating_income", ["영업이익"])])
+    
+    assert matcher.match(rows("영업", "이익")) == {}
+
+
+def test_rows_without_account_name():
+    matcher = AccountMatcher([("operating_income", ["영업이익"])])
+    accounts = [{"thstrm_amount": "1"}, {"account_nm": None}, {"account_nm": "영업이익"}]
+    
+    assert matcher.match_rows(accounts)["operating_income"] is accounts[2]
@@ -0,0 +1,61 @@
+"""
+계정 단일 패스 분류 / 경량 레코드 테스트
+"""
+from app.models import AccountRow
+from app.services.financial_service import financial_service
+from benchmarks.payloads import make_accounts, STATEMENT_ROWS
+
+
+def test_partition_realistic_payload():
+    accounts = make_accounts()
+    partitions = financial_service.partition_accounts(accounts)
+    
+    assert {sj_div: len(rows) for sj_div, rows in partitions.items()} == STATEMENT_ROWS
+    # 원본 행을 복사하지 않고 그대로 담는다
+    assert partitions["IS"][0] is next(acc for acc in accounts if acc["sj_div"] == "IS")
+
+
+def test_partition_non_contiguous_rows():
+    accounts = [{"sj_div": "IS", "n": 1}, {"sj_div": "CF", "n": 2}, {"sj_div": "IS", "n": 3}]
+    partitions = financial_service.partition_accounts(accounts)
+    
+    assert [row["n"] for row in partitions["IS"]] == [1, 3]
+    assert [row["n"] for row in partitions["CF"]] == [2]
+
+
+def test_partition_rows_without_sj_div():
+    accounts = [{"sj_div": "IS", "n": 1}, {"n": 2}, {"sj_div": "IS", "n": 3}]
+    partitions = financial_service.partition_accounts(accounts)
+    
+    assert [row["n"] for row in partitions["IS"]] == [1, 3]
+    assert [row["n"] for row in partitions[""]] == [2]
+
+
+def test_partition_empty():
+    assert financial_service.partition_accounts([]) == {}
+
+
+def test_account_row_from_row_defaults():
+    row = AccountRow.from_row({"account_nm": "영업이익", "thstrm_amount": "100", "sj_div": "IS",
+                               "currency": None, "account_id": None})
+    
+    assert row.account_nm == "영업이익"
+    assert row.currency == "KRW"
+    assert row.account_id == ""
+    assert row.frmtrm_amount is None
+
+
+def test_extract_accounts_by_sj_div_returns_rows():
+    rows = financial_service.extract_accounts_by_sj_div(make_accounts(), "CF")
+    
+    assert len(rows) == STATEMENT_ROWS["CF"]
+    assert all(isinstance(row, AccountRow) and row.sj_div == "CF" for row in rows)
+
+
+def test_find_account_by_keywords_takes_raw_rows():
+    cf = financial_service.partition_accounts(make_accounts())["CF"]
+    
+    found = financial_service.find_account_by_keywords(cf, ["감가상각비"])
+    assert isinstance(found, AccountRow)
+    assert found.account_nm == "감가상각비"
+    assert financial_service.find_account_by_keywords(cf, ["없는계정"]) is None
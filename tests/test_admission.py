@@ -0,0 +1,93 @@
+"""
+과부하 시 요청 거절(admission control) 테스트
+"""
+import asyncio
+import time
+
+import pytest
+
+from app.config import settings
+from app.services.dart_client import dart_client
+from app.services.financial_service import financial_service
+from app.utils.rate_limiter import AdmissionRejected, RateLimiter
+
+
+PARAMS = {"company": "005930", "year": 2024, "report_code": "11011"}
+
+
+def test_estimated_wait_follows_queue_depth():
+    limiter = RateLimiter(5, 1.0)
+    assert limiter.estimated_wait(0) == 0.0
+    
+    now = time.time()
+    limiter.calls.extend([now] * 5)
+    
+    # 윈도우가 가득 차면 다음 토큰은 약 1초 뒤, 앞에 5건이 더 있으면 약 2초 뒤
+    assert limiter.estimated_wait(0) == pytest.approx(1.0, abs=0.05)
+    assert limiter.estimated_wait(4) == pytest.approx(1.0, abs=0.05)
+    assert limiter.estimated_wait(5) == pytest.approx(2.0, abs=0.05)
+
+
+def test_admit_rejects_with_retry_after():
+    limiter = RateLimiter(5, 1.0)
+    limiter.calls.extend([time.time()] * 5)
+    
+    limiter.admit(3.0, ahead=10)
+    
+    with pytest.raises(AdmissionRejected) as exc_info:
+        limiter.admit(3.0, ahead=25)
+    
+    # 예상 대기 약 6초, 허용 3초 -> 약 3초 뒤 재시도
+    assert exc_info.value.estimated_wait == pytest.approx(6.0, abs=0.05)
+    assert exc_info.value.retry_after == 3
+
+
+def test_retry_after_is_at_least_one_second():
+    assert AdmissionRejected(3.2, 3.0).retry_after == 1
+
+
+def test_overloaded_request_is_rejected_before_queueing(opendart, monkeypatch):
+    monkeypatch.setattr(settings, "admission_max_wait", 0.5)
+    dart_client.rate_limiter.calls.extend([time.time()] * dart_client.rate_limiter.max_calls)
+    
+    with pytest.raises(AdmissionRejected):
+        asyncio.run(dart_client.get_financial_statements("00126380", "2024", "11011", "CFS"))
+    
+    assert opendart.calls("fnlttSinglAcntAll.json") == []
+    assert dart_client.scheduler.waiting() == 0
+
+
+def test_overloaded_is_429_with_retry_after(client, calculator):
+    calculator.error = AdmissionRejected(7.5, 3.0)
+    response = client.get("/api/v1/ebitda", params=PARAMS)
+    
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "5"
+    assert response.json()["detail"]["error"] == "OVERLOADED"
+
+
+def test_cache_hits_are_never_shed(client, calculator):
+    assert client.get("/api/v1/ebitda", params=PARAMS).status_code == 200
+    
+    # 이후 OPENDART 를 호출하면 거절되는 상황에서도 캐시 적중은 응답
+    calculator.error = AdmissionRejected(60.0, 3.0)
+    response = client.get("/api/v1/ebitda", params=PARAMS)
+    
+    assert response.status_code == 200
+    assert response.json()["source"]["cached"] is True
+    assert calculator.calls == 1
+
+
+def test_financial_cache_hits_skip_admission(opendart, cache, monkeypatch):
+    asyncio.run(cache.set(
+        {"fs_div": "CFS", "rcept_no": "20250311001085", "fetched_at": "2025-03-11T00:00:00",
+         "accounts": []},
+        "00126380", 2024, "11011", "CFS"
+    ))
+    monkeypatch.setattr(settings, "admission_max_wait", 0.0)
+    dart_client.rate_limiter.calls.extend([time.time()] * dart_client.rate_limiter.max_calls)
+    
+    data = asyncio.run(financial_service.get_financial_data("00126380", 2024, "11011", "CFS"))
+    
+    assert data["_from_cache"] is True
+    assert opendart.requests == []
@@ -0,0 +1,77 @@
+"""
+회사 검색 API (자동완성, 일괄 변환) 테스트
+"""
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.routers import companies as companies_router
+
+
+@pytest.fixture
+def companies_client(monkeypatch, resolver):
+    monkeypatch.setattr(companies_router, "corp_resolver", resolver)
+    return TestClient(app)
+
+
+def suggest(client, q, limit=10):
+    response = client.get("/api/v1/companies/suggest", params={"q": q, "limit": limit})
+    assert response.status_code == 200
+    return [item["corp_name"] for item in response.json()["items"]]
+
+
+@pytest.mark.parametrize("q, expected", [
+    # 상장사 먼저, 같은 그룹 안에서는 사전순
+    ("삼성", ["삼성SDI", "삼성전자", "삼성전자서비스"]),
+    ("카카", ["카카오", "카카오뱅크"]),
+    # 초성
+    ("ㅋㅋ", ["카카오", "카카오뱅크"]),
+    # 조합 중인 음절
+    ("삼성전ㅈ", ["삼성전자", "삼성전자서비스"]),
+    # 종목코드 접두
+    ("0059", ["삼성전자"])
+])
+def test_suggest(companies_client, q, expected):
+    assert suggest(companies_client, q) == expected
+
+
+def test_suggest_limit(companies_client):
+    assert suggest(companies_client, "삼성", limit=2) == ["삼성SDI", "삼성전자"]
+
+
+def test_suggest_no_match(companies_client):
+    assert suggest(companies_client, "없는회사") == []
+
+
+def test_suggest_validates_query(companies_client):
+    assert companies_client.get("/api/v1/companies/suggest", params={"q": ""}).status_code == 422
+
+
+def test_bulk_resolve(companies_client):
+    response = companies_client.post(
+        "/api/v1/companies/resolve",
+        json={"queries": ["005930", "삼성전자(주)", "삼송전자", "한국상사", " "]}
+    )
+    assert response.status_code == 200
+    body = response.json()
+    
+    assert (body["total"], body["resolved"], body["not_found"]) == (5, 2, 3)
+    assert [item["query"] for item in body["items"]] == [
+        "005930", "삼성전자(주)", "삼송전자", "한국상사", " "
+    ]
+    assert body["items"][0]["company"]["corp_code"] == "00126380"
+    assert body["items"][1]["company"]["corp_code"] == "00126380"
+    
+    typo = body["items"][2]["error"]
+    assert typo["error"] == "NOT_FOUND"
+    assert typo["suggestions"][0]["corp_name"] == "삼성전자"
+    assert {item["corp_code"] for item in body["items"][3]["error"]["suggestions"]} == {
+        "00333333", "00444444"
+    }
+    assert body["items"][4]["error"]["suggestions"] == []
+
+
+def test_bulk_resolve_validates_size(companies_client):
+    assert companies_client.post(
+        "/api/v1/companies/resolve", json={"queries": []}
+    ).status_code == 422
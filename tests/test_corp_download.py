@@ -0,0 +1,83 @@
+"""
+corpCode ZIP 스트리밍 다운로드 / 추출 테스트
+"""
+import asyncio
+import io
+import time
+import zipfile
+
+import httpx
+import pytest
+
+from app.config import settings
+from app.services.dart_client import DartAPIError, dart_client
+from app.utils.fair_queue import request_consumer
+from tests.conftest import CORP_ROWS, corp_code_xml
+
+
+def zipped(files):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zip_file:
+        for name, content in files.items():
+            zip_file.writestr(name, content)
+    return buffer.getvalue()
+
+
+@pytest.fixture(autouse=True)
+def small_chunks(monkeypatch):
+    # 여러 청크로 나눠 기록되는지 확인하도록 청크를 작게
+    monkeypatch.setattr(settings, "download_chunk_size", 256)
+
+
+def test_zip_is_streamed_and_extracted(resolver, opendart):
+    xml = corp_code_xml(CORP_ROWS)
+    opendart.routes["corpCode.xml"] = httpx.Response(200, content=zipped({"CORPCODE.xml": xml}))
+    
+    asyncio.run(resolver._download_and_extract())
+    
+    assert resolver.cache_file.read_bytes() == xml
+    assert not resolver.cache_file.with_suffix(".download").exists()
+    assert len(resolver._parse_xml()) == len(CORP_ROWS)
+
+
+def test_plain_xml_response(resolver, opendart):
+    xml = corp_code_xml(CORP_ROWS[:2])
+    opendart.routes["corpCode.xml"] = httpx.Response(200, content=xml)
+    
+    asyncio.run(resolver._download_and_extract())
+    assert resolver.cache_file.read_bytes() == xml
+
+
+def test_shared_download_is_not_charged_to_consumer(resolver, opendart, monkeypatch):
+    # 할당량을 다 쓴 소비자가 매핑 로드를 일으켜도 다운로드는 진행되고 호출로 세지 않음
+    monkeypatch.setattr(dart_client.scheduler, "quotas", {"a": 1})
+    monkeypatch.setattr(dart_client.scheduler, "_usage", {})
+    dart_client.scheduler._recent_usage("a").append(time.time())
+    opendart.routes["corpCode.xml"] = httpx.Response(200, content=corp_code_xml(CORP_ROWS))
+    
+    async def load_as_consumer():
+        request_consumer.set("a")
+        await resolver._download_and_extract()
+    
+    asyncio.run(load_as_consumer())
+    
+    assert len(opendart.calls("corpCode.xml")) == 1
+    assert len(dart_client.scheduler._recent_usage("a")) == 1
+
+
+@pytest.mark.parametrize("response, code", [
+    (httpx.Response(200, json={"status": "010", "message": "등록되지 않은 키입니다."}), "010"),
+    (httpx.Response(200, content=b""), "EMPTY_RESPONSE"),
+    (httpx.Response(500, content=b"error"), "HTTP_ERROR"),
+    (httpx.Response(200, content=b"not a zip or xml"), "INVALID_RESPONSE"),
+    (httpx.Response(200, content=zipped({"readme.txt": b"x"})), "INVALID_RESPONSE")
+])
+def test_download_errors(resolver, opendart, response, code):
+    opendart.routes["corpCode.xml"] = response
+    
+    with pytest.raises(DartAPIError) as excinfo:
+        asyncio.run(resolver._download_and_extract())
+    
+    assert excinfo.value.code == code
+    assert not resolver.cache_file.exists()
+    assert not resolver.cache_file.with_suffix(".download").exists()
@@ -0,0 +1,51 @@
+"""
+회사 매핑 인덱스 (동명 회사, __slots__ 레코드, 문자열 공유) 테스트
+"""
+from app.services.corp_resolver import CorpRecord
+from tests.conftest import CORP_ROWS, corp_code_xml
+
+
+def test_record_has_no_instance_dict():
+    record = CorpRecord("00126380", "삼성전자", "005930", "20240101")
+    assert not hasattr(record, "__dict__")
+    assert record.is_listed
+    assert not CorpRecord("00999999", "삼성전자서비스", None, "20240101").is_listed
+
+
+def test_same_name_keeps_every_record_listed_first(resolver):
+    records = resolver.mapping["corp_name"]["대한전선"]
+    assert [r.corp_code for r in records] == ["00111111", "00222222"]
+    
+    # 나중에 추가된 상장사도 앞으로 정렬
+    resolver._index_add(resolver.mapping, CorpRecord("00000001", "한국상사", "999990", "20240101"))
+    assert [r.corp_code for r in resolver.mapping["corp_name"]["한국상사"]] == [
+        "00000001", "00333333", "00444444"
+    ]
+
+
+def test_index_remove_keeps_other_same_name_records(resolver):
+    listed = resolver.mapping["corp_code"]["00111111"]
+    resolver._index_remove(resolver.mapping, listed)
+    
+    assert "00111111" not in resolver.mapping["corp_code"]
+    assert "001440" not in resolver.mapping["stock_code"]
+    assert [r.corp_code for r in resolver.mapping["corp_name"]["대한전선"]] == ["00222222"]
+    
+    resolver._index_remove(resolver.mapping, resolver.mapping["corp_code"]["00222222"])
+    assert "대한전선" not in resolver.mapping["corp_name"]
+
+
+def test_name_key_is_lowercase(resolver):
+    assert resolver.mapping["corp_name"]["sk하이닉스"][0].corp_code == "00164779"
+    assert "SK하이닉스" not in resolver.mapping["corp_name"]
+
+
+def test_parse_xml_interns_repeated_strings(resolver):
+    resolver.cache_file.write_bytes(corp_code_xml(CORP_ROWS))
+    records = resolver._parse_xml()
+    
+    assert len(records) == len(CORP_ROWS)
+    assert records["00999999"].stock_code is None
+    assert records["00126380"].stock_code == "005930"
+    # 같은 modify_date 문자열은 하나의 객체를 공유
+    assert records["00126380"].modify_date is records["00164779"].modify_date
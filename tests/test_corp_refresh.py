@@ -0,0 +1,93 @@
+"""
+corpCode 변경분 갱신 테스트
+"""
+import asyncio
+
+import pytest
+
+from app.config import settings
+from app.services import corp_resolver as corp_resolver_module
+from app.services.dart_client import DartAPIError
+from tests.conftest import CORP_ROWS, corp_code_xml
+
+
+@pytest.fixture
+def download(monkeypatch, resolver):
+    """refresh 가 다운로드할 corpCode.xml 내용 지정"""
+    def set_rows(rows):
+        async def download_and_extract():
+            resolver.cache_file.write_bytes(corp_code_xml(rows))
+        monkeypatch.setattr(resolver, "_download_and_extract", download_and_extract)
+    return set_rows
+
+
+def snapshot_rows():
+    rows = asyncio.run(corp_resolver_module.corp_code_snapshot.load())
+    return {row[0]: tuple(row) for row in rows}
+
+
+def seed_snapshot():
+    asyncio.run(corp_resolver_module.corp_code_snapshot.apply_delta(CORP_ROWS, []))
+
+
+def test_refresh_applies_only_changes(resolver, download, monkeypatch):
+    monkeypatch.setattr(settings, "corp_refresh_max_delete_ratio", 0.1)
+    seed_snapshot()
+    changed = {}
+    resolver.add_change_listener(lambda codes: changed.update(codes=codes))
+    
+    rows = [row for row in CORP_ROWS if row[0] != "00222222"]            # 삭제
+    rows = [
+        ("00258801", "카카오", "035720", "20240601") if row[0] == "00258801"  # 수정 (변경일)
+        else ("00126362", "삼성에스디아이", "006400", "20240601") if row[0] == "00126362"  # 회사명 변경
+        else row
+        for row in rows
+    ] + [("00000002", "새회사", "111110", "20240601")]                    # 추가
+    download(rows)
+    
+    delta = asyncio.run(resolver.refresh())
+    
+    assert delta == {"inserted": 1, "updated": 2, "deleted": 1, "renamed": 1, "delisted": 0}
+    assert resolver.mapping["stock_code"]["111110"].corp_name == "새회사"
+    assert "삼성sdi" not in resolver.mapping["corp_name"]
+    assert resolver.mapping["corp_name"]["삼성에스디아이"][0].corp_code == "00126362"
+    assert [r.corp_code for r in resolver.mapping["corp_name"]["대한전선"]] == ["00111111"]
+    assert changed["codes"] == {"00126362", "00222222"}
+    
+    snapshot = snapshot_rows()
+    assert "00222222" not in snapshot
+    assert snapshot["00000002"] == ("00000002", "새회사", "111110", "20240601")
+    assert snapshot["00258801"][3] == "20240601"
+
+
+def test_refresh_refuses_truncated_download(resolver, download):
+    seed_snapshot()
+    download(CORP_ROWS[:3])
+    
+    with pytest.raises(DartAPIError) as excinfo:
+        asyncio.run(resolver.refresh())
+    
+    assert excinfo.value.code == "INVALID_RESPONSE"
+    assert len(resolver.mapping["corp_code"]) == len(CORP_ROWS)
+    assert len(snapshot_rows()) == len(CORP_ROWS)
+
+
+def test_refresh_allows_deletions_within_ratio(resolver, download, monkeypatch):
+    monkeypatch.setattr(settings, "corp_refresh_max_delete_ratio", 0.1)
+    download(CORP_ROWS[:-1])
+    
+    assert asyncio.run(resolver.refresh())["deleted"] == 1
+
+
+def test_load_keeps_snapshot_when_refresh_is_refused(resolver, download, monkeypatch):
+    seed_snapshot()
+    download([])
+    resolver.mapping = None
+    
+    async def stale():
+        return False
+    monkeypatch.setattr(resolver, "_is_cache_valid", stale)
+    
+    asyncio.run(resolver.load_mapping())
+    assert len(resolver.mapping["corp_code"]) == len(CORP_ROWS)
+    assert asyncio.run(resolver.resolve("005930"))["corp_code"] == "00126380"
@@ -0,0 +1,46 @@
+"""
+회사명/종목코드 → corp_code 변환 테스트
+"""
+import asyncio
+
+import pytest
+
+from app.services.corp_resolver import CompanyNotFound
+
+
+def resolve(resolver, query):
+    return asyncio.run(resolver.resolve(query))
+
+
+@pytest.mark.parametrize("query, corp_code", [
+    ("005930", "00126380"),
+    ("삼성전자", "00126380"),
+    (" 삼성전자 ", "00126380"),
+    ("sk하이닉스", "00164779"),
+    ("(주)삼성전자", "00126380"),
+    ("삼성 전자 주식회사", "00126380"),
+    # 동명 회사 중 상장사가 하나뿐이면 상장사
+    ("대한전선", "00111111")
+])
+def test_resolve_exact(resolver, query, corp_code):
+    assert resolve(resolver, query)["corp_code"] == corp_code
+
+
+@pytest.mark.parametrize("query", ["삼송전자", "삼성", "한국상사"])
+def test_resolve_does_not_guess(resolver, query):
+    # 오타/부분 일치/구분할 수 없는 동명 회사는 고르지 않고 후보만 알려준다
+    with pytest.raises(CompanyNotFound) as excinfo:
+        resolve(resolver, query)
+    
+    error = excinfo.value
+    assert error.code == "NOT_FOUND"
+    assert not error.retryable
+    assert error.suggestions
+    assert set(error.suggestions[0]) == {"corp_code", "corp_name", "stock_code"}
+
+
+def test_not_found_suggests_typo_target(resolver):
+    with pytest.raises(CompanyNotFound) as excinfo:
+        resolve(resolver, "삼송전자")
+    assert excinfo.value.suggestions[0]["corp_name"] == "삼성전자"
+    assert "삼성전자(005930)" in excinfo.value.message
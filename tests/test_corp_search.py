@@ -0,0 +1,71 @@
+"""
+회사명 검색 엔진 (초성, 부분 일치, 오타 허용) 테스트
+"""
+import pytest
+
+from app.services.corp_search import (
+    CorpSearchEngine, decompose, extract_chosung, is_chosung_query, strip_legal_suffix
+)
+from tests.conftest import corp_records
+
+
+@pytest.fixture(scope="module")
+def engine():
+    engine = CorpSearchEngine()
+    engine.build(corp_records())
+    return engine
+
+
+def names(results):
+    return [item["corp_name"] for item in results]
+
+
+def test_hangul_helpers():
+    assert extract_chosung("삼성전자") == "ㅅㅅㅈㅈ"
+    assert is_chosung_query("ㅅㅅㅈㅈ")
+    assert not is_chosung_query("삼성")
+    assert decompose("각") != "각"
+    assert strip_legal_suffix("(주)삼성전자") == "삼성전자"
+    assert strip_legal_suffix("삼성전자주식회사") == "삼성전자"
+
+
+@pytest.mark.parametrize("query, match_type", [
+    ("삼성전자", "exact"),
+    ("sk하이닉스", "exact"),
+    ("(주)삼성전자", "exact"),
+    ("삼성전", "prefix"),
+    ("ㅅㅅㅈㅈ", "chosung_prefix"),
+    ("삼성전자자", "contained")
+])
+def test_match_types(engine, query, match_type):
+    first = engine.search(query, 5)[0]
+    assert first["corp_name"] in ("삼성전자", "SK하이닉스")
+    assert first["match_type"] == match_type
+
+
+@pytest.mark.parametrize("query, expected", [
+    ("삼송전자", "삼성전자"),    # 치환
+    ("셀투리온", "셀트리온"),    # 삽입
+    ("삼성저자", "삼성전자"),    # 삭제
+    ("샐트리온", "셀트리온")
+])
+def test_fuzzy_edits(engine, query, expected):
+    first = engine.search(query, 5)[0]
+    assert first["corp_name"] == expected
+    assert first["match_type"] == "fuzzy"
+    assert first["distance"] == 1
+
+
+def test_prefix_prefers_listed_and_shorter(engine):
+    assert names(engine.search("삼성", 5)) == ["삼성전자", "삼성SDI", "삼성전자서비스"]
+
+
+def test_exact_matches_ignore_spacing_and_legal_markers(engine):
+    assert [r.corp_code for r in engine.exact_matches("주식회사 삼성 전자")] == ["00126380"]
+    assert len(engine.exact_matches("한국상사")) == 2
+    assert engine.exact_matches("삼송전자") == []
+
+
+def test_no_match(engine):
+    assert engine.search("존재하지않는회사명", 5) == []
+    assert engine.search("", 5) == []
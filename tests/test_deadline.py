@@ -0,0 +1,159 @@
+"""
+요청 마감(deadline) 전파 및 rate limiter 잠금 대기 테스트
+"""
+import asyncio
+import time
+
+import pytest
+
+from app.config import settings
+from app.routers import ebitda as ebitda_router
+from app.services.dart_client import dart_client
+from app.utils.deadline import (
+    DeadlineExceeded, check_deadline, remaining, request_deadline, start_deadline, wait_detached
+)
+from app.utils.rate_limiter import RateLimiter
+
+
+PARAMS = {"company": "005930", "year": 2024, "report_code": "11011"}
+
+
+def test_lock_wait_timeout_does_not_keep_lock():
+    async def run():
+        limiter = RateLimiter(5)
+        await limiter._lock.acquire()
+        
+        assert await limiter.acquire(timeout=0.01) is False
+        
+        limiter._lock.release()
+        await asyncio.sleep(0)
+        assert not limiter._lock.locked()
+        assert await limiter.acquire(timeout=0.1) is True
+    
+    asyncio.run(run())
+
+
+def test_abandoned_waiter_releases_acquired_lock():
+    async def run():
+        limiter = RateLimiter(5)
+        
+        # 시간 초과와 같은 순간에 잠금을 받은 경우
+        waiter = asyncio.ensure_future(limiter._lock.acquire())
+        await asyncio.sleep(0)
+        assert waiter.done() and limiter._lock.locked()
+        limiter._abandon_lock_waiter(waiter)
+        assert not limiter._lock.locked()
+        
+        # 아직 기다리는 중이던 경우
+        await limiter._lock.acquire()
+        waiter = asyncio.ensure_future(limiter._lock.acquire())
+        await asyncio.sleep(0)
+        limiter._abandon_lock_waiter(waiter)
+        limiter._lock.release()
+        await asyncio.sleep(0)
+        assert not limiter._lock.locked()
+    
+    asyncio.run(run())
+
+
+def test_cancelled_acquire_does_not_keep_lock():
+    async def run():
+        limiter = RateLimiter(5)
+        await limiter._lock.acquire()
+        
+        task = asyncio.ensure_future(limiter.acquire(timeout=10))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        
+        limiter._lock.release()
+        await asyncio.sleep(0)
+        assert not limiter._lock.locked()
+        assert limiter._interactive_waiting == 0
+    
+    asyncio.run(run())
+
+
+def test_deadline_helpers():
+    async def run():
+        assert remaining() is None
+        start_deadline(0.05)
+        assert 0 < remaining() <= 0.05
+        await asyncio.sleep(0.06)
+        assert remaining() == 0.0
+        with pytest.raises(DeadlineExceeded):
+            check_deadline()
+    
+    asyncio.run(run())
+
+
+def test_wait_detached_keeps_shared_work_running():
+    async def run():
+        finished = asyncio.Event()
+        
+        async def shared_load():
+            assert request_deadline.get() is None
+            await asyncio.sleep(0.05)
+            finished.set()
+        
+        start_deadline(0.01)
+        with pytest.raises(DeadlineExceeded):
+            await wait_detached(shared_load())
+        
+        await asyncio.wait_for(finished.wait(), 1)
+    
+    asyncio.run(run())
+
+
+def test_token_wait_beyond_deadline_fails_fast(opendart, monkeypatch):
+    monkeypatch.setattr(settings, "admission_max_wait", 60.0)
+    
+    async def run():
+        # 토큰을 모두 써서 다음 토큰까지 약 1초
+        now = time.time()
+        dart_client.rate_limiter.calls.extend([now] * dart_client.rate_limiter.max_calls)
+        start_deadline(0.2)
+        
+        started = time.monotonic()
+        with pytest.raises(DeadlineExceeded):
+            await dart_client.get_financial_statements("00126380", "2024", "11011", "CFS")
+        return time.monotonic() - started
+    
+    assert asyncio.run(run()) < 0.1
+    assert opendart.calls("fnlttSinglAcntAll.json") == []
+
+
+def test_expired_deadline_skips_request(opendart):
+    async def run():
+        start_deadline(0)
+        with pytest.raises(DeadlineExceeded):
+            await dart_client.get_financial_statements("00126380", "2024", "11011", "CFS")
+    
+    asyncio.run(run())
+    assert opendart.calls("fnlttSinglAcntAll.json") == []
+
+
+def test_deadline_exceeded_is_504(client, calculator):
+    calculator.error = DeadlineExceeded()
+    response = client.get("/api/v1/ebitda", params=PARAMS)
+    
+    assert response.status_code == 504
+    assert response.json()["detail"]["error"] == "DEADLINE_EXCEEDED"
+
+
+def test_request_timeout_header_sets_deadline(client, monkeypatch):
+    seen = []
+    
+    async def calculate_ebitda(corp_code, year, report_code, fs_div):
+        seen.append(remaining())
+        raise DeadlineExceeded()
+    
+    monkeypatch.setattr(ebitda_router.ebitda_calculator, "calculate_ebitda", calculate_ebitda)
+    
+    client.get("/api/v1/ebitda", params=PARAMS, headers={"X-Request-Timeout": "2"})
+    client.get("/api/v1/ebitda", params=PARAMS, headers={"X-Request-Timeout": "9999"})
+    client.get("/api/v1/ebitda", params=PARAMS)
+    
+    assert 1 < seen[0] <= 2
+    assert settings.request_timeout_max - 1 < seen[1] <= settings.request_timeout_max
+    assert settings.request_timeout - 1 < seen[2] <= settings.request_timeout
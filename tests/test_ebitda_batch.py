@@ -0,0 +1,135 @@
+"""
+EBITDA 일괄 계산 테스트 (완료 순 스트리밍 / 동시성 제한 / NDJSON)
+"""
+import asyncio
+import json
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services import ebitda_batch as ebitda_batch_module
+from app.services.dart_client import DartAPIError
+from app.services.ebitda_batch import ebitda_batch_service
+from tests.conftest import CORP_INFO, make_result
+
+
+def items(*companies):
+    return [
+        SimpleNamespace(company=company, year=2024, report_code="11011", fs_div="CFS")
+        for company in companies
+    ]
+
+
+class FakePipeline:
+    """회사별로 완료 시점을 조절할 수 있는 회사 변환/계산 대역"""
+    
+    def __init__(self):
+        self.gates = {}
+        self.started = []
+        self.running = 0
+        self.max_running = 0
+    
+    async def resolve(self, company):
+        if company == "없는회사":
+            raise DartAPIError("NOT_FOUND", f"'{company}'에 해당하는 회사를 찾을 수 없습니다.")
+        return {**CORP_INFO, "corp_name": company}
+    
+    async def calculate_ebitda(self, corp_code, year, report_code, fs_div):
+        self.started.append(corp_code)
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            gate = self.gates.get(len(self.started) - 1)
+            if gate is not None:
+                await gate.wait()
+            await asyncio.sleep(0)
+            return make_result()
+        finally:
+            self.running -= 1
+
+
+@pytest.fixture
+def pipeline(monkeypatch):
+    fake = FakePipeline()
+    monkeypatch.setattr(ebitda_batch_module.corp_resolver, "resolve", fake.resolve)
+    monkeypatch.setattr(
+        ebitda_batch_module.ebitda_calculator, "calculate_ebitda", fake.calculate_ebitda
+    )
+    return fake
+
+
+def collect(batch, concurrency=4):
+    async def run():
+        return [line async for line in ebitda_batch_service.stream(batch, concurrency)]
+    return asyncio.run(run())
+
+
+def test_slow_item_does_not_block_others(pipeline):
+    async def run():
+        pipeline.gates[0] = asyncio.Event()
+        order = []
+        async for index, corp_info, result, error in ebitda_batch_service.stream(
+            items("느린회사", "A", "B", "C"), 2
+        ):
+            order.append(index)
+            if len(order) == 3:
+                pipeline.gates[0].set()
+        return order
+    
+    assert asyncio.run(run()) == [1, 2, 3, 0]
+
+
+def test_concurrency_is_bounded(pipeline):
+    lines = collect(items(*[f"회사{i}" for i in range(20)]), concurrency=3)
+    
+    assert sorted(index for index, *_ in lines) == list(range(20))
+    assert pipeline.max_running == 3
+
+
+def test_slow_consumer_pauses_workers(pipeline):
+    async def run():
+        stream = ebitda_batch_service.stream(items(*[f"회사{i}" for i in range(50)]), 2)
+        await stream.__anext__()
+        await asyncio.sleep(0.05)
+        started = len(pipeline.started)
+        await stream.aclose()
+        return started
+    
+    # 결과 큐(2) + 작업자(2) + 소비한 1건 이상은 진행하지 않음
+    assert asyncio.run(run()) <= 5
+
+
+def test_item_errors_do_not_stop_batch(pipeline):
+    lines = collect(items("삼성전자", "없는회사", "SK하이닉스"))
+    by_index = {index: (corp_info, result, error) for index, corp_info, result, error in lines}
+    
+    assert isinstance(by_index[1][2], DartAPIError)
+    assert by_index[0][1]["ebitda_total"] == 600.0
+    assert by_index[2][0]["corp_name"] == "SK하이닉스"
+
+
+def test_ndjson_lines(pipeline):
+    response = TestClient(app).post(
+        "/api/v1/ebitda/batch",
+        json={"items": [
+            {"company": "삼성전자", "year": 2024, "report_code": "11011"},
+            {"company": "없는회사", "year": 2024, "report_code": "11011", "fs_div": "OFS"},
+        ]}
+    )
+    
+    assert response.status_code == 200
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    by_index = {line["index"]: line for line in lines}
+    
+    assert len(lines) == 2
+    assert by_index[0]["result"]["ebitda"]["total"] == 600.0
+    assert by_index[0]["error"] is None
+    assert by_index[1]["fs_div"] == "OFS"
+    assert by_index[1]["result"] is None
+    assert by_index[1]["error"]["error"] == "NOT_FOUND"
+
+
+def test_batch_rejects_empty_items():
+    assert TestClient(app).post("/api/v1/ebitda/batch", json={"items": []}).status_code == 422
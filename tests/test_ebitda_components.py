@@ -0,0 +1,104 @@
+"""
+EBITDA 구성요소 검색 테스트 (표준 계정 ID 우선, 계정명 키워드 대체)
+"""
+import asyncio
+
+from app.services.ebitda_calculator import ebitda_calculator
+from tests.conftest import account_row
+
+
+def calculate(report_code="11011"):
+    return asyncio.run(ebitda_calculator.calculate_ebitda("00126380", 2024, report_code, "CFS"))
+
+
+def test_components_found_by_account_id(financial_data):
+    financial_data.accounts = [
+        account_row("IS", "영업활동이익", "100", "dart_OperatingIncomeLoss"),
+        account_row("CF", "유형자산 관련 비용", "20", "ifrs-full_AdjustmentsForDepreciationExpense"),
+        account_row("CF", "무형자산 관련 비용", "3", "ifrs-full_AdjustmentsForAmortisationExpense"),
+    ]
+    result = calculate()
+    components = result["components"]
+    
+    assert result["ebitda_total"] == 123.0
+    assert {name: c["matched_by"] for name, c in components.items()} == {
+        "operating_income": "account_id",
+        "depreciation": "account_id",
+        "amortization": "account_id",
+    }
+    assert components["operating_income"]["label"] == "영업활동이익"
+
+
+def test_account_id_wins_over_keyword(financial_data):
+    financial_data.accounts = [
+        account_row("IS", "영업이익(구분표시)", "999"),
+        account_row("IS", "영업이익", "100", "ifrs-full_OperatingIncomeLoss"),
+    ]
+    components = calculate()["components"]
+    
+    assert components["operating_income"]["amount"] == 100.0
+    assert components["operating_income"]["matched_by"] == "account_id"
+
+
+def test_keyword_fallback_without_account_id(financial_data):
+    financial_data.accounts = [
+        account_row("IS", "영업이익", "100", "-표준계정코드 미사용-"),
+        account_row("CF", "감가상각비", "20", "dart_AdjustmentsForDepreciationExpense"),
+        account_row("CF", "무형자산상각비", "3"),
+    ]
+    components = calculate()["components"]
+    
+    assert components["operating_income"]["matched_by"] == "keyword"
+    assert components["depreciation"]["matched_by"] == "account_id"
+    assert components["amortization"]["matched_by"] == "keyword"
+
+
+def test_combined_account_id_counted_once(financial_data):
+    financial_data.accounts = [
+        account_row("IS", "영업이익", "100", "dart_OperatingIncomeLoss"),
+        account_row(
+            "CF", "감가상각비및무형자산상각비", "30",
+            "ifrs-full_AdjustmentsForDepreciationAndAmortisationExpense"
+        ),
+    ]
+    result = calculate()
+    components = result["components"]
+    
+    assert result["ebitda_total"] == 130.0
+    assert components["depreciation"]["amount"] == 30.0
+    assert components["amortization"]["amount"] == 0.0
+    assert components["amortization"]["matched_by"] == "included_in_depreciation"
+    assert any("한 번만 합산" in w for w in result["warnings"])
+
+
+def test_combined_keyword_counted_once(financial_data):
+    financial_data.accounts = [
+        account_row("IS", "영업이익", "100"),
+        account_row("CF", "감가상각비 및 무형자산상각비", "30"),
+    ]
+    result = calculate()
+    
+    assert result["ebitda_total"] == 130.0
+    assert result["components"]["depreciation"]["matched_by"] == "keyword"
+    assert result["components"]["amortization"]["matched_by"] == "included_in_depreciation"
+
+
+def test_combined_keyword_ignored_when_depreciation_found_by_id(financial_data):
+    financial_data.accounts = [
+        account_row("IS", "영업이익", "100"),
+        account_row("CF", "감가상각비", "20", "ifrs-full_AdjustmentsForDepreciationExpense"),
+        account_row("CF", "감가상각비 및 무형자산상각비", "30"),
+    ]
+    result = calculate()
+    
+    assert result["ebitda_total"] == 120.0
+    assert result["components"]["amortization"]["found"] is False
+
+
+def test_missing_components_warn(financial_data):
+    financial_data.accounts = [account_row("IS", "매출액", "1000")]
+    result = calculate()
+    
+    assert result["ebitda_total"] == 0.0
+    assert result["components"]["operating_income"]["matched_by"] is None
+    assert any("영업이익 계정을 찾을 수 없습니다" in w for w in result["warnings"])
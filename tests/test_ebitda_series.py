@@ -0,0 +1,148 @@
+"""
+EBITDA 시계열 테스트 (조회 계획 / 동시 조회 / 엔드포인트)
+"""
+import asyncio
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services import ebitda_series as ebitda_series_module
+from app.services.dart_client import DartAPIError
+from app.services.ebitda_series import ebitda_series_service, plan_fetches
+from tests.conftest import make_result
+
+
+def test_plan_covers_years_with_prior_periods():
+    plan = plan_fetches(list(range(2015, 2025)), 3, set(), set(), 2024)
+    
+    assert plan == [2024, 2021, 2018, 2015]
+
+
+def test_plan_prefers_cached_reports():
+    plan = plan_fetches([2022, 2023, 2024], 3, {2023}, set(), 2024)
+    
+    assert plan == [2023, 2024]
+
+
+def test_plan_uses_later_report_for_earlier_year():
+    # 2020 년 보고서가 없으면 2021/2022 년 보고서의 전기/전전기로 덮는다
+    plan = plan_fetches([2020], 3, set(), {2020}, 2024)
+    
+    assert plan == [2021]
+
+
+def test_plan_does_not_fetch_beyond_max_year():
+    assert plan_fetches([2024], 3, set(), {2024}, 2024) == []
+
+
+class FakeSeriesCalculator:
+    """연도를 EBITDA 금액으로 쓰는 사업보고서 대역 (unavailable 연도는 013)"""
+    
+    def __init__(self):
+        self.calls = []
+        self.unavailable = set()
+    
+    async def calculate_ebitda(self, corp_code, year, report_code, fs_div):
+        self.calls.append(year)
+        if year in self.unavailable:
+            raise DartAPIError("013", "조회된 데이타가 없습니다.")
+        
+        prior = [
+            {"year": year - offset, "label": label, "operating_income": float(year - offset),
+             "depreciation": 0.0, "amortization": 0.0, "ebitda_total": float(year - offset)}
+            for offset, label in ((1, "전기"), (2, "전전기"))
+        ]
+        return make_result(ebitda_total=float(year), prior_periods=prior)
+
+
+@pytest.fixture
+def series(monkeypatch):
+    fake = FakeSeriesCalculator()
+    cached = set()
+    
+    async def cached_years(corp_code, years, report_code, fs_div="CFS"):
+        return cached & set(years)
+    
+    monkeypatch.setattr(
+        ebitda_series_module.ebitda_calculator, "calculate_ebitda", fake.calculate_ebitda
+    )
+    monkeypatch.setattr(
+        ebitda_series_module.financial_service, "cached_years", cached_years
+    )
+    fake.cached = cached
+    return fake
+
+
+def get_series(from_year, to_year, report_codes=("11011",)):
+    return asyncio.run(ebitda_series_service.get_series(
+        "00126380", from_year, to_year, list(report_codes)
+    ))
+
+
+def test_series_fetches_a_third_of_the_years(series):
+    result = get_series(2016, 2024)
+    
+    assert sorted(series.calls) == [2018, 2021, 2024]
+    assert result["upstream_fetches"] == 3
+    assert [p["year"] for p in result["points"]] == list(range(2016, 2025))
+    assert all(p["total"] == p["year"] for p in result["points"])
+    
+    point_2023 = next(p for p in result["points"] if p["year"] == 2023)
+    assert (point_2023["source_year"], point_2023["source_period"]) == (2024, "전기")
+
+
+def test_series_counts_cached_reports(series):
+    series.cached.add(2024)
+    result = get_series(2022, 2024)
+    
+    assert result["upstream_fetches"] == 0
+    assert result["cached_fetches"] == 1
+
+
+def test_series_replans_after_missing_report(series):
+    series.unavailable.add(2024)
+    result = get_series(2021, 2024)
+    
+    # 첫 계획(2024, 2021)에서 2024 가 없으면 남은 2022~2023 을 2023 년 보고서로
+    assert sorted(series.calls[:2]) == [2021, 2024]
+    assert series.calls[2:] == [2023]
+    assert [p["year"] for p in result["points"]] == [2021, 2022, 2023]
+    assert result["missing"][0]["year"] == 2024
+    assert result["missing"][0]["error"] == "013"
+
+
+def test_series_raises_when_nothing_found(series):
+    series.unavailable.update(range(2015, 2031))
+    
+    with pytest.raises(DartAPIError):
+        get_series(2023, 2024)
+
+
+def test_series_endpoint_resolves_once(series, monkeypatch):
+    from app.routers import ebitda as ebitda_router
+    resolved = []
+    
+    async def resolve(query):
+        resolved.append(query)
+        return {"corp_code": "00126380", "corp_name": "삼성전자", "stock_code": "005930"}
+    
+    monkeypatch.setattr(ebitda_router.corp_resolver, "resolve", resolve)
+    response = TestClient(app).get(
+        "/api/v1/ebitda/series", params={"company": "삼성전자", "from": 2020, "to": 2024}
+    )
+    
+    assert response.status_code == 200
+    body = response.json()
+    assert resolved == ["삼성전자"]
+    assert [p["year"] for p in body["points"]] == [2020, 2021, 2022, 2023, 2024]
+    assert body["upstream_fetches"] == 2
+
+
+def test_series_endpoint_rejects_reversed_range(series):
+    response = TestClient(app).get(
+        "/api/v1/ebitda/series", params={"company": "삼성전자", "from": 2024, "to": 2020}
+    )
+    
+    assert response.status_code == 400
+    assert response.json()["detail"]["error"] == "INVALID_RANGE"
@@ -0,0 +1,126 @@
+"""
+ETag / 조건부 요청(304) 테스트
+"""
+import pytest
+
+from app.routers import ebitda as ebitda_router
+from app.utils.etag import body_etag, etag_matches, variant_etag
+from app.utils.serialization import is_available, MEDIA_JSON, MEDIA_MSGPACK
+from tests.conftest import FETCHED_AT
+
+
+PARAMS = {"company": "005930", "year": 2024, "report_code": "11011"}
+
+
+def test_body_etag_follows_bytes():
+    assert body_etag(b"{}") == body_etag(b"{}")
+    assert body_etag(b'{"cached":false}') != body_etag(b'{"cached":true}')
+    assert body_etag(b"{}").startswith('"') and body_etag(b"{}").endswith('"')
+
+
+@pytest.mark.parametrize("if_none_match, expected", [
+    (None, False),
+    ("", False),
+    ('"abc"', True),
+    ('W/"abc"', True),
+    ('"x", "abc"', True),
+    ('"x",W/"abc"', True),
+    ("*", True),
+    ('"abcd"', False),
+    ("abc", False)
+])
+def test_etag_matches(if_none_match, expected):
+    assert etag_matches(if_none_match, '"abc"') is expected
+
+
+def test_variant_etag():
+    assert variant_etag('"abc"', MEDIA_JSON) == '"abc"'
+    assert variant_etag('"abc"', MEDIA_MSGPACK) != '"abc"'
+    assert variant_etag('W/"abc"', MEDIA_MSGPACK).startswith('W/"')
+
+
+def test_not_modified(client, calculator):
+    first = client.get("/api/v1/ebitda", params=PARAMS)
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    assert etag.startswith('W/"')
+    assert "max-age" in first.headers["Cache-Control"]
+    
+    # 캐시 적중 응답은 source.cached 만 다르고 ETag 는 같음
+    second = client.get("/api/v1/ebitda", params=PARAMS)
+    assert second.json()["source"]["cached"] is True
+    assert second.headers["ETag"] == etag
+    
+    # 처음 받은 ETag 로 304
+    not_modified = client.get(
+        "/api/v1/ebitda", params=PARAMS, headers={"If-None-Match": etag}
+    )
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified.headers["ETag"] == etag
+    
+    # 계산은 처음 한 번만
+    assert calculator.calls == 1
+
+
+def test_source_fetched_at_comes_from_financial_data(client):
+    first = client.get("/api/v1/ebitda", params=PARAMS).json()
+    second = client.get("/api/v1/ebitda", params=PARAMS).json()
+    
+    assert first["source"]["fetched_at"] == second["source"]["fetched_at"] == FETCHED_AT
+
+
+def test_refetch_of_same_filing_keeps_etag(client, calculator, monkeypatch):
+    etag = client.get("/api/v1/ebitda", params=PARAMS).headers["ETag"]
+    
+    # 같은 공시를 다시 조회하면 (조회 시각만 다름) 같은 ETag
+    ebitda_router.ebitda_response_cache.invalidate(
+        ebitda_router._response_cache_key("00126380", 2024, "11011", "CFS")
+    )
+    monkeypatch.setattr(calculator, "calls", 0)
+    refetched = client.get("/api/v1/ebitda", params=PARAMS, headers={"If-None-Match": etag})
+    assert refetched.status_code == 304
+    assert calculator.calls == 1
+
+
+def test_amended_filing_changes_etag(client, calculator, monkeypatch):
+    etag = client.get("/api/v1/ebitda", params=PARAMS).headers["ETag"]
+    
+    ebitda_router.ebitda_response_cache.invalidate(
+        ebitda_router._response_cache_key("00126380", 2024, "11011", "CFS")
+    )
+    original = calculator.calculate_ebitda
+    
+    async def amended(*args, **kwargs):
+        return {**await original(*args, **kwargs), "rcept_no": "20250514000001"}
+    
+    monkeypatch.setattr(ebitda_router.ebitda_calculator, "calculate_ebitda", amended)
+    response = client.get("/api/v1/ebitda", params=PARAMS, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+def test_stale_etag_gets_full_response(client):
+    response = client.get("/api/v1/ebitda", params=PARAMS, headers={"If-None-Match": '"stale"'})
+    assert response.status_code == 200
+    assert response.json()["company"]["corp_code"] == "00126380"
+
+
+@pytest.mark.skipif(not is_available(MEDIA_MSGPACK), reason="msgpack 미설치")
+def test_etag_varies_by_format(client):
+    json_response = client.get("/api/v1/ebitda", params=PARAMS)
+    msgpack_response = client.get(
+        "/api/v1/ebitda", params=PARAMS, headers={"Accept": MEDIA_MSGPACK}
+    )
+    
+    assert msgpack_response.headers["content-type"] == MEDIA_MSGPACK
+    assert "Accept" in msgpack_response.headers["Vary"]
+    assert msgpack_response.headers["ETag"] != json_response.headers["ETag"]
+    
+    # 다른 형식의 ETag 로는 304 가 나오지 않는다
+    response = client.get(
+        "/api/v1/ebitda",
+        params=PARAMS,
+        headers={"Accept": MEDIA_MSGPACK, "If-None-Match": json_response.headers["ETag"]}
+    )
+    assert response.status_code == 200
@@ -0,0 +1,189 @@
+"""
+전체 상장사 EBITDA 내보내기 (순서 / 우선순위 / 커서 재개 / CSV·Parquet) 테스트
+"""
+import asyncio
+import csv
+import io
+
+import pyarrow.parquet
+import pytest
+from fastapi.testclient import TestClient
+
+from app.config import settings
+from app.main import app
+from app.services import export as export_module
+from app.services.dart_client import DartAPIError
+from app.services.export import ebitda_export_service
+from app.utils.rate_limiter import request_priority, PRIORITY_BULK
+from tests.conftest import CORP_ROWS, make_result
+
+
+LISTED = sorted(stock_code for _, _, stock_code, _ in CORP_ROWS if stock_code)
+EXPORT_PARAMS = {"year": 2024, "report_code": "11011"}
+
+
+class FakeDetail:
+    """screening_service.calculate_detail 대역 (뒤쪽 회사일수록 먼저 끝남)"""
+    
+    def __init__(self):
+        self.calls = []
+        self.priorities = set()
+        self.errors = {}
+        self.running = 0
+        self.max_running = 0
+    
+    async def calculate_detail(self, corp_code, year, report_code, fs_div):
+        self.calls.append(corp_code)
+        self.priorities.add(request_priority.get())
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(0.01 / len(self.calls))
+        finally:
+            self.running -= 1
+        
+        error = self.errors.get(corp_code)
+        if error is not None:
+            return None, DartAPIError(error, "에러")
+        return make_result(), None
+
+
+@pytest.fixture
+def detail(resolver, monkeypatch):
+    fake = FakeDetail()
+    monkeypatch.setattr(export_module, "corp_resolver", resolver)
+    monkeypatch.setattr(export_module.screening_service, "calculate_detail", fake.calculate_detail)
+    return fake
+
+
+@pytest.fixture
+def export_client(detail):
+    return TestClient(app)
+
+
+async def collect(companies, concurrency=3):
+    return [
+        row async for row in ebitda_export_service.rows(
+            companies, 2024, "11011", "CFS", concurrency=concurrency
+        )
+    ]
+
+
+def test_companies_resume_after_cursor(detail):
+    companies, has_more = asyncio.run(ebitda_export_service.companies())
+    assert [company["stock_code"] for company in companies] == LISTED
+    assert has_more is False
+    
+    companies, has_more = asyncio.run(ebitda_export_service.companies(cursor=LISTED[1], limit=2))
+    assert [company["stock_code"] for company in companies] == LISTED[2:4]
+    assert has_more is True
+    
+    # 목록에 없는 종목코드도 그 다음 회사부터
+    companies, _ = asyncio.run(ebitda_export_service.companies(cursor="005931"))
+    assert companies[0]["stock_code"] == min(code for code in LISTED if code > "005931")
+
+
+def test_rows_keep_order_at_bulk_priority(detail):
+    companies, _ = asyncio.run(ebitda_export_service.companies())
+    detail.errors[companies[1]["corp_code"]] = "013"
+    
+    rows = asyncio.run(collect(companies))
+    
+    assert [row["stock_code"] for row in rows] == LISTED
+    assert detail.priorities == {PRIORITY_BULK}
+    assert detail.max_running <= 3
+    
+    assert rows[0]["ebitda"] == 600.0
+    assert rows[0]["rcept_no"] == "20250311001085"
+    assert rows[0]["error"] is None
+    # 실패한 회사는 금액 없이 에러 코드만
+    assert rows[1]["error"] == "013"
+    assert "ebitda" not in rows[1]
+
+
+def test_unexpected_failure_does_not_stop_export(detail, monkeypatch):
+    companies, _ = asyncio.run(ebitda_export_service.companies())
+    
+    async def broken(corp_code, year, report_code, fs_div):
+        raise RuntimeError("boom")
+    
+    monkeypatch.setattr(export_module.screening_service, "calculate_detail", broken)
+    rows = asyncio.run(collect(companies))
+    assert [row["error"] for row in rows] == ["INTERNAL_ERROR"] * len(LISTED)
+
+
+def test_closing_early_cancels_pending_calculations(detail):
+    companies, _ = asyncio.run(ebitda_export_service.companies())
+    
+    async def first_row():
+        rows = ebitda_export_service.rows(companies, 2024, "11011", "CFS", concurrency=3)
+        row = await rows.__anext__()
+        await rows.aclose()
+        return row
+    
+    row = asyncio.run(first_row())
+    assert row["stock_code"] == LISTED[0]
+    # 미리 계산하던 창 밖의 회사는 계산하지 않음
+    assert len(detail.calls) <= 4 < len(LISTED)
+    assert detail.running == 0
+
+
+def test_csv_export_streams_all_listed_companies(export_client, monkeypatch):
+    monkeypatch.setattr(settings, "export_chunk_rows", 2)
+    
+    response = export_client.get("/api/v1/export/ebitda", params=EXPORT_PARAMS)
+    
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert response.headers["X-Export-Total"] == str(len(LISTED))
+    assert "X-Next-Cursor" not in response.headers
+    
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [row["stock_code"] for row in rows] == LISTED
+    assert list(rows[0]) == [name for name, _ in ebitda_export_service.COLUMNS]
+
+
+def test_dropped_export_resumes_from_last_stock_code(export_client):
+    full = list(csv.DictReader(io.StringIO(
+        export_client.get("/api/v1/export/ebitda", params=EXPORT_PARAMS).text
+    )))
+    
+    # 세 행까지 받고 끊긴 경우 마지막 stock_code 부터 이어받기
+    resumed = export_client.get(
+        "/api/v1/export/ebitda", params={**EXPORT_PARAMS, "cursor": full[2]["stock_code"]}
+    )
+    rows = list(csv.DictReader(io.StringIO(resumed.text)))
+    assert full[:3] + rows == full
+
+
+def test_limited_pages_follow_next_cursor(export_client):
+    stock_codes = []
+    params = {**EXPORT_PARAMS, "limit": 3}
+    
+    while True:
+        response = export_client.get("/api/v1/export/ebitda", params=params)
+        stock_codes += [row["stock_code"] for row in csv.DictReader(io.StringIO(response.text))]
+        if "X-Next-Cursor" not in response.headers:
+            break
+        params["cursor"] = response.headers["X-Next-Cursor"]
+    
+    assert stock_codes == LISTED
+
+
+def test_parquet_export_is_one_readable_file(export_client, monkeypatch):
+    monkeypatch.setattr(settings, "export_chunk_rows", 2)
+    
+    response = export_client.get("/api/v1/export/ebitda", params={**EXPORT_PARAMS, "format": "parquet"})
+    
+    assert response.status_code == 200
+    table = pyarrow.parquet.read_table(io.BytesIO(response.content))
+    assert table.column_names == [name for name, _ in ebitda_export_service.COLUMNS]
+    assert table.column("stock_code").to_pylist() == LISTED
+    assert table.column("ebitda").to_pylist() == [600.0] * len(LISTED)
+    # 행 묶음마다 행 그룹 하나
+    assert pyarrow.parquet.ParquetFile(io.BytesIO(response.content)).num_row_groups == 4
+
+
+def test_invalid_cursor_is_rejected(export_client):
+    response = export_client.get("/api/v1/export/ebitda", params={**EXPORT_PARAMS, "cursor": "abc"})
+    assert response.status_code == 422
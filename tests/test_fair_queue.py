@@ -0,0 +1,100 @@
+"""
+소비자별 공정 큐 (DRR 배분, 할당량) 테스트
+"""
+import asyncio
+
+import pytest
+
+from app.utils.fair_queue import FairScheduler, QuotaExceeded, QUOTA_WINDOW
+from app.utils.rate_limiter import RateLimiter
+
+
+def grant_order(scheduler, requests):
+    """(소비자, 요청 수) 순서로 한꺼번에 대기열에 넣고 토큰을 받은 소비자 순서 반환"""
+    async def run():
+        order = []
+        
+        async def call(consumer):
+            assert await scheduler.acquire(consumer)
+            order.append(consumer)
+        
+        await asyncio.gather(*[
+            call(consumer) for consumer, count in requests for _ in range(count)
+        ])
+        return order
+    
+    return asyncio.run(run())
+
+
+def unlimited():
+    return RateLimiter(max_calls=10000, time_window=1.0)
+
+
+def test_equal_weights_alternate():
+    order = grant_order(FairScheduler(unlimited()), [("a", 30), ("b", 5)])
+    
+    # a 가 먼저 30건을 쌓아도 b 의 5건은 번갈아 배분된다
+    assert order[:10] == ["a", "b"] * 5
+    assert order[10:] == ["a"] * 25
+
+
+@pytest.mark.parametrize("weights, expected", [
+    ({"a": 2.0}, {"a": 16, "b": 8}),
+    ({"a": 3.0, "b": 1.0}, {"a": 18, "b": 6}),
+    ({"a": 0.5}, {"a": 8, "b": 16})
+])
+def test_weight_shares(weights, expected):
+    order = grant_order(FairScheduler(unlimited(), weights=weights), [("a", 60), ("b", 60)])
+    
+    # 둘 다 대기 중인 동안에는 가중치 비율로 나눈다
+    first = order[:24]
+    assert {name: first.count(name) for name in ("a", "b")} == expected
+
+
+def test_quota_rejects_with_retry_after():
+    scheduler = FairScheduler(unlimited(), quotas={"a": 2})
+    
+    async def run():
+        assert await scheduler.acquire("a")
+        assert await scheduler.acquire("a")
+        with pytest.raises(QuotaExceeded) as excinfo:
+            await scheduler.acquire("a")
+        
+        # 다른 소비자는 영향 없음
+        assert await scheduler.acquire("b")
+        return excinfo.value
+    
+    error = asyncio.run(run())
+    assert error.code == "QUOTA_EXCEEDED"
+    assert error.quota == 2
+    assert 1 <= error.retry_after <= QUOTA_WINDOW
+
+
+def test_quota_counts_waiting_requests():
+    # 토큰이 없어 대기 중인 요청도 할당량에 포함된다
+    scheduler = FairScheduler(RateLimiter(max_calls=1, time_window=60.0), default_quota=2)
+    
+    async def run():
+        assert await scheduler.acquire("a")
+        waiting = asyncio.create_task(scheduler.acquire("a"))
+        await asyncio.sleep(0.01)
+        try:
+            with pytest.raises(QuotaExceeded):
+                await scheduler.acquire("a")
+        finally:
+            waiting.cancel()
+            await asyncio.gather(waiting, return_exceptions=True)
+    
+    asyncio.run(run())
+
+
+def test_quota_exceeded_response_has_retry_after(client, calculator):
+    calculator.error = QuotaExceeded("anonymous", 10, 12.3)
+    
+    response = client.get(
+        "/api/v1/ebitda", params={"company": "005930", "year": 2024, "report_code": "11011"}
+    )
+    
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "13"
+    assert response.json()["detail"]["error"] == "QUOTA_EXCEEDED"
@@ -0,0 +1,47 @@
+"""
+재무정보 캐시 테스트 (조회 시각 유지)
+"""
+import asyncio
+
+import httpx
+import pytest
+
+from app.services.ebitda_calculator import ebitda_calculator
+from app.services.financial_service import financial_service
+from tests.conftest import account_row
+
+
+@pytest.fixture
+def statements(opendart, cache):
+    opendart.routes["fnlttSinglAcntAll.json"] = httpx.Response(200, json={
+        "status": "000",
+        "list": [account_row("IS", "영업이익", "100")]
+    })
+    return opendart
+
+
+def calculate():
+    return asyncio.run(ebitda_calculator.calculate_ebitda("00126380", 2024, "11011", "CFS"))
+
+
+def test_cached_result_keeps_fetched_at(statements):
+    first = calculate()
+    second = calculate()
+    
+    assert first["fetched_at"]
+    assert second["from_cache"] is True
+    assert second["fetched_at"] == first["fetched_at"]
+    assert len(statements.calls("fnlttSinglAcntAll.json")) == 1
+
+
+def test_cached_entry_without_fetched_at_is_refetched(statements, cache):
+    asyncio.run(cache.set(
+        {"fs_div": "CFS", "rcept_no": "20250311001085", "accounts": []},
+        "00126380", 2024, "11011", "CFS"
+    ))
+    
+    data = asyncio.run(financial_service.get_financial_data("00126380", 2024, "11011", "CFS"))
+    
+    assert data["_from_cache"] is False
+    assert data["fetched_at"]
+    assert len(statements.calls("fnlttSinglAcntAll.json")) == 1
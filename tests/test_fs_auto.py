@@ -0,0 +1,127 @@
+"""
+fs_div=AUTO 조회 테스트 (연결 우선, 개별 대체 / 추측 요청 / CFS 없음 기록)
+"""
+import asyncio
+
+import httpx
+import pytest
+
+from app.config import settings
+from app.services.financial_service import FinancialService
+from app.utils.rate_limiter import request_priority, PRIORITY_BULK
+from tests.conftest import account_row
+
+
+NO_DATA = {"status": "013", "message": "조회된 데이타가 없습니다."}
+
+
+def statements(fs_divs):
+    """fs_div 별 fnlttSinglAcntAll 응답 (fs_divs 에 없는 구분은 013)"""
+    def handle(request):
+        fs_div = request.url.params["fs_div"]
+        if fs_div not in fs_divs:
+            return httpx.Response(200, json=NO_DATA)
+        return httpx.Response(200, json={
+            "status": "000",
+            "list": [account_row("IS", f"영업이익({fs_div})", "100")]
+        })
+    return handle
+
+
+def fs_divs_called(opendart):
+    return [r.url.params["fs_div"] for r in opendart.calls("fnlttSinglAcntAll.json")]
+
+
+def fetch(service, year=2024):
+    return asyncio.run(service.get_financial_data("00126380", year, "11011", "AUTO"))
+
+
+@pytest.fixture
+def service(cache):
+    return FinancialService()
+
+
+def test_cfs_preferred(service, opendart):
+    opendart.routes["fnlttSinglAcntAll.json"] = statements({"CFS", "OFS"})
+    
+    data = fetch(service)
+    
+    assert data["fs_div"] == "CFS"
+    assert fs_divs_called(opendart) == ["CFS"]
+
+
+def test_ofs_fallback_is_remembered(service, opendart):
+    opendart.routes["fnlttSinglAcntAll.json"] = statements({"OFS"})
+    
+    assert fetch(service)["fs_div"] == "OFS"
+    assert fs_divs_called(opendart) == ["CFS", "OFS"]
+    
+    # 다음 요청은 CFS 를 다시 묻지 않음 (OFS 는 재무정보 캐시에서)
+    assert fetch(service)["fs_div"] == "OFS"
+    assert fs_divs_called(opendart) == ["CFS", "OFS"]
+
+
+def test_cfs_unavailable_survives_restart(service, opendart):
+    opendart.routes["fnlttSinglAcntAll.json"] = statements({"OFS"})
+    fetch(service)
+    
+    restarted = FinancialService()
+    
+    assert asyncio.run(restarted._is_cfs_unavailable(("00126380", 2024, "11011")))
+    assert fetch(restarted)["fs_div"] == "OFS"
+    assert fs_divs_called(opendart) == ["CFS", "OFS"]
+
+
+def test_cfs_unavailable_expires(service, opendart, monkeypatch):
+    monkeypatch.setattr(settings, "negative_cache_hours", 0.0)
+    opendart.routes["fnlttSinglAcntAll.json"] = statements({"OFS"})
+    fetch(service)
+    
+    # 기록이 만료되어 CFS 가 새로 공시됐는지 다시 확인
+    opendart.routes["fnlttSinglAcntAll.json"] = statements({"CFS", "OFS"})
+    
+    assert fetch(service)["fs_div"] == "CFS"
+    assert fs_divs_called(opendart)[-1] == "CFS"
+    assert not asyncio.run(FinancialService()._is_cfs_unavailable(("00126380", 2024, "11011")))
+
+
+def test_neither_statement_available(service, opendart):
+    opendart.routes["fnlttSinglAcntAll.json"] = statements(set())
+    
+    with pytest.raises(Exception) as exc_info:
+        fetch(service)
+    
+    assert exc_info.value.code == "013"
+    assert "연결/개별재무제표 모두" in exc_info.value.message
+
+
+def test_slow_cfs_hedges_with_ofs(service, opendart, monkeypatch):
+    monkeypatch.setattr(settings, "fs_auto_hedge_delay", 0.0)
+    handle = statements({"CFS", "OFS"})
+    
+    async def slow_cfs(request):
+        if request.url.params["fs_div"] == "CFS":
+            await asyncio.sleep(0.05)
+        return handle(request)
+    
+    opendart.routes["fnlttSinglAcntAll.json"] = slow_cfs
+    
+    async def run():
+        data = await service.get_financial_data("00126380", 2024, "11011", "AUTO")
+        await asyncio.gather(*service._background_fetches)
+        return data
+    
+    assert asyncio.run(run())["fs_div"] == "CFS"
+    assert sorted(fs_divs_called(opendart)) == ["CFS", "OFS"]
+
+
+def test_bulk_requests_do_not_hedge(service, opendart, monkeypatch):
+    monkeypatch.setattr(settings, "fs_auto_hedge_delay", 0.0)
+    opendart.routes["fnlttSinglAcntAll.json"] = statements({"CFS", "OFS"})
+    
+    async def run():
+        request_priority.set(PRIORITY_BULK)
+        return await service.get_financial_data("00126380", 2024, "11011", "AUTO")
+    
+    assert asyncio.run(run())["fs_div"] == "CFS"
+    assert fs_divs_called(opendart) == ["CFS"]
@@ -0,0 +1,195 @@
+"""
+스크리닝 작업 단계 기록 / 재개 테스트
+"""
+import asyncio
+
+import pytest
+
+from app.services import jobs as jobs_module
+from app.services.dart_client import DartAPIError
+from app.services.jobs import JobManager
+from app.utils.job_store import JobStore
+
+
+COMPANIES = ["A", "B", "C", "D", "없는회사"]
+
+# corp_code -> 영업이익
+OPERATING_INCOME = {"0000000A": 100.0, "0000000B": 400.0, "0000000C": 300.0, "0000000D": 200.0}
+
+
+class FakeScreening:
+    """주요계정 일괄 조회/상세 계산 대역 (errors 로 회사별 에러 지정)"""
+    
+    def __init__(self):
+        self.screen_errors = {}
+        self.detail_errors = {}
+        self.detail_calls = []
+    
+    async def screen_operating_income(self, corp_codes, year, report_code, fs_div):
+        items = {}
+        for corp_code in corp_codes:
+            error = self.screen_errors.get(corp_code)
+            items[corp_code] = {
+                "corp_code": corp_code,
+                "operating_income": None if error else OPERATING_INCOME[corp_code],
+                "fs_div": None if error else "CFS",
+                "error": error
+            }
+        return {"items": items, "bulk_calls": 1}
+    
+    async def calculate_detail(self, corp_code, year, report_code, fs_div):
+        self.detail_calls.append(corp_code)
+        error = self.detail_errors.get(corp_code)
+        if error is not None:
+            return None, DartAPIError(error, "에러")
+        return {"ebitda_total": OPERATING_INCOME[corp_code] + 1, "fs_div": fs_div}, None
+
+
+@pytest.fixture
+def store(monkeypatch, tmp_path):
+    store = JobStore(tmp_path / "jobs.db")
+    monkeypatch.setattr(jobs_module, "job_store", store)
+    return store
+
+
+@pytest.fixture
+def screening(monkeypatch):
+    fake = FakeScreening()
+    
+    async def resolve_many(companies):
+        return [
+            None if company == "없는회사"
+            else {"corp_code": f"0000000{company}", "corp_name": company, "stock_code": None}
+            for company in companies
+        ]
+    
+    monkeypatch.setattr(jobs_module.corp_resolver, "resolve_many", resolve_many)
+    monkeypatch.setattr(
+        jobs_module.screening_service, "screen_operating_income", fake.screen_operating_income
+    )
+    monkeypatch.setattr(jobs_module.screening_service, "calculate_detail", fake.calculate_detail)
+    return fake
+
+
+@pytest.fixture
+def manager(store, screening, monkeypatch):
+    manager = JobManager()
+    manager.retries = []
+    monkeypatch.setattr(manager, "_retry_later", manager.retries.append)
+    return manager
+
+
+PARAMS = {
+    "companies": COMPANIES, "year": 2024, "report_code": "11011", "fs_div": "CFS",
+    "min_operating_income": None, "top_n": 2
+}
+
+
+def submit(manager, params=PARAMS):
+    return asyncio.run(manager.submit(dict(params)))
+
+
+def states(store, job_id):
+    items = asyncio.run(store.get_items(job_id))
+    return {item["query"]: (item["state"], item["rank"], item["ebitda"]) for item in items}
+
+
+def test_job_runs_all_stages(manager, store):
+    job_id = submit(manager)
+    asyncio.run(manager._run(job_id))
+    
+    assert states(store, job_id) == {
+        "B": ("done", 1, 401.0),
+        "C": ("done", 2, 301.0),
+        "D": ("screened", 3, None),
+        "A": ("screened", 4, None),
+        "없는회사": ("failed", None, None),
+    }
+    
+    status = asyncio.run(manager.get_status(job_id))
+    assert (status["status"], status["stage"]) == ("completed", "done")
+    assert status["progress"]["done"] == 2
+
+
+def test_select_is_idempotent_after_interruption(manager, store, screening):
+    job_id = submit(manager)
+    
+    async def interrupted():
+        await manager._resolve(job_id, PARAMS)
+        await manager._screen(job_id, PARAMS)
+        # 순위는 기록했지만 단계를 넘기기 전에 중단
+        await store.update_job(job_id, stage=manager.STAGE_SELECT)
+        await manager._select(job_id, PARAMS)
+    
+    asyncio.run(interrupted())
+    asyncio.run(manager._run(job_id))
+    
+    assert sorted(screening.detail_calls) == ["0000000B", "0000000C"]
+    assert asyncio.run(store.count_items(job_id))["done"] == 2
+
+
+def test_resume_skips_finished_items(manager, store, screening):
+    job_id = submit(manager)
+    screening.detail_errors["0000000C"] = "020"
+    
+    asyncio.run(manager._run(job_id))
+    
+    # 일시적 에러 항목은 선별 상태로 남고 작업은 나중에 재시도
+    assert manager.retries == [job_id]
+    assert states(store, job_id)["C"] == ("selected", 2, None)
+    
+    screening.detail_errors.clear()
+    screening.detail_calls.clear()
+    asyncio.run(manager._run(job_id))
+    
+    assert screening.detail_calls == ["0000000C"]
+    assert states(store, job_id)["C"] == ("done", 2, 301.0)
+    assert asyncio.run(store.get_job(job_id))["status"] == "completed"
+
+
+def test_transient_screen_error_keeps_item_pending(manager, store, screening):
+    job_id = submit(manager)
+    screening.screen_errors["0000000A"] = "020"
+    
+    asyncio.run(manager._run(job_id))
+    
+    assert manager.retries == [job_id]
+    assert asyncio.run(store.get_job(job_id))["stage"] == "screen"
+    assert states(store, job_id)["A"][0] == "pending"
+    
+    screening.screen_errors.clear()
+    asyncio.run(manager._run(job_id))
+    
+    assert states(store, job_id)["A"] == ("screened", 4, None)
+
+
+def test_permanent_errors_fail_items(manager, store, screening):
+    job_id = submit(manager)
+    screening.screen_errors["0000000A"] = "013"
+    screening.detail_errors["0000000B"] = "013"
+    
+    asyncio.run(manager._run(job_id))
+    
+    items = {item["query"]: item for item in asyncio.run(store.get_items(job_id))}
+    assert (items["A"]["state"], items["A"]["error"]) == ("failed", "013")
+    assert (items["B"]["state"], items["B"]["error"]) == ("failed", "013")
+    assert manager.retries == []
+
+
+def test_unfinished_jobs_are_requeued(manager, store, monkeypatch):
+    job_id = submit(manager)
+    restarted = JobManager()
+    ran = []
+    
+    async def run(job_id):
+        ran.append(job_id)
+    
+    monkeypatch.setattr(restarted, "_run", run)
+    
+    async def restart():
+        await restarted.start()
+        await restarted._queue.join()
+        await restarted.stop()
+    
+    asyncio.run(restart())
+    assert ran == [job_id]
@@ -0,0 +1,137 @@
+"""
+분기/TTM EBITDA 계산 테스트 (누적 보고서 차감 / 계산 결과 캐시 무효화)
+"""
+import asyncio
+
+import httpx
+import pytest
+
+from app.services.financial_service import financial_service
+from app.services.period_engine import ebitda_period_engine
+from app.utils.cache import LRUCache
+from tests.conftest import account_row
+
+
+# (사업연도, 보고서 코드) -> (당기 누적 영업이익, 전기 누적 영업이익)
+OPERATING_INCOME = {
+    (2023, "11011"): ("60", "50"),
+    (2024, "11013"): ("10", "8"),
+    (2024, "11012"): ("25", "20"),
+    (2024, "11014"): ("45", "35"),
+    (2024, "11011"): ("70", "60"),
+}
+
+
+class FakeStatements:
+    """보고서별 fnlttSinglAcntAll 응답 (rcept_nos 로 접수번호를 바꿀 수 있음)"""
+    
+    def __init__(self):
+        self.rcept_nos = {}
+    
+    def handle(self, request):
+        key = (int(request.url.params["bsns_year"]), request.url.params["reprt_code"])
+        if key not in OPERATING_INCOME:
+            return httpx.Response(200, json={"status": "013", "message": "조회된 데이타가 없습니다."})
+        
+        current, prior = OPERATING_INCOME[key]
+        fields = (
+            {"thstrm_amount": current, "frmtrm_amount": prior}
+            if key[1] == "11011"
+            else {"thstrm_add_amount": current, "frmtrm_add_amount": prior}
+        )
+        row = account_row(
+            "IS", "영업이익", fields.pop("thstrm_amount", "0"),
+            rcept_no=self.rcept_nos.get(key, f"{key[0]}{key[1]}"), **fields
+        )
+        return httpx.Response(200, json={"status": "000", "list": [row]})
+
+
+@pytest.fixture
+def statements(opendart, cache, monkeypatch):
+    fake = FakeStatements()
+    opendart.routes["fnlttSinglAcntAll.json"] = fake.handle
+    monkeypatch.setattr(ebitda_period_engine, "_latest_rcept_nos", LRUCache(64))
+    return fake
+
+
+def quarter(q, year=2024, use_cache=True):
+    return asyncio.run(ebitda_period_engine.calculate_quarter("00126380", year, q, "CFS", use_cache))
+
+
+def refetch(year, report_code):
+    return asyncio.run(financial_service.get_financial_data(
+        "00126380", year, report_code, "CFS", use_cache=False
+    ))
+
+
+@pytest.mark.parametrize("q, quarter_total, ttm_total", [
+    (1, 10.0, 62.0),
+    (2, 15.0, 65.0),
+    (3, 20.0, 70.0),
+    (4, 25.0, 70.0),
+])
+def test_quarter_and_ttm(statements, q, quarter_total, ttm_total):
+    data = quarter(q)
+    
+    assert data["quarter_ebitda"]["total"] == quarter_total
+    assert data["ttm_ebitda"]["total"] == ttm_total
+    assert data["from_cache"] is False
+
+
+def test_missing_previous_report_warns(statements, monkeypatch):
+    monkeypatch.delitem(OPERATING_INCOME, (2023, "11011"))
+    data = quarter(2)
+    
+    assert data["quarter_ebitda"]["total"] == 15.0
+    assert data["ttm_ebitda"] is None
+    assert any("2023년 사업보고서" in w for w in data["warnings"])
+    # 일부 보고서로 계산한 결과는 저장하지 않음
+    assert quarter(2)["from_cache"] is False
+
+
+def test_result_is_cached(statements, opendart):
+    quarter(2)
+    calls = len(opendart.calls("fnlttSinglAcntAll.json"))
+    
+    assert quarter(2)["from_cache"] is True
+    assert len(opendart.calls("fnlttSinglAcntAll.json")) == calls
+
+
+def test_refetch_with_same_rcept_no_keeps_result(statements):
+    quarter(2)
+    refetch(2024, "11012")
+    
+    assert quarter(2)["from_cache"] is True
+
+
+def test_amended_report_invalidates_before_refetch_returns(statements):
+    quarter(2)
+    statements.rcept_nos[(2024, "11012")] = "20250814000999"
+    
+    # 무효화는 재조회가 끝나기 전에 완료된다
+    refetch(2024, "11012")
+    data = quarter(2)
+    
+    assert data["from_cache"] is False
+    assert {"year": 2024, "report_code": "11012", "rcept_no": "20250814000999"} in data["sources"]
+    assert quarter(2)["from_cache"] is True
+
+
+def test_amended_previous_year_invalidates_ttm(statements):
+    quarter(1)
+    statements.rcept_nos[(2023, "11011")] = "20240601000001"
+    refetch(2023, "11011")
+    
+    assert quarter(1)["from_cache"] is False
+
+
+def test_result_from_superseded_report_is_not_stored(statements):
+    quarter(2)
+    
+    # 캐시된 이전 보고서로 계산하는 동안 다른 요청이 정정 보고서를 조회한 경우
+    asyncio.run(ebitda_period_engine._on_financial_refresh(
+        "00126380", 2024, "11012", "CFS", "20250814000999"
+    ))
+    
+    assert quarter(2)["quarter_ebitda"]["total"] == 15.0
+    assert quarter(2)["from_cache"] is False
@@ -0,0 +1,68 @@
+"""
+같은 응답의 전기/전전기 금액으로 과거 EBITDA 계산 테스트
+"""
+import asyncio
+
+from app.services.ebitda_calculator import ebitda_calculator
+from tests.conftest import account_row
+
+
+def calculate(report_code="11011"):
+    return asyncio.run(ebitda_calculator.calculate_ebitda("00126380", 2024, report_code, "CFS"))
+
+
+def test_annual_report_has_prior_and_pre_prior(financial_data):
+    financial_data.accounts = [
+        account_row("IS", "영업이익", "100", frmtrm_amount="90", bfefrm_amount="80"),
+        account_row("CF", "감가상각비", "20", frmtrm_amount="19", bfefrm_amount="18"),
+        account_row("CF", "무형자산상각비", "3", frmtrm_amount="2", bfefrm_amount="1"),
+    ]
+    result = calculate()
+    
+    assert result["ebitda_total"] == 123.0
+    assert result["prior_periods"] == [
+        {"year": 2023, "label": "전기", "operating_income": 90.0,
+         "depreciation": 19.0, "amortization": 2.0, "ebitda_total": 111.0},
+        {"year": 2022, "label": "전전기", "operating_income": 80.0,
+         "depreciation": 18.0, "amortization": 1.0, "ebitda_total": 99.0},
+    ]
+    assert len(financial_data.calls) == 1
+
+
+def test_quarterly_report_uses_prior_cumulative_amounts(financial_data):
+    financial_data.accounts = [
+        account_row("IS", "영업이익", "30", thstrm_add_amount="60",
+                    frmtrm_amount="25", frmtrm_add_amount="50"),
+        # 현금흐름표는 누적금액 필드가 없고 당기/전기 금액이 곧 누적
+        account_row("CF", "감가상각비", "10", frmtrm_amount="8"),
+    ]
+    result = calculate("11012")
+    
+    assert result["ebitda_total"] == 70.0
+    assert [p["label"] for p in result["prior_periods"]] == ["전기"]
+    assert result["prior_periods"][0]["operating_income"] == 50.0
+    assert result["prior_periods"][0]["depreciation"] == 8.0
+    assert result["prior_periods"][0]["ebitda_total"] == 58.0
+
+
+def test_period_without_amounts_is_omitted(financial_data):
+    financial_data.accounts = [
+        account_row("IS", "영업이익", "100", frmtrm_amount="90"),
+        account_row("CF", "감가상각비", "20", frmtrm_amount="", bfefrm_amount=None),
+    ]
+    periods = calculate()["prior_periods"]
+    
+    assert [p["label"] for p in periods] == ["전기"]
+    assert periods[0]["depreciation"] == 0.0
+
+
+def test_combined_account_counted_once_in_prior_periods(financial_data):
+    financial_data.accounts = [
+        account_row("IS", "영업이익", "100", frmtrm_amount="90"),
+        account_row("CF", "감가상각비및무형자산상각비", "30", frmtrm_amount="25"),
+    ]
+    period = calculate()["prior_periods"][0]
+    
+    assert period["depreciation"] == 25.0
+    assert period["amortization"] == 0.0
+    assert period["ebitda_total"] == 115.0
@@ -0,0 +1,69 @@
+"""
+resolve() 결과 메모리 캐시 (NOT_FOUND 포함) 테스트
+"""
+import asyncio
+
+import pytest
+
+from app.services.corp_resolver import CompanyNotFound
+from app.utils.cache import LRUCache
+from tests.conftest import CORP_ROWS, corp_code_xml
+
+
+def test_lru_evicts_least_recently_used():
+    cache = LRUCache(2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+    
+    assert cache.peek("b") is None
+    assert cache.keys() == ["a", "c"]
+    assert cache.stats()["hits"] == 1
+
+
+def test_resolve_is_memoized(resolver, monkeypatch):
+    lookups = []
+    lookup = resolver._lookup
+    monkeypatch.setattr(resolver, "_lookup", lambda key: lookups.append(key) or lookup(key))
+    
+    for query in ("삼성전자", " 삼성전자", "삼성전자 ", "SK하이닉스", "sk하이닉스"):
+        asyncio.run(resolver.resolve(query))
+    
+    # 앞뒤 공백 / 대소문자를 정규화한 키로 캐시
+    assert lookups == ["삼성전자", "sk하이닉스"]
+    assert resolver.resolve_cache_stats()["hits"] == 3
+
+
+def test_not_found_is_memoized(resolver, monkeypatch):
+    lookups = []
+    lookup = resolver._lookup
+    monkeypatch.setattr(resolver, "_lookup", lambda key: lookups.append(key) or lookup(key))
+    
+    for _ in range(3):
+        with pytest.raises(CompanyNotFound):
+            asyncio.run(resolver.resolve("없는회사"))
+    
+    assert lookups == ["없는회사"]
+
+
+def test_resolve_many_shares_cache(resolver):
+    results = asyncio.run(resolver.resolve_many(["005930", "없는회사", "005930"]))
+    
+    assert [r and r["corp_code"] for r in results] == ["00126380", None, "00126380"]
+    assert resolver.resolve_cache_stats()["hits"] == 1
+
+
+def test_refresh_clears_cache(resolver, monkeypatch):
+    with pytest.raises(CompanyNotFound):
+        asyncio.run(resolver.resolve("새회사"))
+    
+    async def download_and_extract():
+        resolver.cache_file.write_bytes(
+            corp_code_xml(CORP_ROWS + [("00000002", "새회사", "111110", "20240601")])
+        )
+    monkeypatch.setattr(resolver, "_download_and_extract", download_and_extract)
+    asyncio.run(resolver.refresh())
+    
+    # 캐시된 NOT_FOUND 가 남지 않는다
+    assert asyncio.run(resolver.resolve("새회사"))["corp_code"] == "00000002"
@@ -0,0 +1,155 @@
+"""
+다중회사 주요계정 일괄 조회 / 영업이익 스크리닝 테스트
+"""
+import asyncio
+
+import httpx
+import pytest
+
+from app.services import financial_service as financial_service_module
+from app.services.financial_service import financial_service
+from app.services.screening import screening_service
+from tests.conftest import account_row
+
+
+def corp_codes(count):
+    return [f"{i:08d}" for i in range(1, count + 1)]
+
+
+class FakeMultiAccounts:
+    """fnlttMultiAcnt 응답 (operating_income 에 있는 회사만 행이 있음)"""
+    
+    def __init__(self):
+        # corp_code -> {fs_div: 영업이익}
+        self.operating_income = {}
+        self.error = None
+    
+    def handle(self, request):
+        if self.error is not None:
+            return httpx.Response(200, json={"status": self.error, "message": "에러"})
+        
+        rows = [
+            {
+                "corp_code": corp_code,
+                "stock_code": "",
+                "fs_div": fs_div,
+                "sj_div": "IS",
+                "account_nm": "영업이익",
+                "thstrm_amount": str(amount)
+            }
+            for corp_code in request.url.params["corp_code"].split(",")
+            for fs_div, amount in self.operating_income.get(corp_code, {}).items()
+        ]
+        if not rows:
+            return httpx.Response(200, json={"status": "013", "message": "조회된 데이타가 없습니다."})
+        return httpx.Response(200, json={"status": "000", "list": rows})
+
+
+@pytest.fixture
+def multi(opendart, cache):
+    fake = FakeMultiAccounts()
+    opendart.routes["fnlttMultiAcnt.json"] = fake.handle
+    return fake
+
+
+def bulk(codes, year=2024):
+    return asyncio.run(financial_service.get_major_accounts_bulk(codes, year, "11011"))
+
+
+def test_bulk_packs_companies_into_batches(multi, opendart):
+    codes = corp_codes(250)
+    multi.operating_income = {code: {"CFS": 1} for code in codes}
+    
+    result = bulk(codes + codes[:10])
+    
+    batches = [r.url.params["corp_code"].split(",") for r in opendart.calls("fnlttMultiAcnt.json")]
+    assert sorted(len(batch) for batch in batches) == [50, 100, 100]
+    assert result["upstream_calls"] == 3
+    assert len(result["accounts"]) == 250
+
+
+def test_bulk_uses_cache_for_found_and_missing_companies(multi, opendart):
+    codes = corp_codes(3)
+    multi.operating_income = {codes[0]: {"CFS": 1}}
+    
+    first = bulk(codes)
+    second = bulk(codes)
+    
+    assert first["accounts"][codes[1]] == []
+    assert second["accounts"] == first["accounts"]
+    assert second["upstream_calls"] == 0
+    assert len(opendart.calls("fnlttMultiAcnt.json")) == 1
+
+
+def test_bulk_reports_failed_batches(multi):
+    multi.error = "100"
+    result = bulk(corp_codes(2))
+    
+    assert result["failed"] == {"00000001": "100", "00000002": "100"}
+    assert result["accounts"] == {}
+    # 실패한 회사는 캐시하지 않음
+    multi.error = None
+    assert bulk(corp_codes(2))["upstream_calls"] == 1
+
+
+def test_rows_without_corp_code_are_grouped_by_stock_code(resolver, monkeypatch):
+    monkeypatch.setattr(financial_service_module, "corp_resolver", resolver)
+    rows = [
+        {"corp_code": "", "stock_code": "005930", "account_nm": "영업이익"},
+        {"stock_code": " 000660 ", "account_nm": "영업이익"},
+        {"stock_code": "999999", "account_nm": "영업이익"},
+    ]
+    
+    grouped = asyncio.run(financial_service._group_by_corp_code(["00126380", "00164779"], rows))
+    
+    assert {code: len(rows) for code, rows in grouped.items()} == {"00126380": 1, "00164779": 1}
+
+
+def test_auto_prefers_consolidated_operating_income(multi):
+    multi.operating_income = {
+        "00000001": {"CFS": 100, "OFS": 90},
+        "00000002": {"OFS": 50},
+    }
+    items = asyncio.run(screening_service.screen_operating_income(
+        corp_codes(3), 2024, "11011", "AUTO"
+    ))["items"]
+    
+    assert (items["00000001"]["operating_income"], items["00000001"]["fs_div"]) == (100.0, "CFS")
+    assert (items["00000002"]["operating_income"], items["00000002"]["fs_div"]) == (50.0, "OFS")
+    assert items["00000003"]["error"] == "013"
+
+
+def test_screen_fetches_detail_only_for_selected(multi, opendart):
+    codes = corp_codes(5)
+    multi.operating_income = {code: {"CFS": i * 100} for i, code in enumerate(codes, 1)}
+    opendart.routes["fnlttSinglAcntAll.json"] = httpx.Response(200, json={
+        "status": "000",
+        "list": [account_row("IS", "영업이익", "500"), account_row("CF", "감가상각비", "50")]
+    })
+    
+    result = asyncio.run(screening_service.screen(
+        codes, 2024, "11011", "CFS", min_operating_income=200, top_n=2
+    ))
+    
+    detailed = [r.url.params["corp_code"] for r in opendart.calls("fnlttSinglAcntAll.json")]
+    assert sorted(detailed) == ["00000004", "00000005"]
+    assert result["bulk_calls"] == 1
+    assert result["detail_calls"] == 2
+    assert [item["corp_code"] for item in result["items"]] == [
+        "00000005", "00000004", "00000003", "00000002", "00000001"
+    ]
+    assert result["items"][0]["ebitda"] == 550.0
+    assert result["items"][2]["ebitda"] is None
+
+
+def test_select_applies_threshold_then_top_n():
+    items = [
+        {"corp_code": "a", "operating_income": 10.0},
+        {"corp_code": "b", "operating_income": None},
+        {"corp_code": "c", "operating_income": 30.0},
+        {"corp_code": "d", "operating_income": 20.0},
+    ]
+    by_income, selected = screening_service.select(items, min_operating_income=15, top_n=5)
+    
+    assert [item["corp_code"] for item in by_income] == ["c", "d", "a"]
+    assert [item["corp_code"] for item in selected] == ["c", "d"]
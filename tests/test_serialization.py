@@ -0,0 +1,111 @@
+"""
+응답 형식 협상 및 직렬화 테스트
+"""
+import orjson
+import pytest
+
+from app.routers.ebitda import RESPONSE_MEDIA_TYPES, BATCH_MEDIA_TYPES, BATCH_MEDIA_ALIASES
+from app.utils.serialization import (
+    negotiate_media_type, dumps, dumps_with_fragments, is_available,
+    MEDIA_JSON, MEDIA_NDJSON, MEDIA_MSGPACK, MEDIA_ARROW
+)
+
+
+requires_msgpack = pytest.mark.skipif(not is_available(MEDIA_MSGPACK), reason="msgpack 미설치")
+
+
+@pytest.mark.parametrize("accept", [None, "", "  ", "*/*", "application/*"])
+def test_default_media_type(accept):
+    assert negotiate_media_type(accept, RESPONSE_MEDIA_TYPES) == MEDIA_JSON
+
+
+@requires_msgpack
+@pytest.mark.parametrize("accept, expected", [
+    # 별칭
+    ("application/x-msgpack", MEDIA_MSGPACK),
+    ("application/vnd.msgpack", MEDIA_MSGPACK),
+    ("Application/MsgPack", MEDIA_MSGPACK),
+    # q 값이 높은 형식
+    ("application/json;q=0.5, application/msgpack", MEDIA_MSGPACK),
+    ("application/json, application/msgpack;q=0.9", MEDIA_JSON),
+    # q 값이 같으면 기본 형식 우선
+    ("application/msgpack, application/json", MEDIA_JSON),
+    # q=0 은 거절: 구체적인 범위가 와일드카드보다 우선
+    ("application/json;q=0, */*", MEDIA_MSGPACK),
+    ("*/*;q=0.1, application/msgpack", MEDIA_MSGPACK),
+    ("application/*;q=0, application/msgpack", MEDIA_MSGPACK),
+    # 잘못된 q 값은 0 으로 취급
+    ("application/json;q=abc, application/msgpack;q=0.2", MEDIA_MSGPACK)
+])
+def test_negotiation(accept, expected):
+    assert negotiate_media_type(accept, RESPONSE_MEDIA_TYPES) == expected
+
+
+@pytest.mark.parametrize("accept", [
+    "text/html",
+    "application/json;q=0",
+    "*/*;q=0",
+    "application/json;q=0, application/msgpack;q=0, application/x-msgpack;q=0"
+])
+def test_not_acceptable(accept):
+    assert negotiate_media_type(accept, RESPONSE_MEDIA_TYPES) is None
+
+
+@pytest.mark.parametrize("accept, expected", [
+    ("application/json", MEDIA_NDJSON),
+    ("application/x-ndjson", MEDIA_NDJSON),
+    ("text/html, application/json;q=0.5", MEDIA_NDJSON)
+])
+def test_batch_accepts_json_as_ndjson(accept, expected):
+    assert negotiate_media_type(accept, BATCH_MEDIA_TYPES, BATCH_MEDIA_ALIASES) == expected
+
+
+def test_batch_alias_does_not_leak():
+    # 별칭은 해당 협상에서만 적용된다
+    assert negotiate_media_type("application/json", BATCH_MEDIA_TYPES) is None
+    assert negotiate_media_type("application/x-ndjson", RESPONSE_MEDIA_TYPES) is None
+
+
+def test_batch_json_refused():
+    expected = MEDIA_MSGPACK if is_available(MEDIA_MSGPACK) else (
+        MEDIA_ARROW if is_available(MEDIA_ARROW) else None
+    )
+    assert negotiate_media_type(
+        "application/json;q=0, */*", BATCH_MEDIA_TYPES, BATCH_MEDIA_ALIASES
+    ) == expected
+
+
+def test_batch_over_http(client):
+    response = client.post(
+        "/api/v1/ebitda/batch",
+        headers={"Accept": "application/json"},
+        json={"items": [{"company": "005930", "year": 2024, "report_code": "11011"}]}
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith(MEDIA_NDJSON)
+    
+    not_acceptable = client.post(
+        "/api/v1/ebitda/batch",
+        headers={"Accept": "text/html"},
+        json={"items": [{"company": "005930", "year": 2024, "report_code": "11011"}]}
+    )
+    assert not_acceptable.status_code == 406
+
+
+def test_fragments_keep_field_order():
+    body = dumps_with_fragments(
+        {"index": 0, "result": None, "error": None},
+        {"result": b'{"a":1}', "warnings": b"[]"}
+    )
+    assert body == b'{"index":0,"result":{"a":1},"error":null,"warnings":[]}'
+
+
+def test_fragments_do_not_need_orjson_fragment(monkeypatch):
+    # requirements 의 최소 버전(3.8)에는 orjson.Fragment 가 없다
+    monkeypatch.delattr(orjson, "Fragment", raising=False)
+    body = dumps_with_fragments({"a": [1, "가"], "b": None}, {"b": b'{"c":2}'})
+    assert orjson.loads(body) == {"a": [1, "가"], "b": {"c": 2}}
+
+
+def test_dumps_keeps_korean():
+    assert dumps({"name": "삼성전자"}) == '{"name":"삼성전자"}'.encode()